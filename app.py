@@ -1,25 +1,78 @@
 from __future__ import annotations
 
+import asyncio
+import os
+import tempfile
+import threading
 from datetime import date, datetime, timedelta
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
 
-from flask import Flask, jsonify, render_template, request, send_file
+from flask import Flask, Response, jsonify, render_template, request, send_file
 
+from earnings.cache import get_persistent_cache
 from earnings.companies import (
-    get_companies_without_ticker,
+    get_registry,
     get_sector_companies,
     get_sectors,
-    get_ticker_to_name,
 )
-from earnings.scraper import EarningsScrapeError, fetch_weekly_earnings
-from earnings.spreadsheet import generate_csv_bytes
-from earnings.week_selector import get_week_options
+from earnings.ir_store import get_ir_store
+from earnings.metrics import metrics
+from earnings.payloads import COLUMNAR_LAYOUT, columnar_payload, compress, encode_json, negotiate_encoding
+from earnings.response_cache import ResponseCache
+from earnings.fetch_engine import run_sync
+from earnings.ranges import merge_week_payloads, split_into_weeks
+from earnings.records import IR_SOURCE, records_to_dicts
+from earnings.refresh_scheduler import RefreshScheduler
+from earnings.scraper import EarningsScrapeError, fetch_weekly_earnings_async
+from earnings.spreadsheet import iter_csv_chunks, write_xlsx
+from earnings.trading_calendar import trading_days
+from earnings.week_selector import build_week_option, get_week_calendar, get_week_start
 
 app = Flask(__name__)
 app.config["JSON_SORT_KEYS"] = False
 
+
+def _env_number(name: str, default, parse=int):
+    """Return ``parse(os.environ[name])``, or ``default`` (with a warning) when unset or invalid."""
+
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return parse(raw)
+    except ValueError:
+        app.logger.warning("Ignoring invalid %s=%r", name, raw)
+        return default
+
+
 _CACHE_TTL = timedelta(minutes=5)
-_cache: Dict[Tuple[str, str], Dict[str, object]] = {}
+_CACHE_MAX_BYTES = _env_number("EARNINGS_RESPONSE_CACHE_BYTES", 64 * 1024 * 1024)
+_cache = ResponseCache(max_bytes=_CACHE_MAX_BYTES)
+# Digest of the company data the cached payloads were computed from.
+_cache_companies_digest: Optional[str] = None
+_cache_companies_lock = threading.Lock()
+# Bodies smaller than this are cheaper to send as-is than to compress.
+_COMPRESS_MIN_BYTES = 1024
+
+
+def _refresh_interval_seconds() -> float:
+    """Read ``EARNINGS_REFRESH_INTERVAL_SECONDS``, capped at the cache TTL it exists to beat."""
+
+    interval = _env_number("EARNINGS_REFRESH_INTERVAL_SECONDS", 0.0, float)
+    limit = _CACHE_TTL.total_seconds()
+    if interval > limit:
+        app.logger.warning(
+            "EARNINGS_REFRESH_INTERVAL_SECONDS=%g exceeds the %gs cache TTL; refreshing every %gs instead",
+            interval,
+            limit,
+            limit,
+        )
+        return limit
+    return interval
+
+
+# Background refresh of the current and next week; unset or 0 keeps it off.
+_REFRESH_INTERVAL_SECONDS = _refresh_interval_seconds()
 
 
 class ValidationError(ValueError):
@@ -27,9 +80,9 @@ class ValidationError(ValueError):
 
 
 def _find_week_by_id(week_id: str) -> dict:
-    for option in get_week_options(weeks_ahead=52):  # Ensure we search enough history/future
-        if option["id"] == week_id:
-            return option
+    option = get_week_calendar(weeks_ahead=52).get(week_id)  # Ensure we search enough history/future
+    if option is not None:
+        return option
     # Fallback: if we can't find it in options (maybe very old?), try to construct it if it looks like a date
     try:
         start = date.fromisoformat(week_id)
@@ -65,7 +118,7 @@ def _validate_payload(payload: dict) -> tuple[str, dict]:
 
     if not sector:
         raise ValidationError("Sector is required.")
-    if sector not in get_sectors() and sector != "All":
+    if sector != "All" and not get_registry().has_sector(sector):
         raise ValidationError("Unsupported sector selection.")
     if not start_week_id:
         raise ValidationError("Week is required.")
@@ -101,42 +154,28 @@ def _validate_payload(payload: dict) -> tuple[str, dict]:
     return sector, week
 
 
-def _should_cache_week(week: dict) -> bool:
-    """Only cache for current and upcoming week to keep data fresh.
-       Do not cache multi-week ranges or deep history."""
-    
-    if "..." in week["id"]:
-        return False
+def _cache_ttl(week: dict) -> Optional[timedelta]:
+    """Return how long a computed week (or range) may be cached; ``None`` means indefinitely.
+
+    Weeks that are already over can no longer change, so they stay cached until
+    evicted, but only once every trading day was fetched after it ended: a day
+    skipped during an upstream outage must be retried. Anything else is kept
+    only briefly.
+    """
 
     try:
         start = date.fromisoformat(week["start_date"])
+        end = date.fromisoformat(week["end_date"])
     except (TypeError, ValueError, KeyError):
-        return False
-    today = date.today()
-    current_week_start = today - timedelta(days=today.weekday())
-    next_week_start = current_week_start + timedelta(days=7)
-    return start in (current_week_start, next_week_start)
-
-
-def _get_cached(sector: str, week_id: str):
-    cache_key = (sector, week_id)
-    entry = _cache.get(cache_key)
-    if not entry:
-        return None
-    expires_at = entry.get("expires_at")
-    if isinstance(expires_at, datetime) and expires_at > datetime.utcnow():
-        return entry["data"]
-    _cache.pop(cache_key, None)
+        return _CACHE_TTL
+    if end >= date.today():
+        return _CACHE_TTL
+    store = get_persistent_cache()
+    if store is None or not all(store.is_settled("nasdaq", day) for day in trading_days(start, end)):
+        return _CACHE_TTL
     return None
 
 
-def _set_cache(sector: str, week_id: str, data):
-    _cache[(sector, week_id)] = {
-        "data": data,
-        "expires_at": datetime.utcnow() + _CACHE_TTL,
-    }
-
-
 @app.get("/api/preview/<week_id>/<slug>.json")
 def api_static_preview(week_id, slug):
     try:
@@ -145,19 +184,22 @@ def api_static_preview(week_id, slug):
             sector = "All"
         else:
             # Find sector by slug
-            target_sector = None
-            for s in get_sectors():
-                if slugify_sector(s) == slug:
-                    target_sector = s
-                    break
+            target_sector = get_registry().sector_for_slug(slug)
             if not target_sector:
                 return jsonify({"error": "Sector not found"}), 404
             sector = target_sector
             
         # Mock the week object
-        # We need to find the full week object from get_week_options
-        # Note: get_week_options iterates from 2026-01-01 automatically now
-        week = next((w for w in get_week_options(weeks_ahead=52) if w["id"] == week_id), None)
+        # We need to find the full week object from the week calendar
+        # Note: the calendar covers every week from 2026-01-01 and is rebuilt daily
+        if "..." in week_id:
+            # Ranges ("<start>...<end>") are composed server-side from cached weeks.
+            start_week_id, _, end_week_id = week_id.partition("...")
+            _, week = _validate_payload(
+                {"sector": sector, "startWeekId": start_week_id, "endWeekId": end_week_id}
+            )
+        else:
+            week = get_week_calendar(weeks_ahead=52).get(week_id)
         if not week:
              # Fallback if not found in recent options, try to construct it or error
              # For now, let's try to reconstruct it if possible or just use what we have
@@ -168,7 +210,7 @@ def api_static_preview(week_id, slug):
         return jsonify({"error": str(exc)}), 400
         
     # Inject sectorSlug for client-side badge logic
-    return jsonify(
+    return _payload_response(
         {
             "records": data["records"],
             "count": len(data["records"]),
@@ -183,108 +225,194 @@ def api_static_preview(week_id, slug):
         }
     )
 
-def slugify_sector(value: str) -> str:
-    from urllib.parse import quote
-    return quote(value.lower().replace(" ", "-"), safe="")
+
+def _payload_response(payload: dict):
+    """Return ``payload`` as minified JSON in the same formats the static build writes.
+
+    ``?layout=columnar`` selects the columnar record layout and the body is
+    compressed when the client accepts gzip or brotli.
+    """
+
+    if request.args.get("layout") == COLUMNAR_LAYOUT:
+        payload = columnar_payload(payload)
+    body = encode_json(payload)
+    encoding = negotiate_encoding(
+        request.headers.get("Accept-Encoding", ""),
+        min_size=_COMPRESS_MIN_BYTES,
+        size=len(body),
+    )
+    compressed = compress(body, encoding, fast=True) if encoding else None
+    response = app.response_class(compressed or body, mimetype="application/json")
+    if compressed is not None:
+        response.headers["Content-Encoding"] = encoding
+    response.vary.add("Accept-Encoding")
+    return response
+
+def _drop_cache_on_company_change() -> None:
+    """Clear cached payloads once the company registry has hot-reloaded different data.
+
+    Past weeks are cached indefinitely, so without this an edit to the data
+    files would only show up for them after a restart.
+    """
+
+    global _cache_companies_digest
+    digest = get_registry().digest
+    with _cache_companies_lock:
+        if _cache_companies_digest is not None and _cache_companies_digest != digest:
+            app.logger.info("Company data changed; clearing cached payloads")
+            _cache.clear()
+        _cache_companies_digest = digest
+
 
 def _fetch_data(sector: str, week: dict):
-    cacheable = _should_cache_week(week)
-    cached = _get_cached(sector, week["id"]) if cacheable else None
-    if cached is not None:
-        return cached
+    """Return the payload for ``week``, composing ranges from cached single weeks.
 
+    A range is split into canonical weeks; cached weeks are reused and the rest
+    are fetched concurrently, so overlapping range queries share their work.
+    """
+
+    if "..." in week["id"]:
+        weeks = split_into_weeks(
+            date.fromisoformat(week["start_date"]),
+            date.fromisoformat(week["end_date"]),
+        )
+    else:
+        weeks = [week]
+
+    _drop_cache_on_company_change()
+    payloads: Dict[str, dict] = {}
+    missing = []
+    for item in weeks:
+        key = (sector, item["id"])
+        cached = _cache.get(key)
+        if cached is None and _scheduler is not None:
+            # Stale-while-revalidate: serve the last good payload and refresh it in the background.
+            cached = _cache.get_stale(key)
+            if cached is not None:
+                _scheduler.trigger(key)
+        if cached is not None:
+            payloads[item["id"]] = cached
+        else:
+            missing.append(item)
+
+    if missing:
+        async def _compute_missing():
+            return await asyncio.gather(*(_compute_week(sector, item) for item in missing))
+
+        for item, data in zip(missing, run_sync(_compute_missing())):
+            _cache.set((sector, item["id"]), data, ttl=_cache_ttl(item))
+            payloads[item["id"]] = data
+
+    if len(weeks) == 1:
+        return payloads[weeks[0]["id"]]
+    return merge_week_payloads(payloads[item["id"]] for item in weeks)
+
+
+async def _compute_week(sector: str, week: dict):
+    registry = get_registry()
     if sector == "All":
-        from earnings.companies import get_sectors
-        companies = []
-        ticker_to_name = {}
-        # Map ticker -> sector for later injection
-        ticker_to_sector = {}
-        company_name_to_sector = {} # fallback
-        
-        for s in get_sectors():
-             sector_companies = get_sector_companies(s)
-             companies.extend(sector_companies)
-             t_to_n = get_ticker_to_name(s)
-             ticker_to_name.update(t_to_n)
-             for t in t_to_n:
-                 ticker_to_sector[t] = s
-             for c in sector_companies:
-                 if c.get('company'):
-                     company_name_to_sector[c['company']] = s
-                 
+        ticker_to_name = registry.all_ticker_to_name
+        companies = registry.all_companies
     else:
-        ticker_to_name = get_ticker_to_name(sector)
-        companies = get_sector_companies(sector)
+        ticker_to_name = registry.ticker_to_name(sector)
+        companies = registry.companies(sector)
 
     start_date = date.fromisoformat(week["start_date"])
     end_date = date.fromisoformat(week["end_date"])
 
     try:
-        results = fetch_weekly_earnings(
+        results = await fetch_weekly_earnings_async(
             start=start_date,
             end=end_date,
             ticker_to_name=ticker_to_name,
             companies=companies,
+            ir_events=await get_ir_store().get_events_async(),
         )
         # Inject sector for "All" view
         if sector == "All":
             for record in results:
                 # Try to find sector by ticker first, then company name
-                rec_ticker = record.get('symbol')
-                rec_company = record.get('company')
-                found_sector = None
-                if rec_ticker in ticker_to_sector:
-                     found_sector = ticker_to_sector[rec_ticker]
-                elif rec_company in company_name_to_sector:
-                     found_sector = company_name_to_sector[rec_company]
-                
-                if found_sector:
-                    record['sector'] = found_sector
-                else:
-                    record['sector'] = 'Unknown' # Should not happen often
+                found_sector = registry.sector_for(ticker=record.symbol, company=record.company)
+                record.sector = found_sector or 'Unknown' # Should not happen often
     except EarningsScrapeError as exc:
         raise ValidationError(str(exc))
     except EarningsScrapeError as exc:
         raise ValidationError(str(exc))
 
-    ir_companies = sorted({item["company"] for item in results if item.get("source") == "investor_relations"})
-    fallback_companies = sorted({item["company"] for item in results if item.get("source") != "investor_relations"})
+    ir_companies = sorted({item.company for item in results if item.source == IR_SOURCE})
+    fallback_companies = sorted({item.company for item in results if item.source != IR_SOURCE})
     
-    missing_public = []
     if sector == "All":
-         from earnings.companies import get_sectors
-         for s in get_sectors():
-             missing_public.extend(get_companies_without_ticker(s))
-         missing_public.sort()
+        missing_public = list(registry.all_companies_without_ticker)
     else:
-         missing_public = get_companies_without_ticker(sector)
+        missing_public = list(registry.companies_without_ticker(sector))
 
     metadata = {
-        "records": results,
+        "records": records_to_dicts(results),
         "missing_public": missing_public,
         "ticker_count": len(ticker_to_name),
         "generated_at": datetime.utcnow().replace(microsecond=0).isoformat() + "Z",
         "ir_companies": ir_companies,
         "fallback_companies": fallback_companies,
     }
-    if cacheable:
-        _set_cache(sector, week["id"], metadata)
     return metadata
 
 
+def _refresh_targets() -> List[Tuple[str, str]]:
+    """Return the (sector, week id) pairs whose cached payloads expire: this week and next."""
+
+    current = get_week_start()
+    week_ids = [current.isoformat(), (current + timedelta(days=7)).isoformat()]
+    return [(sector, week_id) for week_id in week_ids for sector in ["All", *get_sectors()]]
+
+
+def _refresh_cached_weeks(keys: List[Tuple[str, str]]) -> None:
+    """Recompute ``keys`` concurrently and replace their cache entries; failures keep the old ones."""
+
+    weeks = {week_id: build_week_option(date.fromisoformat(week_id)) for _, week_id in keys}
+
+    async def _compute_all():
+        return await asyncio.gather(
+            *(_compute_week(sector, weeks[week_id]) for sector, week_id in keys),
+            return_exceptions=True,
+        )
+
+    for (sector, week_id), data in zip(keys, run_sync(_compute_all())):
+        if isinstance(data, Exception):
+            app.logger.warning("Background refresh of %s/%s failed: %s", sector, week_id, data)
+            continue
+        _cache.set((sector, week_id), data, ttl=_cache_ttl(weeks[week_id]))
+
+
+_scheduler: Optional[RefreshScheduler] = None
+if _REFRESH_INTERVAL_SECONDS > 0:
+    _scheduler = RefreshScheduler(
+        interval=timedelta(seconds=_REFRESH_INTERVAL_SECONDS),
+        targets=_refresh_targets,
+        refresh=_refresh_cached_weeks,
+    )
+
+
+@app.before_request
+def _ensure_scheduler_started():
+    # Started lazily so forking servers run it in the worker, not the parent.
+    if _scheduler is not None and not _scheduler.running:
+        _scheduler.start()
+
+
 @app.get("/")
 def index():
     return render_template(
         "index.html",
         sectors=get_sectors(),
-        week_options=get_week_options(),
+        week_options=get_week_calendar().options,
         companies_by_sector=get_sector_companies,
     )
 
 
 @app.get("/api/weeks")
 def api_weeks():
-    return jsonify(get_week_options())
+    return jsonify(get_week_calendar().options)
 
 
 @app.get("/api/sectors")
@@ -300,6 +428,21 @@ def api_sectors():
     return jsonify(sectors)
 
 
+@app.get("/metrics")
+def metrics_endpoint():
+    """Scraper and cache metrics in Prometheus text format (``?format=json`` for JSON)."""
+
+    cache_stats = _cache.stats()
+    if request.args.get("format") == "json":
+        return jsonify({**metrics.snapshot(), "responseCache": cache_stats})
+    lines = [metrics.render_prometheus().rstrip("\n")]
+    for stat, value in cache_stats.items():
+        name = "earnings_response_cache_" + "".join(f"_{c.lower()}" if c.isupper() else c for c in stat)
+        lines.append(f"# TYPE {name} gauge")
+        lines.append(f"{name} {value}")
+    return Response("\n".join(line for line in lines if line) + "\n", mimetype="text/plain; version=0.0.4")
+
+
 @app.post("/api/preview")
 def api_preview():
     try:
@@ -322,22 +465,33 @@ def api_preview():
     )
 
 
+_XLSX_MIMETYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+# Workbooks up to this size are assembled in memory; larger ones spill to a temp file.
+_XLSX_SPOOL_BYTES = 8 * 1024 * 1024
+
+
 @app.post("/download")
 def download():
+    payload = request.get_json(silent=True) or {}
+    export_format = str(payload.get("format") or "csv").lower()
     try:
-        sector, week = _validate_payload(request.get_json(silent=True) or {})
+        if export_format not in {"csv", "xlsx"}:
+            raise ValidationError("Unsupported export format.")
+        sector, week = _validate_payload(payload)
         data = _fetch_data(sector, week)
     except ValidationError as exc:
         return jsonify({"error": str(exc)}), 400
 
-    csv_stream = generate_csv_bytes(data["records"])
-    filename = f"earnings_{sector.lower()}_{week['start_date']}.csv"
-    return send_file(
-        csv_stream,
-        mimetype="text/csv",
-        as_attachment=True,
-        download_name=filename,
-    )
+    filename = f"earnings_{sector.lower()}_{week['start_date']}.{export_format}"
+    if export_format == "xlsx":
+        workbook = tempfile.SpooledTemporaryFile(max_size=_XLSX_SPOOL_BYTES)
+        write_xlsx(data["records"], workbook)
+        workbook.seek(0)
+        return send_file(workbook, mimetype=_XLSX_MIMETYPE, as_attachment=True, download_name=filename)
+
+    response = Response(iter_csv_chunks(data["records"]), mimetype="text/csv")
+    response.headers.set("Content-Disposition", "attachment", filename=filename)
+    return response
 
 
 if __name__ == "__main__":
@@ -0,0 +1,145 @@
+"""Micro-benchmark for ``earnings.ir_scraper._extract_candidates`` on large IR pages.
+
+Run with ``python benchmarks/bench_extract_candidates.py``. The previous
+three-pattern implementation is kept here as a reference so the benchmark can
+check that the single-pass scanner returns identical candidates.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import sys
+import time
+from datetime import date
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from earnings.ir_scraper import _KEYWORDS, _MONTH_LOOKUP, _TIME_PATTERN, _extract_candidates  # noqa: E402
+
+_LEGACY_PATTERNS = [
+    re.compile(
+        r"\b("
+        r"January|February|March|April|May|June|July|August|September|October|November|December|"
+        r"Jan\.?|Feb\.?|Mar\.?|Apr\.?|Jun\.?|Jul\.?|Aug\.?|Sept\.?|Sep\.?|Oct\.?|Nov\.?|Dec\.?"
+        r")\s+\d{1,2}(?:st|nd|rd|th)?(?:,)?\s+\d{4}\b",
+        re.IGNORECASE,
+    ),
+    re.compile(r"\b\d{1,2}/\d{1,2}/\d{4}\b"),
+    re.compile(r"\b\d{4}-\d{2}-\d{2}\b"),
+]
+
+
+def _legacy_parse(token: str) -> Optional[date]:
+    token = token.strip()
+    dash_match = re.fullmatch(r"(\d{4})-(\d{2})-(\d{2})", token)
+    if dash_match:
+        year, month, day = map(int, dash_match.groups())
+        try:
+            return date(year, month, day)
+        except ValueError:
+            return None
+    slash_match = re.fullmatch(r"(\d{1,2})/(\d{1,2})/(\d{4})", token)
+    if slash_match:
+        month, day, year = map(int, slash_match.groups())
+        try:
+            return date(year, month, day)
+        except ValueError:
+            return None
+    month_match = re.fullmatch(r"([A-Za-z\.]+)\s+(\d{1,2})(?:st|nd|rd|th)?(?:,)?\s+(\d{4})", token)
+    if month_match:
+        month_token, day_token, year_token = month_match.groups()
+        month = _MONTH_LOOKUP.get(month_token.replace(".", "").upper())
+        if not month:
+            return None
+        try:
+            return date(int(year_token), month, int(day_token))
+        except ValueError:
+            return None
+    return None
+
+
+def legacy_extract_candidates(text: str) -> List[Tuple[date, str, str]]:
+    candidates: List[Tuple[date, str, str]] = []
+    for pattern in _LEGACY_PATTERNS:
+        for match in pattern.finditer(text):
+            parsed = _legacy_parse(match.group(0))
+            if not parsed:
+                continue
+            start = max(0, match.start() - 120)
+            end = min(len(text), match.end() + 120)
+            context = text[start:end]
+            lowered = context.lower()
+            if not any(keyword in lowered for keyword in _KEYWORDS):
+                continue
+            time_match = _TIME_PATTERN.search(context)
+            candidates.append((parsed, time_match.group(0) if time_match else "", context.strip()))
+    return candidates
+
+
+_FILLER = (
+    "Press release Investor presentation Stock information Governance ESG report "
+    "Dividend history Analyst coverage Email alerts Contact us Annual meeting"
+).split()
+
+
+def build_page(size: int, seed: int = 7) -> str:
+    """Return roughly ``size`` characters of IR-like page text with scattered dates."""
+
+    rng = random.Random(seed)
+    dates = [
+        "January 28, 2026", "Feb. 3, 2026", "Sept 30th, 2026", "April 1ST, 2026",
+        "02/03/2026", "11/5/2026", "2026-04-28", "2026-13-45", "May 7 2026",
+    ]
+    words: List[str] = []
+    length = 0
+    while length < size:
+        roll = rng.random()
+        if roll < 0.02:
+            token = rng.choice(dates)
+        elif roll < 0.03:
+            token = rng.choice(_KEYWORDS).title()
+        elif roll < 0.035:
+            token = "8:30 a.m. ET"
+        else:
+            token = rng.choice(_FILLER)
+        words.append(token)
+        length += len(token) + 1
+    return " ".join(words)
+
+
+def _time(fn, text: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000, 4_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    for size in args.sizes:
+        text = build_page(size)
+        if _extract_candidates(text) != legacy_extract_candidates(text):
+            print(f"{size:>10,} chars: OUTPUT MISMATCH against the legacy scanner")
+            return 1
+        legacy = _time(legacy_extract_candidates, text, args.repeat)
+        current = _time(_extract_candidates, text, args.repeat)
+        print(
+            f"{size:>10,} chars: legacy {legacy * 1000:8.1f} ms  "
+            f"single-pass {current * 1000:8.1f} ms  "
+            f"({legacy / current:4.1f}x, {size / current / 1e6:5.1f} MB/s)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
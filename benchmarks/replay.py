@@ -0,0 +1,261 @@
+"""Offline replay of the upstream sites the scrapers talk to.
+
+:class:`ReplayAdapter` is a ``requests`` transport adapter that answers every
+request from the fixtures in ``benchmarks/fixtures`` instead of the network:
+
+* ``api.nasdaq.com`` gets the recorded calendar payload with one row per
+  listing for the requested date,
+* ``finance.yahoo.com`` gets the recorded calendar page with the same
+  listings in its table (paginated, with a date column, for range queries),
+* any other host is treated as an investor-relations site and gets one of the
+  recorded IR page layouts, padded to a realistic size.
+
+Listings and event dates are derived from a seed and the reference date, so a
+given day always replays the same bytes.
+"""
+
+from __future__ import annotations
+
+import copy
+import io
+import json
+import random
+import string
+import threading
+import time
+import zlib
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+_NASDAQ_HOST = "api.nasdaq.com"
+_YAHOO_HOST = "finance.yahoo.com"
+_NASDAQ_TIMES = ("time-pre-market", "time-after-hours", "time-not-supplied")
+_YAHOO_TIMES = {"time-pre-market": "Before Market Open", "time-after-hours": "After Market Close"}
+_YAHOO_ROW = (
+    '<tr class="simpTblRow"><td><a href="/quote/{symbol}" class="Fw(600) C($linkColor)">{symbol}</a></td>'
+    "<td>{name}</td><td>{name} Q4 2025 Earnings Announcement</td>{date}<td><span>{time}</span></td>"
+    "<td>{eps}</td><td>-</td><td>-</td></tr>\n"
+)
+_YAHOO_TIME_HEADER = '<th class="Ta(start)"><span>Earnings Call Time</span></th>'
+_YAHOO_DATE_HEADER = '<th class="Ta(start)"><span>Earnings Date</span></th>'
+_IR_PAD_ITEM = (
+    '<div class="module_item"><div class="module_date-time"><span class="module_date-text">{date}</span></div>'
+    '<div class="module_headline"><a class="module_headline-link" href="/news/{slug}">{company} {headline}</a>'
+    "</div></div>\n"
+)
+_IR_HEADLINES = (
+    "Declares Quarterly Cash Dividend",
+    "Announces Pricing of Senior Notes Offering",
+    "Completes Acquisition and Updates Outlook",
+    "Publishes Annual Sustainability Report",
+    "Appoints New Member to Board of Directors",
+    "Presents at Industry Investor Conference",
+)
+
+
+def _long(day: date) -> str:
+    return f"{day:%B} {day.day}, {day.year}"
+
+
+def _slash(day: date) -> str:
+    return f"{day.month}/{day.day}/{day.year}"
+
+
+def _stable_seed(*parts: object) -> int:
+    return zlib.crc32(":".join(map(str, parts)).encode("utf-8"))
+
+
+class ReplayAdapter(BaseAdapter):
+    """Serve Nasdaq, Yahoo and investor-relations fixtures for any request.
+
+    ``universe`` is the list of ``(ticker, name)`` pairs that may appear in a
+    day's listings (normally the configured companies), mixed with filler
+    tickers up to ``rows_per_day``. ``latency`` adds a fixed delay per request
+    to emulate network round trips.
+    """
+
+    def __init__(
+        self,
+        universe: Sequence[Tuple[str, str]],
+        *,
+        reference: Optional[date] = None,
+        rows_per_day: int = 250,
+        universe_share: float = 0.25,
+        ir_page_bytes: int = 180_000,
+        latency: float = 0.0,
+        seed: int = 11,
+    ) -> None:
+        super().__init__()
+        self.universe = list(universe)
+        self.reference = reference or date.today()
+        self.rows_per_day = rows_per_day
+        self.universe_share = universe_share
+        self.ir_page_bytes = ir_page_bytes
+        self.latency = latency
+        self.seed = seed
+        self._nasdaq_template = json.loads((FIXTURES_DIR / "nasdaq_day.json").read_text(encoding="utf-8"))
+        self._yahoo_template = (FIXTURES_DIR / "yahoo_day.html").read_text(encoding="utf-8")
+        self._ir_templates = [path.read_text(encoding="utf-8") for path in sorted((FIXTURES_DIR / "ir").glob("*.html"))]
+        self._listings: Dict[date, List[dict]] = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.bytes_served = 0
+
+    # -- fixtures -----------------------------------------------------------------
+
+    def listings(self, day: date) -> List[dict]:
+        """Return the rows the recorded Nasdaq payload carries for ``day``."""
+
+        with self._lock:
+            cached = self._listings.get(day)
+            if cached is not None:
+                return cached
+        rows: List[dict] = []
+        if day.weekday() < 5:
+            rng = random.Random(_stable_seed(self.seed, day))
+            template = self._nasdaq_template["data"]["rows"][0]
+            from_universe = min(len(self.universe), int(self.rows_per_day * self.universe_share))
+            picks = rng.sample(self.universe, from_universe)
+            while len(picks) < self.rows_per_day:
+                symbol = "".join(rng.choices(string.ascii_uppercase, k=rng.randint(3, 5)))
+                picks.append((symbol, f"{symbol.title()} Holdings Inc."))
+            for symbol, name in picks:
+                row = copy.copy(template)
+                row.update(
+                    symbol=symbol,
+                    name=name,
+                    time=rng.choice(_NASDAQ_TIMES),
+                    epsForecast=f"${rng.uniform(-0.5, 4):.2f}",
+                    noOfEsts=str(rng.randint(1, 24)),
+                )
+                rows.append(row)
+        with self._lock:
+            return self._listings.setdefault(day, rows)
+
+    def nasdaq_body(self, day: date) -> bytes:
+        payload = copy.deepcopy(self._nasdaq_template)
+        payload["data"]["asOf"] = f"{day:%a, %b} {day.day}, {day.year}"
+        payload["data"]["rows"] = self.listings(day)
+        return json.dumps(payload).encode("utf-8")
+
+    def yahoo_body(self, day: date) -> bytes:
+        rows = "".join(self._yahoo_row(row) for row in self.listings(day))
+        return self._yahoo_template.replace("<!-- ROWS -->", rows).encode("utf-8")
+
+    def yahoo_range_body(self, start: date, end: date, offset: int, size: int) -> bytes:
+        """The range view: listings for every day with a date column, one page at a time."""
+
+        listed = []
+        day = start
+        while day <= end:
+            listed.extend((day, row) for row in self.listings(day))
+            day += timedelta(days=1)
+        rows = "".join(
+            self._yahoo_row(row, f"<td><span>{day:%b} {day.day}, {day.year}, 4 PMEDT</span></td>")
+            for day, row in listed[offset : offset + size]
+        )
+        page = self._yahoo_template.replace(_YAHOO_TIME_HEADER, _YAHOO_DATE_HEADER + _YAHOO_TIME_HEADER)
+        return page.replace("<!-- ROWS -->", rows).encode("utf-8")
+
+    @staticmethod
+    def _yahoo_row(row: dict, date_cell: str = "") -> str:
+        return _YAHOO_ROW.format(
+            symbol=row["symbol"],
+            name=row["name"],
+            date=date_cell,
+            time=_YAHOO_TIMES.get(row["time"], "TAS"),
+            eps=row["epsForecast"].lstrip("$"),
+        )
+
+    def ir_body(self, host: str) -> bytes:
+        seed = _stable_seed(self.seed, host)
+        template = self._ir_templates[seed % len(self._ir_templates)]
+        company = host.removeprefix("www.").removeprefix("investors.").removeprefix("ir.").split(".")[0].title()
+        event = self.reference + timedelta(days=seed % 60 + 1)
+        past = self.reference - timedelta(days=seed % 80 + 10)
+        replacements = {
+            "{{COMPANY}}": company,
+            "{{EVENT_DATE_LONG}}": _long(event),
+            "{{EVENT_DATE_SLASH}}": _slash(event),
+            "{{EVENT_DATE_ISO}}": event.isoformat(),
+            "{{LATER_DATE_LONG}}": _long(event + timedelta(days=90)),
+            "{{PAST_DATE_LONG}}": _long(past),
+            "{{PAST_DATE_SLASH}}": _slash(past),
+            "{{PAST_DATE_ISO}}": past.isoformat(),
+            "{{OLDER_DATE_SLASH}}": _slash(past - timedelta(days=91)),
+        }
+        page = template
+        for placeholder, value in replacements.items():
+            page = page.replace(placeholder, value)
+
+        rng = random.Random(seed)
+        padding: List[str] = []
+        size = len(page)
+        day = past
+        while size < self.ir_page_bytes:
+            day -= timedelta(days=rng.randint(3, 20))
+            item = _IR_PAD_ITEM.format(
+                date=_long(day),
+                slug=f"{day.isoformat()}-{rng.randint(1000, 9999)}",
+                company=company,
+                headline=rng.choice(_IR_HEADLINES),
+            )
+            padding.append(item)
+            size += len(item)
+        return page.replace("<!-- PAD -->", "".join(padding)).encode("utf-8")
+
+    # -- transport ----------------------------------------------------------------
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        parts = urlsplit(request.url)
+        host = (parts.hostname or "").lower()
+        query = parse_qs(parts.query)
+        if host == _NASDAQ_HOST:
+            body, content_type = self.nasdaq_body(date.fromisoformat(query["date"][0])), "application/json"
+        elif host == _YAHOO_HOST and "from" in query:
+            body = self.yahoo_range_body(
+                date.fromisoformat(query["from"][0]),
+                date.fromisoformat(query["to"][0]),
+                int(query.get("offset", ["0"])[0]),
+                int(query.get("size", ["100"])[0]),
+            )
+            content_type = "text/html; charset=utf-8"
+        elif host == _YAHOO_HOST:
+            body, content_type = self.yahoo_body(date.fromisoformat(query["day"][0])), "text/html; charset=utf-8"
+        else:
+            body, content_type = self.ir_body(host), "text/html; charset=utf-8"
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.requests += 1
+            self.bytes_served += len(body)
+
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict({"Content-Type": content_type, "Content-Length": str(len(body))})
+        response.encoding = "utf-8"
+        response.raw = io.BytesIO(body)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def mount(session: requests.Session, adapter: ReplayAdapter) -> requests.Session:
+    """Route every http(s) request made through ``session`` to ``adapter``."""
+
+    for prefix in {"https://", "http://", *session.adapters}:
+        session.mount(prefix, adapter)
+    return session
@@ -0,0 +1,290 @@
+"""Offline benchmark suite for the scrapers, the parsers, CSV export and the static build.
+
+Run with ``python benchmarks/suite.py``. Every HTTP request is answered by
+:class:`benchmarks.replay.ReplayAdapter` from the fixtures in
+``benchmarks/fixtures`` and sockets are disabled for the run, so results do not
+depend on the network. Each benchmark reports the best of ``--repeat`` timed
+runs as a throughput plus the peak traced memory of one extra run, and is
+compared against ``benchmarks/baseline.json``; ``--check`` exits non-zero on a
+regression beyond the tolerances, ``--update-baseline`` records new numbers.
+
+The replayed listings, IR event dates and selected weeks all follow from a
+reference date, which the baseline records; runs use it (or ``--reference``)
+instead of today so results stay comparable from one day to the next.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import socket
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+# Keep the persistent cache out of the measurements; must be set before importing earnings.
+os.environ["EARNINGS_CACHE_PATH"] = "off"
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent))
+sys.path.insert(0, str(BENCH_DIR))
+
+import build_static  # noqa: E402
+from earnings import ir_scraper, scraper  # noqa: E402
+from earnings.companies import get_registry  # noqa: E402
+from earnings.fetch_engine import get_engine  # noqa: E402
+from earnings.ir_scraper import _extract_candidates, _html_text, fetch_investor_relations_events  # noqa: E402
+from earnings.ir_store import InvestorRelationsStore  # noqa: E402
+from earnings.spreadsheet import generate_csv_bytes  # noqa: E402
+from earnings.trading_calendar import trading_days  # noqa: E402
+from earnings.week_selector import get_week_options  # noqa: E402
+from replay import ReplayAdapter, mount  # noqa: E402
+
+BASELINE_PATH = BENCH_DIR / "baseline.json"
+# Used when neither --reference nor the baseline names one.
+DEFAULT_REFERENCE = date(2026, 2, 2)
+TIME_TOLERANCE = 0.30
+MEMORY_TOLERANCE = 0.20
+
+
+@dataclass
+class Result:
+    name: str
+    unit: str
+    work: float
+    seconds: float
+    peak_kib: float
+
+    @property
+    def throughput(self) -> float:
+        return self.work / self.seconds if self.seconds else float("inf")
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "unit": self.unit,
+            "throughput": round(self.throughput, 2),
+            "seconds": round(self.seconds, 6),
+            "peakKiB": round(self.peak_kib, 1),
+        }
+
+
+@contextmanager
+def no_network() -> Iterator[None]:
+    """Fail loudly if anything tries to open a real connection."""
+
+    def _refuse(self, address):
+        raise RuntimeError(f"benchmark attempted a network connection to {address!r}")
+
+    original = socket.socket.connect
+    socket.socket.connect = _refuse
+    try:
+        yield
+    finally:
+        socket.socket.connect = original
+
+
+@contextmanager
+def patched(target: object, **attributes: object) -> Iterator[None]:
+    originals = {name: getattr(target, name) for name in attributes}
+    for name, value in attributes.items():
+        setattr(target, name, value)
+    try:
+        yield
+    finally:
+        for name, value in originals.items():
+            setattr(target, name, value)
+
+
+def measure(name: str, unit: str, work: float, fn: Callable[[], object], *, repeat: int, setup=None) -> Result:
+    """Time ``fn`` ``repeat`` times (keeping the best) and trace one more run for peak memory."""
+
+    best = float("inf")
+    for _ in range(repeat):
+        if setup:
+            setup()
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    if setup:
+        setup()
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return Result(name=name, unit=unit, work=work, seconds=best, peak_kib=peak / 1024)
+
+
+def _clear_scraper_caches() -> None:
+    scraper._nasdaq_cache.clear()
+    scraper._yahoo_cache.clear()
+
+
+def run_suite(*, repeat: int, weeks: int, ir_pages: int, today: date) -> List[Result]:
+    registry = get_registry()
+    companies = list(registry.all_companies)
+    ticker_to_name = dict(registry.all_ticker_to_name)
+    adapter = ReplayAdapter(sorted(ticker_to_name.items()), reference=today)
+    session = mount(get_engine().session, adapter)
+    results: List[Result] = []
+
+    ir_companies = [entry for entry in companies if entry.get("investorRelationsUrl")][:ir_pages]
+    results.append(
+        measure(
+            "ir_fetch",
+            "pages/s",
+            len(ir_companies),
+            lambda: fetch_investor_relations_events(session, companies=ir_companies, today=today),
+            repeat=repeat,
+        )
+    )
+    ir_events = fetch_investor_relations_events(session, companies=ir_companies, today=today)
+
+    pages = []
+    for entry in ir_companies:
+        pages.append(_html_text(session.get(entry["investorRelationsUrl"]).text))
+    text_bytes = sum(len(page.encode("utf-8")) for page in pages)
+    results.append(
+        measure(
+            "ir_extract_candidates",
+            "MB/s",
+            text_bytes / 1e6,
+            lambda: [_extract_candidates(page) for page in pages],
+            repeat=repeat,
+        )
+    )
+
+    start = today - timedelta(days=today.weekday())
+    end = start + timedelta(days=13)
+    fetch = lambda: scraper.fetch_weekly_earnings(  # noqa: E731
+        start=start, end=end, ticker_to_name=ticker_to_name, ir_events=ir_events, session=session
+    )
+    results.append(
+        measure(
+            "weekly_fetch",
+            "trading days/s",
+            len(trading_days(start, end)),
+            fetch,
+            repeat=repeat,
+            setup=_clear_scraper_caches,
+        )
+    )
+
+    records = fetch()
+    export = (records * (20_000 // max(len(records), 1) + 1))[:20_000]
+    results.append(measure("csv_export", "records/s", len(export), lambda: generate_csv_bytes(export), repeat=repeat))
+
+    selected = [week for week in get_week_options(reference=today) if week["start_date"] >= start.isoformat()][:weeks]
+    store = InvestorRelationsStore(cache=None, scraper=lambda entries: ir_events)
+    with tempfile.TemporaryDirectory() as scratch:
+        scratch_path = Path(scratch)
+        with patched(
+            build_static,
+            DOCS_DIR=scratch_path / "docs",
+            MANIFEST_PATH=scratch_path / "manifest.json",
+            REPORT_PATH=scratch_path / "report.json",
+            get_week_options=lambda: selected,
+            get_ir_store=lambda: store,
+        ):
+            results.append(
+                measure(
+                    "static_build",
+                    "weeks/s",
+                    len(selected),
+                    build_static.build_static_site,
+                    repeat=repeat,
+                    setup=_clear_scraper_caches,
+                )
+            )
+    return results
+
+
+def compare(results: List[Result], baseline: Dict[str, dict]) -> List[str]:
+    """Return a message for every result that regressed beyond the tolerances."""
+
+    regressions = []
+    for result in results:
+        previous = baseline.get(result.name)
+        if not isinstance(previous, dict):
+            continue
+        floor = previous["throughput"] * (1 - TIME_TOLERANCE)
+        if result.throughput < floor:
+            regressions.append(
+                f"{result.name}: {result.throughput:,.2f} {result.unit} "
+                f"is below {floor:,.2f} (baseline {previous['throughput']:,.2f})"
+            )
+        ceiling = previous["peakKiB"] * (1 + MEMORY_TOLERANCE)
+        if result.peak_kib > ceiling:
+            regressions.append(
+                f"{result.name}: peak {result.peak_kib:,.0f} KiB is above {ceiling:,.0f} KiB "
+                f"(baseline {previous['peakKiB']:,.0f} KiB)"
+            )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--weeks", type=int, default=6, help="number of weeks the static build covers")
+    parser.add_argument("--ir-pages", type=int, default=60, help="number of investor-relations sites to replay")
+    parser.add_argument(
+        "--ir-extraction",
+        choices=["stream", "soup", "process"],
+        default=None,
+        help="override EARNINGS_IR_EXTRACTION for the IR benchmarks",
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument(
+        "--reference",
+        type=date.fromisoformat,
+        default=None,
+        help=f"reference date the workload is derived from (default: the baseline's, else {DEFAULT_REFERENCE})",
+    )
+    parser.add_argument("--check", action="store_true", help="exit with status 1 when a benchmark regressed")
+    parser.add_argument("--update-baseline", action="store_true", help="overwrite the baseline with this run")
+    args = parser.parse_args(argv)
+    logging.getLogger().setLevel(logging.WARNING)
+    if args.ir_extraction:
+        ir_scraper._EXTRACTION_MODE = args.ir_extraction
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline.exists() else {}
+    baseline_reference = date.fromisoformat(baseline["reference"]) if "reference" in baseline else None
+    reference = args.reference or baseline_reference or DEFAULT_REFERENCE
+    if baseline and reference != baseline_reference:
+        print(f"Baseline was recorded for {baseline_reference or 'an unknown date'}, not {reference}; not comparing")
+        baseline = {}
+
+    with no_network():
+        results = run_suite(repeat=args.repeat, weeks=args.weeks, ir_pages=args.ir_pages, today=reference)
+
+    for result in results:
+        previous = baseline.get(result.name)
+        delta = f"{result.throughput / previous['throughput'] - 1:+7.1%}" if previous else "    new"
+        print(
+            f"{result.name:<24} {result.throughput:>12,.2f} {result.unit:<14} {delta}  "
+            f"{result.seconds * 1000:9.1f} ms  peak {result.peak_kib:>9,.0f} KiB"
+        )
+
+    if args.update_baseline:
+        payload = {"reference": reference.isoformat(), **{result.name: result.as_dict() for result in results}}
+        args.baseline.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline)
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    return 1 if regressions and args.check else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,22 +1,39 @@
 from __future__ import annotations
 
+import argparse
+import asyncio
+import hashlib
 import json
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
 from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, Iterator, List
 from urllib.parse import quote
 
-import requests
-
+from earnings.cache import get_persistent_cache
 from earnings.companies import (
     get_sector_companies,
     get_sectors,
 )
-from earnings.ir_scraper import InvestorRelationsEvent, fetch_investor_relations_events
-from earnings.scraper import EarningsScrapeError, fetch_weekly_earnings
-from earnings.spreadsheet import generate_csv_bytes
+from earnings.ir_scraper import InvestorRelationsEvent
+from earnings.ir_store import get_ir_store
+from earnings.metrics import metrics
+from earnings.payloads import (
+    COLUMNAR_LAYOUT,
+    ENCODINGS,
+    columnar_payload,
+    compress,
+    encode_json,
+    from_columnar,
+)
+from earnings.records import IR_SOURCE, EarningsRecord, records_to_dicts
+from earnings.scraper import EarningsScrapeError, fetch_sector_earnings_async
+from earnings.spreadsheet import iter_csv_chunks, read_xlsx_identifier, write_xlsx
+from earnings.trading_calendar import trading_days
 from earnings.week_selector import get_week_options
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
@@ -26,6 +43,21 @@ PROJECT_ROOT = Path(__file__).resolve().parent
 DOCS_DIR = PROJECT_ROOT / "docs"
 STATIC_SRC = PROJECT_ROOT / "static"
 TEMPLATES_SRC = PROJECT_ROOT / "templates"
+DATA_DIR = PROJECT_ROOT / "data"
+MANIFEST_PATH = PROJECT_ROOT / ".cache" / "build-manifest.json"
+REPORT_PATH = PROJECT_ROOT / ".cache" / "build-report.json"
+
+
+@dataclass(frozen=True)
+class OutputOptions:
+    """How JSON payloads are written to ``docs/api``."""
+
+    pretty: bool = False
+    columnar: bool = False
+    precompress: bool = True
+
+
+OUTPUT = OutputOptions()
 
 
 def ensure_directory(path: Path) -> None:
@@ -34,15 +66,210 @@ def ensure_directory(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
-def copy_static_assets() -> None:
-    """Mirror static assets into docs folder."""
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """Write ``data`` to ``path`` unless the file already holds exactly those bytes."""
+
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        ensure_directory(path.parent)
+    path.write_bytes(data)
+    return True
+
+
+def write_stream_if_changed(path: Path, chunks: Iterable[bytes]) -> str:
+    """Stream ``chunks`` to ``path`` unless it already holds them; return their SHA-256.
+
+    The chunks go to a temporary file beside ``path`` that replaces it only
+    when the content differs, so the output is never held in memory and
+    readers never see a partial file.
+    """
+
+    ensure_directory(path.parent)
+    digest = hashlib.sha256()
+    temporary = path.with_name(f".{path.name}.tmp")
+    try:
+        with temporary.open("wb") as handle:
+            for chunk in chunks:
+                digest.update(chunk)
+                handle.write(chunk)
+        sha = digest.hexdigest()
+        try:
+            unchanged = _sha256_file(path) == sha
+        except FileNotFoundError:
+            unchanged = False
+        if unchanged:
+            temporary.unlink()
+        else:
+            os.replace(temporary, path)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+    return sha
+
+
+def write_compressed_siblings(path: Path, data: bytes, *, refresh: bool = True) -> None:
+    """Keep ``path.gz``/``path.br`` in step with ``data`` (or remove them when disabled).
+
+    With ``refresh=False`` siblings that already exist are trusted as is, which
+    saves recompressing files whose contents did not change.
+    """
+
+    for encoding, suffix in ENCODINGS.items():
+        sibling = path.with_name(path.name + suffix)
+        if not refresh and OUTPUT.precompress and sibling.exists():
+            continue
+        compressed = compress(data, encoding) if OUTPUT.precompress else None
+        if compressed is None:
+            sibling.unlink(missing_ok=True)
+        else:
+            write_if_changed(sibling, compressed)
+
+
+def write_json(path: Path, payload: object, *, columnar: bool = False) -> bytes:
+    """Write ``payload`` in the configured output format and return the bytes written.
+
+    ``columnar`` marks payloads with a ``records`` list that may be written in
+    the columnar layout.
+    """
+
+    if columnar and OUTPUT.columnar and isinstance(payload, dict):
+        payload = columnar_payload(payload)
+    data = encode_json(payload, pretty=OUTPUT.pretty)
+    changed = write_if_changed(path, data)
+    write_compressed_siblings(path, data, refresh=changed)
+    return data
+
+
+def read_json_payload(path: Path) -> object:
+    """Load a payload written by :func:`write_json`, expanding columnar records."""
+
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    if isinstance(payload, dict) and payload.get("layout") == COLUMNAR_LAYOUT:
+        payload = {key: value for key, value in payload.items() if key != "layout"}
+        payload["records"] = from_columnar(payload["records"])
+    return payload
+
 
-    import shutil
+def copy_static_assets() -> None:
+    """Mirror static assets into docs folder, touching only files that differ."""
 
     dst = DOCS_DIR / "static"
+    expected = set()
+    for src_path in STATIC_SRC.rglob("*"):
+        if src_path.is_file():
+            relative = src_path.relative_to(STATIC_SRC)
+            expected.add(relative)
+            write_if_changed(dst / relative, src_path.read_bytes())
     if dst.exists():
-        shutil.rmtree(dst)
-    shutil.copytree(STATIC_SRC, dst)
+        for dst_path in dst.rglob("*"):
+            if dst_path.is_file() and dst_path.relative_to(dst) not in expected:
+                dst_path.unlink()
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class BuildManifest:
+    """Content hashes of the inputs and outputs of each built week.
+
+    A week that was already over when it was built, and whose inputs and
+    output files are unchanged since, is skipped entirely by incremental
+    builds. Outputs also remember a hash of their content without the build
+    timestamp, so an unchanged payload is not rewritten just to bump
+    ``generatedAt``.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path, inputs_digest: str, previous: Dict[str, object] | None = None) -> None:
+        self.path = path
+        self.inputs_digest = inputs_digest
+        previous = previous or {}
+        usable = previous.get("version") == self.VERSION and previous.get("inputs") == inputs_digest
+        self._previous_weeks: Dict[str, dict] = dict(previous.get("weeks", {})) if usable else {}
+        self.weeks: Dict[str, dict] = {}
+
+    @classmethod
+    def load(cls, path: Path, inputs_digest: str) -> "BuildManifest":
+        try:
+            previous = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            previous = None
+        return cls(path, inputs_digest, previous if isinstance(previous, dict) else None)
+
+    def is_unchanged(self, week: dict) -> bool:
+        """Return whether ``week`` is settled and every recorded output is still on disk as built."""
+
+        entry = self._previous_weeks.get(week["id"])
+        if not entry or not entry.get("settled") or entry.get("week") != week:
+            return False
+        for relative, output in entry.get("outputs", {}).items():
+            try:
+                if _sha256_file(DOCS_DIR / relative) != output["sha256"]:
+                    return False
+            except (FileNotFoundError, KeyError):
+                return False
+        return True
+
+    def keep(self, week: dict) -> None:
+        self.weeks[week["id"]] = self._previous_weeks[week["id"]]
+
+    def previous_output(self, week: dict, relative: str) -> dict:
+        return self._previous_weeks.get(week["id"], {}).get("outputs", {}).get(relative, {})
+
+    def record(self, week: dict, relative: str, data: bytes, content: str) -> None:
+        self.record_digest(week, relative, _sha256(data), content)
+
+    def record_digest(self, week: dict, relative: str, digest: str, content: str) -> None:
+        entry = self.weeks.setdefault(week["id"], {"week": week, "settled": False, "outputs": {}})
+        entry["outputs"][relative] = {"sha256": digest, "content": content}
+
+    def mark_settled(self, week: dict, settled: bool) -> None:
+        if week["id"] in self.weeks:
+            self.weeks[week["id"]]["settled"] = settled
+
+    def save(self) -> None:
+        payload = {"version": self.VERSION, "inputs": self.inputs_digest, "weeks": self.weeks}
+        write_if_changed(self.path, json.dumps(payload, indent=2, sort_keys=True).encode("utf-8"))
+
+
+def companies_digest() -> str:
+    """Hash every company data file and the output options so edits invalidate previously built weeks."""
+
+    digest = hashlib.sha256()
+    digest.update(json.dumps(asdict(OUTPUT), sort_keys=True).encode("utf-8"))
+    for file_path in sorted(DATA_DIR.glob("companies*.json")):
+        digest.update(file_path.name.encode("utf-8"))
+        digest.update(file_path.read_bytes())
+    return digest.hexdigest()
+
+
+def week_is_settled(week: dict) -> bool:
+    """Return whether every trading day of ``week`` was fetched after it was over.
+
+    Weekends and exchange holidays are never fetched, so they never settle and
+    are not required to.
+    """
+
+    store = get_persistent_cache()
+    if store is None:
+        return False
+    start_date = date.fromisoformat(week["start_date"])
+    end_date = date.fromisoformat(week["end_date"])
+    if end_date >= date.today():
+        return False
+    return all(store.is_settled("nasdaq", day) for day in trading_days(start_date, end_date))
 
 
 def render_index(options: Dict[str, object]) -> None:
@@ -57,14 +284,15 @@ def render_index(options: Dict[str, object]) -> None:
             sectors=options["sectors"],
             week_options=options["weeks"],
             companies_by_sector=get_sector_companies,
+            static_mode=True,
         )
-    (DOCS_DIR / "index.html").write_text(html, encoding="utf-8")
+    write_if_changed(DOCS_DIR / "index.html", html.encode("utf-8"))
 
 
 def serialise_weeks(weeks: Iterable[dict]) -> None:
     ensure_directory(DOCS_DIR / "api")
     weeks_path = DOCS_DIR / "api" / "weeks.json"
-    weeks_path.write_text(json.dumps(list(weeks), indent=2), encoding="utf-8")
+    write_json(weeks_path, list(weeks))
 
 
 def encode_segment(value: str) -> str:
@@ -90,13 +318,17 @@ def serialise_sectors(sectors: Iterable[str]) -> Dict[str, str]:
             }
         )
     sectors_path = DOCS_DIR / "api" / "sectors.json"
-    sectors_path.write_text(json.dumps(sectors_payload, indent=2), encoding="utf-8")
+    write_json(sectors_path, sectors_payload)
     return slug_map
 
 
-def serialise_preview(sector: str, sector_slug: str, week: dict, data: Dict[str, object]) -> None:
-    base_dir = DOCS_DIR / "api" / "preview" / week["id"]
-    ensure_directory(base_dir)
+def serialise_preview(
+    sector: str,
+    sector_slug: str,
+    week: dict,
+    data: Dict[str, object],
+    manifest: BuildManifest | None = None,
+) -> None:
     csv_filename = f"earnings_{sector_slug}_{week['start_date']}.csv"
     payload = {
         "records": data["records"],
@@ -110,160 +342,354 @@ def serialise_preview(sector: str, sector_slug: str, week: dict, data: Dict[str,
         "sector": sector,
         "sectorSlug": sector_slug,
         "downloadPath": f"downloads/{week['id']}/{csv_filename}",
+        "xlsxDownloadPath": f"downloads/{week['id']}/{Path(csv_filename).stem}.xlsx",
     }
-    path = base_dir / f"{sector_slug}.json"
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    relative = f"api/preview/{week['id']}/{sector_slug}.json"
+    content = _sha256(
+        json.dumps({**payload, "generatedAt": None, "output": asdict(OUTPUT)}, sort_keys=True).encode("utf-8")
+    )
+    if manifest is not None:
+        previous = manifest.previous_output(week, relative)
+        if previous.get("content") == content:
+            try:
+                existing = (DOCS_DIR / relative).read_bytes()
+            except FileNotFoundError:
+                existing = None
+            if existing is not None and _sha256(existing) == previous.get("sha256"):
+                # Same records as last build: keep the file (and its timestamp) as is.
+                write_compressed_siblings(DOCS_DIR / relative, existing, refresh=False)
+                manifest.record(week, relative, existing, content)
+                return
+    encoded = write_json(DOCS_DIR / relative, payload, columnar=True)
+    if manifest is not None:
+        manifest.record(week, relative, encoded, content)
+
+
+def serialise_csv(
+    sector_slug: str,
+    week: dict,
+    data: Dict[str, object],
+    manifest: BuildManifest | None = None,
+) -> None:
+    relative = f"downloads/{week['id']}/earnings_{sector_slug}_{week['start_date']}.csv"
+    digest = write_stream_if_changed(DOCS_DIR / relative, iter_csv_chunks(data["records"]))
+    if manifest is not None:
+        manifest.record_digest(week, relative, digest, digest)
 
 
-def serialise_csv(sector_slug: str, week: dict, data: Dict[str, object]) -> None:
-    ensure_directory(DOCS_DIR / "downloads" / week["id"])
-    stream = generate_csv_bytes(data["records"])
-    csv_path = DOCS_DIR / "downloads" / week["id"] / f"earnings_{sector_slug}_{week['start_date']}.csv"
-    csv_path.write_bytes(stream.getbuffer())
+def serialise_xlsx(
+    sector_slug: str,
+    week: dict,
+    data: Dict[str, object],
+    manifest: BuildManifest | None = None,
+) -> None:
+    relative = f"downloads/{week['id']}/earnings_{sector_slug}_{week['start_date']}.xlsx"
+    path = DOCS_DIR / relative
+    # Workbooks embed save timestamps, so unchanged records are detected by hashing the records;
+    # the hash is stamped into the workbook so builds without a manifest can skip it too.
+    content = _sha256(json.dumps(data["records"], sort_keys=True, default=str).encode("utf-8"))
+    if manifest is not None:
+        previous = manifest.previous_output(week, relative)
+        if previous.get("content") == content:
+            try:
+                digest = _sha256_file(path)
+            except FileNotFoundError:
+                digest = None
+            if digest == previous.get("sha256"):
+                manifest.record_digest(week, relative, digest, content)
+                return
+    if read_xlsx_identifier(str(path)) == content:
+        if manifest is not None:
+            manifest.record_digest(week, relative, _sha256_file(path), content)
+        return
+    ensure_directory(path.parent)
+    temporary = path.with_name(f".{path.name}.tmp")
+    try:
+        write_xlsx(data["records"], str(temporary), identifier=content)
+        os.replace(temporary, path)
+    finally:
+        temporary.unlink(missing_ok=True)
+    if manifest is not None:
+        manifest.record_digest(week, relative, _sha256_file(path), content)
+
+
+def serialise_bundles(weeks: List[dict], sector_slugs: Dict[str, str]) -> None:
+    """Write one cumulative records file per sector plus a prebuilt search index.
+
+    Bundles are assembled from the per-week preview files on disk, so weeks an
+    incremental build skipped are included too. The frontend loads a bundle
+    once and slices any week range out of it instead of merging weekly files.
+    """
+
+    targets = {**{slug: sector for sector, slug in sector_slugs.items()}, "all": "All sectors"}
+    bundles: Dict[str, dict] = {}
+    search_index: List[dict] = []
+    for week in weeks:
+        for slug, sector in targets.items():
+            preview_path = DOCS_DIR / "api" / "preview" / week["id"] / f"{slug}.json"
+            try:
+                payload = read_json_payload(preview_path)
+            except (FileNotFoundError, ValueError):
+                continue
+            bundle = bundles.setdefault(
+                slug,
+                {
+                    "sector": sector,
+                    "sectorSlug": slug,
+                    "weeks": [],
+                    "records": [],
+                    "missingPublic": payload.get("missingPublic", []),
+                    "tickerCount": payload.get("tickerCount", 0),
+                    "generatedAt": payload.get("generatedAt"),
+                },
+            )
+            bundle["weeks"].append(week["id"])
+            bundle["records"].extend(payload.get("records", []))
+            generated_at = payload.get("generatedAt")
+            if generated_at and (bundle["generatedAt"] is None or generated_at > bundle["generatedAt"]):
+                bundle["generatedAt"] = generated_at
+            if slug == "all":
+                search_index.extend(
+                    {
+                        "company": record.get("company") or "",
+                        "symbol": record.get("symbol") or "",
+                        "date": record.get("date") or "",
+                        "sector": record.get("sector") or "",
+                        "source": record.get("source") or "",
+                        "session": record.get("bmo_amc") or record.get("nasdaq_time_label") or "",
+                        "weekId": week["id"],
+                        "weekLabel": week.get("label", ""),
+                    }
+                    for record in payload.get("records", [])
+                )
 
+    for slug, bundle in bundles.items():
+        bundle["count"] = len(bundle["records"])
+        write_json(DOCS_DIR / "api" / "bundles" / f"{slug}.json", bundle, columnar=True)
+    write_json(
+        DOCS_DIR / "api" / "search-index.json",
+        {"count": len(search_index), "records": search_index},
+        columnar=True,
+    )
 
-def fetch_sector_week(
-    sector: str,
-    week: dict,
-    *,
+
+def summarise_records(
+    records: List[EarningsRecord],
     companies: List[Dict[str, str]],
-    ir_events: Dict[str, InvestorRelationsEvent] | None = None,
+    generated_at: str,
 ) -> Dict[str, object]:
-    ticker_to_name = {
-        entry["ticker"]: entry["name"]
-        for entry in companies
-        if entry.get("ticker")
+    ir_companies = sorted({item.company for item in records if item.source == IR_SOURCE})
+    fallback_companies = sorted({item.company for item in records if item.source != IR_SOURCE})
+    return {
+        "records": records_to_dicts(records),
+        "missing_public": [entry["name"] for entry in companies if not entry.get("ticker")],
+        "ticker_count": len({entry["ticker"] for entry in companies if entry.get("ticker")}),
+        "generated_at": generated_at,
+        "ir_companies": ir_companies,
+        "fallback_companies": fallback_companies,
     }
+
+
+async def fetch_week(
+    week: dict,
+    *,
+    sector_companies: Dict[str, List[Dict[str, str]]],
+    ir_events: Dict[str, InvestorRelationsEvent] | None = None,
+) -> Dict[str, Dict[str, object]]:
+    """Fetch one week for the whole universe and fan the records out per sector.
+
+    The returned mapping holds one payload per sector plus an ``"All"`` payload
+    whose records carry their sector name.
+    """
+
     start_date = date.fromisoformat(week["start_date"])
     end_date = date.fromisoformat(week["end_date"])
-    results = fetch_weekly_earnings(
+    partitions = await fetch_sector_earnings_async(
         start=start_date,
         end=end_date,
-        ticker_to_name=ticker_to_name,
-        companies=companies,
+        sector_companies=sector_companies,
         ir_events=ir_events,
     )
-    ir_companies = sorted({item["company"] for item in results if item.get("source") == "investor_relations"})
-    fallback_companies = sorted(
-        {item["company"] for item in results if item.get("source") != "investor_relations"}
-    )
-    missing_public = [entry["name"] for entry in companies if not entry.get("ticker")]
-    return {
-        "records": results,
-        "missing_public": missing_public,
-        "ticker_count": len(ticker_to_name),
-        "generated_at": datetime.utcnow().replace(microsecond=0).isoformat() + "Z",
-        "ir_companies": ir_companies,
-        "fallback_companies": fallback_companies,
-    }
+    generated_at = datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+    payloads: Dict[str, Dict[str, object]] = {}
+    aggregate_records: List[EarningsRecord] = []
+    for sector, records in partitions.items():
+        payloads[sector] = summarise_records(records, sector_companies[sector], generated_at)
+        aggregate_records.extend(record.with_sector(sector) for record in records)
+    aggregate_records.sort(key=lambda item: (item.date, item.company))
 
+    all_companies = [entry for entries in sector_companies.values() for entry in entries]
+    payloads["All"] = summarise_records(aggregate_records, all_companies, generated_at)
+    payloads["All"]["missing_public"] = sorted(set(payloads["All"]["missing_public"]))
+    return payloads
 
-def build_static_site() -> None:
+
+async def build_weeks(
+    weeks: List[dict],
+    *,
+    sector_slugs: Dict[str, str],
+    sector_companies: Dict[str, List[Dict[str, str]]],
+    ir_events: Dict[str, InvestorRelationsEvent],
+    manifest: BuildManifest | None = None,
+) -> None:
+    """Fetch every week concurrently on the shared fetch engine and serialise each as it lands.
+
+    With a ``manifest``, settled weeks whose outputs are unchanged are skipped.
+    """
+
+    skipped = 0
+
+    async def _build(week: dict) -> None:
+        nonlocal skipped
+        if manifest is not None and manifest.is_unchanged(week):
+            manifest.keep(week)
+            metrics.inc("build_weeks_total", result="skipped")
+            skipped += 1
+            return
+        try:
+            with metrics.timer("build_fetch_seconds"):
+                payloads = await fetch_week(week, sector_companies=sector_companies, ir_events=ir_events)
+        except EarningsScrapeError as exc:
+            metrics.inc("build_weeks_total", result="failed")
+            logger.error("Failed to fetch %s: %s", week["id"], exc)
+            return
+        except Exception as exc:  # pragma: no cover - defensive
+            metrics.inc("build_weeks_total", result="failed")
+            logger.error("Unexpected error for %s: %s", week["id"], exc)
+            return
+
+        logger.info("Processing week %s", week["id"])
+        with metrics.timer("build_serialise_seconds"):
+            for sector, sector_slug in sector_slugs.items():
+                data = payloads[sector]
+                serialise_preview(sector, sector_slug, week, data, manifest)
+                serialise_csv(sector_slug, week, data, manifest)
+                serialise_xlsx(sector_slug, week, data, manifest)
+            serialise_preview("All sectors", "all", week, payloads["All"], manifest)
+            serialise_csv("all", week, payloads["All"], manifest)
+            serialise_xlsx("all", week, payloads["All"], manifest)
+        metrics.inc("build_weeks_total", result="built")
+        if manifest is not None:
+            manifest.mark_settled(week, week_is_settled(week))
+
+    await asyncio.gather(*(_build(week) for week in weeks))
+    if manifest is not None:
+        logger.info("Skipped %d settled, unchanged week(s).", skipped)
+
+
+class BuildTimer:
+    """Wall-clock durations of the build phases, written out as a JSON report."""
+
+    def __init__(self) -> None:
+        self.started_at = datetime.now(timezone.utc)
+        self._started = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = round(time.perf_counter() - started, 3)
+
+    def report(self) -> Dict[str, object]:
+        return {
+            "startedAt": self.started_at.replace(microsecond=0).isoformat(),
+            "totalSeconds": round(time.perf_counter() - self._started, 3),
+            "phases": self.phases,
+            "metrics": metrics.snapshot(),
+        }
+
+
+def write_build_report(timer: BuildTimer, path: Path | None = None) -> None:
+    path = path or REPORT_PATH
+    report = timer.report()
+    ensure_directory(path.parent)
+    path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    logger.info("Build finished in %.1fs; timing report written to %s", report["totalSeconds"], path)
+
+
+def build_static_site(*, incremental: bool = False, report_path: Path | None = None) -> None:
+    timer = BuildTimer()
     ensure_directory(DOCS_DIR)
+    manifest = BuildManifest.load(MANIFEST_PATH, companies_digest()) if incremental else None
 
     weeks = get_week_options()
     sectors = get_sectors()
 
     logger.info("Rendering template and copying static assets...")
-    copy_static_assets()
-    render_index({"weeks": weeks, "sectors": sectors})
+    with timer.phase("assets"):
+        copy_static_assets()
+        render_index({"weeks": weeks, "sectors": sectors})
 
     logger.info("Serialising API payloads...")
-    serialise_weeks(weeks)
-    sector_slugs = serialise_sectors(sectors)
+    with timer.phase("metadata"):
+        serialise_weeks(weeks)
+        sector_slugs = serialise_sectors(sectors)
 
     sector_companies: Dict[str, List[Dict[str, str]]] = {
         sector: get_sector_companies(sector) for sector in sectors
     }
-    ir_cache: Dict[str, Dict[str, InvestorRelationsEvent]] = {}
-
-    for sector in sectors:
-        if sector in ir_cache:
-            continue
-        companies = sector_companies[sector]
+    with timer.phase("investor_relations"):
         try:
-            with requests.Session() as session:
-                ir_cache[sector] = fetch_investor_relations_events(
-                    session,
-                    companies=companies,
-                )
+            ir_events = get_ir_store().get_events(block=True)
         except Exception as exc:  # pragma: no cover - defensive
-            logger.warning("Failed to prefetch IR data for %s: %s", sector, exc)
-            ir_cache[sector] = {}
-
-    max_workers = min(len(sectors), 6) or 1
+            logger.warning("Failed to prefetch IR data: %s", exc)
+            ir_events = {}
+
+    with timer.phase("weeks"):
+        asyncio.run(
+            build_weeks(
+                weeks,
+                sector_slugs=sector_slugs,
+                sector_companies=sector_companies,
+                ir_events=ir_events,
+                manifest=manifest,
+            )
+        )
 
-    for week in weeks:
-        logger.info("Processing week %s", week["id"])
-        futures = {}
-        aggregate_records = []
-        aggregate_missing: set[str] = set()
-        aggregate_ir: set[str] = set()
-        aggregate_fallback: set[str] = set()
-        aggregate_ticker_count = 0
-        aggregate_latest: datetime | None = None
-
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            for sector in sectors:
-                sector_slug = sector_slugs[sector]
-                companies = sector_companies[sector]
-                ir_events = ir_cache.get(sector)
-                futures[executor.submit(
-                    fetch_sector_week,
-                    sector,
-                    week,
-                    companies=companies,
-                    ir_events=ir_events,
-                )] = (sector, sector_slug)
-
-            for future in as_completed(futures):
-                sector, sector_slug = futures[future]
-                try:
-                    data = future.result()
-                except EarningsScrapeError as exc:
-                    logger.error("Failed to fetch %s / %s: %s", week["id"], sector, exc)
-                    continue
-                except Exception as exc:  # pragma: no cover - defensive
-                    logger.error("Unexpected error for %s / %s: %s", week["id"], sector, exc)
-                    continue
-                serialise_preview(sector, sector_slug, week, data)
-                serialise_csv(sector_slug, week, data)
-                aggregate_records.extend(
-                    {**record, "sector": sector} for record in data["records"]
-                )
-                aggregate_missing.update(data.get("missing_public", []))
-                aggregate_ir.update(data.get("ir_companies", []))
-                aggregate_fallback.update(data.get("fallback_companies", []))
-                aggregate_ticker_count += data.get("ticker_count", 0)
-                generated_at = data.get("generated_at")
-                if generated_at:
-                    try:
-                        parsed = datetime.fromisoformat(generated_at.replace("Z", "+00:00"))
-                    except ValueError:  # pragma: no cover - defensive
-                        parsed = None
-                    if parsed and (aggregate_latest is None or parsed > aggregate_latest):
-                        aggregate_latest = parsed
-
-        timestamp = (aggregate_latest or datetime.utcnow()).replace(microsecond=0)
-        if timestamp.tzinfo is not None:
-            timestamp = timestamp.astimezone(timezone.utc)
-            generated_at = timestamp.isoformat().replace("+00:00", "Z")
-        else:
-            generated_at = f"{timestamp.isoformat()}Z"
-
-        aggregate_payload = {
-            "records": aggregate_records,
-            "missing_public": sorted(aggregate_missing),
-            "ticker_count": aggregate_ticker_count,
-            "generated_at": generated_at,
-            "ir_companies": sorted(aggregate_ir),
-            "fallback_companies": sorted(aggregate_fallback),
-        }
-        serialise_preview("All sectors", "all", week, aggregate_payload)
-        serialise_csv("all", week, aggregate_payload)
+    logger.info("Writing range bundles and search index...")
+    with timer.phase("bundles"):
+        serialise_bundles(weeks, sector_slugs)
 
+    if manifest is not None:
+        manifest.save()
     logger.info("Static site build complete.")
+    write_build_report(timer, report_path)
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Build the static GitHub Pages site into docs/.")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="skip settled weeks whose inputs and outputs are unchanged since the last build",
+    )
+    parser.add_argument("--pretty", action="store_true", help="indent JSON payloads instead of minifying them")
+    parser.add_argument(
+        "--columnar",
+        action="store_true",
+        help="write record lists as field names plus value arrays instead of one object per record",
+    )
+    parser.add_argument(
+        "--no-precompress",
+        dest="precompress",
+        action="store_false",
+        help="skip writing .gz/.br siblings next to each JSON payload",
+    )
+    parser.add_argument(
+        "--report",
+        type=Path,
+        default=None,
+        help=f"where to write the JSON timing report (default: {REPORT_PATH.relative_to(PROJECT_ROOT)})",
+    )
+    args = parser.parse_args(argv)
+    global OUTPUT
+    OUTPUT = OutputOptions(pretty=args.pretty, columnar=args.columnar, precompress=args.precompress)
+    build_static_site(incremental=args.incremental, report_path=args.report)
 
 
 if __name__ == "__main__":
-    build_static_site()
+    main()
@@ -0,0 +1,242 @@
+"""Persistent on-disk cache shared by the scrapers, the Flask app and the static build."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_PATH = Path(__file__).resolve().parent.parent / ".cache" / "earnings.sqlite3"
+_DEFAULT_FUTURE_TTL = timedelta(minutes=30)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS day_payloads (
+    source TEXT NOT NULL,
+    day TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (source, day)
+);
+CREATE TABLE IF NOT EXISTS page_validators (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS snapshots (
+    name TEXT PRIMARY KEY,
+    fetched_at REAL NOT NULL,
+    payload TEXT NOT NULL
+);
+"""
+
+
+class PersistentCache:
+    """SQLite-backed store for upstream day payloads, page validators and named snapshots.
+
+    A day fetched after it was over is final and kept forever. Anything fetched
+    on or before the day itself (today and upcoming days) is only trusted for
+    ``future_ttl``. Empty payloads are never made permanent since an empty day
+    is as likely to be a failed scrape as a quiet one.
+    """
+
+    def __init__(self, path: Path | str, *, future_ttl: timedelta = _DEFAULT_FUTURE_TTL) -> None:
+        self.path = Path(path)
+        self.future_ttl = future_ttl
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=10, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _is_fresh(self, day: date, fetched_at: float, payload: object, now: float) -> bool:
+        fetched_day = datetime.fromtimestamp(fetched_at).date()
+        if day < fetched_day and payload:
+            return True
+        return now - fetched_at < self.future_ttl.total_seconds()
+
+    def get_day(self, source: str, day: date):
+        """Return the cached payload for ``source`` on ``day`` or ``None`` when missing/stale."""
+
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT fetched_at, payload FROM day_payloads WHERE source = ? AND day = ?",
+                    (source, day.isoformat()),
+                ).fetchone()
+        except sqlite3.Error as exc:
+            logger.warning("Persistent cache read failed for %s/%s: %s", source, day, exc)
+            return None
+        if row is None:
+            return None
+        fetched_at, raw = row
+        try:
+            payload = json.loads(raw)
+        except ValueError:
+            return None
+        if not self._is_fresh(day, fetched_at, payload, time.time()):
+            return None
+        return payload
+
+    def is_settled(self, source: str, day: date) -> bool:
+        """Return whether ``day`` was stored for ``source`` after the day was over."""
+
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT fetched_at FROM day_payloads WHERE source = ? AND day = ?",
+                    (source, day.isoformat()),
+                ).fetchone()
+        except sqlite3.Error as exc:
+            logger.warning("Persistent cache read failed for %s/%s: %s", source, day, exc)
+            return False
+        return row is not None and datetime.fromtimestamp(row[0]).date() > day
+
+    def set_day(self, source: str, day: date, payload) -> None:
+        """Store ``payload`` for ``source`` on ``day``, replacing any previous entry."""
+
+        try:
+            encoded = json.dumps(payload, separators=(",", ":"))
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO day_payloads (source, day, fetched_at, payload) VALUES (?, ?, ?, ?)",
+                    (source, day.isoformat(), time.time(), encoded),
+                )
+                conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as exc:
+            logger.warning("Persistent cache write failed for %s/%s: %s", source, day, exc)
+
+    def get_snapshot(self, name: str) -> Optional[Tuple[object, float]]:
+        """Return ``(payload, fetched_at)`` for a named snapshot, or ``None`` when missing."""
+
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT fetched_at, payload FROM snapshots WHERE name = ?",
+                    (name,),
+                ).fetchone()
+        except sqlite3.Error as exc:
+            logger.warning("Persistent cache read failed for snapshot %s: %s", name, exc)
+            return None
+        if row is None:
+            return None
+        fetched_at, raw = row
+        try:
+            return json.loads(raw), fetched_at
+        except ValueError:
+            return None
+
+    def set_snapshot(self, name: str, payload, fetched_at: Optional[float] = None) -> None:
+        """Store a named snapshot; freshness is left to the caller."""
+
+        try:
+            encoded = json.dumps(payload, separators=(",", ":"))
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO snapshots (name, fetched_at, payload) VALUES (?, ?, ?)",
+                    (name, fetched_at if fetched_at is not None else time.time(), encoded),
+                )
+                conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as exc:
+            logger.warning("Persistent cache write failed for snapshot %s: %s", name, exc)
+
+    def get_page(self, url: str) -> Optional[Dict[str, object]]:
+        """Return the stored validators and extracted payload for ``url``.
+
+        The result has ``etag``, ``last_modified`` and ``payload`` keys, or is
+        ``None`` when the page has never been stored.
+        """
+
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT etag, last_modified, payload FROM page_validators WHERE url = ?",
+                    (url,),
+                ).fetchone()
+        except sqlite3.Error as exc:
+            logger.warning("Persistent cache read failed for %s: %s", url, exc)
+            return None
+        if row is None:
+            return None
+        etag, last_modified, raw = row
+        try:
+            payload = json.loads(raw)
+        except ValueError:
+            return None
+        return {"etag": etag, "last_modified": last_modified, "payload": payload}
+
+    def set_page(
+        self,
+        url: str,
+        *,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        payload,
+    ) -> None:
+        """Store HTTP validators for ``url`` with whatever was extracted from the page."""
+
+        try:
+            encoded = json.dumps(payload, separators=(",", ":"))
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO page_validators (url, etag, last_modified, fetched_at, payload) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (url, etag, last_modified, time.time(), encoded),
+                )
+                conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as exc:
+            logger.warning("Persistent cache write failed for %s: %s", url, exc)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_cache_lock = threading.Lock()
+_cache: Optional[PersistentCache] = None
+
+
+def get_persistent_cache() -> Optional[PersistentCache]:
+    """Return the process-wide cache, or ``None`` when disabled.
+
+    ``EARNINGS_CACHE_PATH`` overrides the database location (set it to ``off``
+    to disable the cache) and ``EARNINGS_CACHE_TTL_SECONDS`` controls how long
+    entries for today and upcoming days stay fresh.
+    """
+
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            location = os.environ.get("EARNINGS_CACHE_PATH", "").strip()
+            if location.lower() in {"off", "none", "0"}:
+                return None
+            ttl = _DEFAULT_FUTURE_TTL
+            raw_ttl = os.environ.get("EARNINGS_CACHE_TTL_SECONDS", "").strip()
+            if raw_ttl:
+                try:
+                    ttl = timedelta(seconds=float(raw_ttl))
+                except ValueError:
+                    logger.warning("Ignoring invalid EARNINGS_CACHE_TTL_SECONDS=%r", raw_ttl)
+            _cache = PersistentCache(location or _DEFAULT_PATH, future_ttl=ttl)
+        return _cache
@@ -2,20 +2,48 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
-from functools import lru_cache
+import logging
+import re
+import threading
+import time
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+from .urls import host_of
+
+logger = logging.getLogger(__name__)
 
 _DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 _DATA_PATH = _DATA_DIR / "companies.json"
+# How often (in seconds) the data files are stat'ed for changes.
+_RELOAD_CHECK_INTERVAL = 1.0
+
+_NAME_NOISE = re.compile(r"[^a-z0-9]+")
 
 
 class CompanyDataError(RuntimeError):
     """Raised when the companies configuration cannot be loaded."""
 
 
-@lru_cache(maxsize=1)
+def _data_files() -> List[Path]:
+    sector_files = sorted(_DATA_DIR.glob("companies_*.json"))
+    return sector_files or [_DATA_PATH]
+
+
+def _signature(files: List[Path]) -> Tuple[Tuple[str, int, int], ...]:
+    signature = []
+    for file_path in files:
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            continue
+        signature.append((file_path.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
 def _load_raw() -> Dict[str, List[Dict[str, str]]]:
     data: Dict[str, List[Dict[str, str]]] = {}
 
@@ -62,37 +90,173 @@ def _load_raw() -> Dict[str, List[Dict[str, str]]]:
     return normalised
 
 
+def normalise_company_name(name: str) -> str:
+    """Return ``name`` lower-cased with punctuation and spacing removed, for lookups."""
+
+    return _NAME_NOISE.sub("", name.lower())
+
+
+def sector_slug(sector: str) -> str:
+    """Return the URL and filesystem safe slug used for ``sector`` in API paths."""
+
+    return quote(sector.lower().replace(" ", "-"), safe="")
+
+
+class CompanyRegistry:
+    """Indexes over one load of the company data files.
+
+    Everything callers ask for is computed once when the registry is built, so
+    lookups are dictionary reads. Returned lists and mappings are shared
+    between callers and must be treated as read-only. ``signature`` (names,
+    mtimes, sizes) decides when to reload; ``digest`` hashes the loaded
+    content and stays the same across checkouts of unchanged files.
+    """
+
+    def __init__(
+        self,
+        sectors: Dict[str, List[Dict[str, str]]],
+        *,
+        signature: Tuple[Tuple[str, int, int], ...] = (),
+    ) -> None:
+        self.signature = signature
+        self.digest = hashlib.sha256(json.dumps(sectors, sort_keys=True).encode("utf-8")).hexdigest()
+        self._sectors = sectors
+        self.sector_names: List[str] = sorted(sectors)
+        self._sector_by_slug: Dict[str, str] = {sector_slug(sector): sector for sector in self.sector_names}
+        self.all_companies: List[Dict[str, str]] = []
+        self.all_ticker_to_name: Dict[str, str] = {}
+        self._by_ticker: Dict[str, Dict[str, str]] = {}
+        self._sector_by_ticker: Dict[str, str] = {}
+        self._sector_by_name: Dict[str, str] = {}
+        self._by_ir_host: Dict[str, List[Dict[str, str]]] = {}
+        self._tickers: Dict[str, List[str]] = {}
+        self._ticker_to_name: Dict[str, Dict[str, str]] = {}
+        self._without_ticker: Dict[str, List[str]] = {}
+
+        for sector in self.sector_names:
+            entries = sectors[sector]
+            self.all_companies.extend(entries)
+            ticker_to_name: Dict[str, str] = {}
+            without_ticker: List[str] = []
+            for entry in entries:
+                ticker = entry.get("ticker")
+                if ticker:
+                    ticker_to_name[ticker] = entry["name"]
+                    self._by_ticker.setdefault(ticker, entry)
+                    self._sector_by_ticker.setdefault(ticker, sector)
+                else:
+                    without_ticker.append(entry["name"])
+                self._sector_by_name.setdefault(normalise_company_name(entry["name"]), sector)
+                url = entry.get("investorRelationsUrl")
+                if url:
+                    self._by_ir_host.setdefault(host_of(url), []).append(entry)
+            self._tickers[sector] = list(ticker_to_name)
+            self._ticker_to_name[sector] = ticker_to_name
+            self._without_ticker[sector] = without_ticker
+            for ticker, name in ticker_to_name.items():
+                self.all_ticker_to_name.setdefault(ticker, name)
+        self.all_companies_without_ticker: List[str] = sorted(
+            name for names in self._without_ticker.values() for name in names
+        )
+
+    def has_sector(self, sector: str) -> bool:
+        return sector in self._sectors
+
+    def sector_for_slug(self, slug: str) -> Optional[str]:
+        return self._sector_by_slug.get(slug)
+
+    def companies(self, sector: str) -> List[Dict[str, str]]:
+        return self._sectors.get(sector, [])
+
+    def tickers(self, sector: str) -> List[str]:
+        return self._tickers.get(sector, [])
+
+    def ticker_to_name(self, sector: str) -> Dict[str, str]:
+        return self._ticker_to_name.get(sector, {})
+
+    def companies_without_ticker(self, sector: str) -> List[str]:
+        return self._without_ticker.get(sector, [])
+
+    def company_for_ticker(self, ticker: str) -> Optional[Dict[str, str]]:
+        return self._by_ticker.get(ticker.upper())
+
+    def companies_for_host(self, host: str) -> List[Dict[str, str]]:
+        """Return the companies whose investor-relations page is served by ``host``."""
+
+        return self._by_ir_host.get(host.lower(), [])
+
+    def sector_for(self, *, ticker: Optional[str] = None, company: Optional[str] = None) -> Optional[str]:
+        """Return the sector of a ticker, falling back to the company name."""
+
+        if ticker:
+            sector = self._sector_by_ticker.get(ticker.upper())
+            if sector is not None:
+                return sector
+        if company:
+            return self._sector_by_name.get(normalise_company_name(company))
+        return None
+
+
+_registry_lock = threading.Lock()
+_registry: Optional[CompanyRegistry] = None
+_checked_at = 0.0
+
+
+def get_registry() -> CompanyRegistry:
+    """Return the current company registry, rebuilding it when the data files change.
+
+    The files are stat'ed at most once per ``_RELOAD_CHECK_INTERVAL`` seconds.
+    A new registry is swapped in only once it has loaded completely; if an
+    edited file fails to load, the previous registry keeps being served.
+    """
+
+    global _registry, _checked_at
+    registry = _registry
+    now = time.monotonic()
+    if registry is not None and now - _checked_at < _RELOAD_CHECK_INTERVAL:
+        return registry
+    with _registry_lock:
+        if _registry is not None and now - _checked_at < _RELOAD_CHECK_INTERVAL:
+            return _registry
+        signature = _signature(_data_files())
+        if _registry is None or signature != _registry.signature:
+            try:
+                _registry = CompanyRegistry(_load_raw(), signature=signature)
+            except CompanyDataError:
+                if _registry is None:
+                    raise
+                logger.exception("Keeping the previous company data; reload failed")
+            else:
+                logger.debug("Loaded company registry (%d sectors)", len(_registry.sector_names))
+        _checked_at = now
+        return _registry
+
+
 def get_sectors() -> List[str]:
     """Return the list of configured sector names."""
 
-    return sorted(_load_raw().keys())
+    return get_registry().sector_names
 
 
 def get_sector_companies(sector: str) -> List[Dict[str, str]]:
     """Return the company entries for the requested sector."""
 
-    data = _load_raw()
-    return data.get(sector, [])
+    return get_registry().companies(sector)
 
 
 def get_sector_tickers(sector: str) -> List[str]:
     """Return the list of tradable tickers for the sector (excludes private firms)."""
 
-    return [entry["ticker"] for entry in get_sector_companies(sector) if entry.get("ticker")]
+    return get_registry().tickers(sector)
 
 
 def get_ticker_to_name(sector: str) -> Dict[str, str]:
     """Return a mapping from ticker symbol to canonical company name."""
 
-    mapping: Dict[str, str] = {}
-    for entry in get_sector_companies(sector):
-        ticker = entry.get("ticker")
-        if ticker:
-            mapping[ticker] = entry["name"]
-    return mapping
+    return get_registry().ticker_to_name(sector)
 
 
 def get_companies_without_ticker(sector: str) -> List[str]:
     """Return sector companies that are not currently publicly traded."""
 
-    return [entry["name"] for entry in get_sector_companies(sector) if not entry.get("ticker")]
+    return get_registry().companies_without_ticker(sector)
@@ -0,0 +1,115 @@
+"""Asyncio fetch engine shared by the Nasdaq, Yahoo and investor-relations scrapers."""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+import requests
+
+from .sessions import SessionManager, get_session_manager
+
+T = TypeVar("T")
+
+_DEFAULT_MAX_WORKERS = 32
+_DEFAULT_PER_HOST_LIMIT = 4
+_DEFAULT_TIMEOUT = 60.0
+
+
+class FetchEngine:
+    """Run blocking ``requests`` calls concurrently from asyncio.
+
+    Requests go through the process-wide session from
+    :class:`~earnings.sessions.SessionManager`, so keep-alive connections are
+    reused across calls. Each host gets its own concurrency limit and every
+    call is bounded by a timeout. Requests are paced per host and throttled or
+    failed ones retried by the shared :class:`~earnings.rate_limit.HostRateLimiter`.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
+        per_host_limit: int = _DEFAULT_PER_HOST_LIMIT,
+        host_limits: Optional[Dict[str, int]] = None,
+        timeout: float = _DEFAULT_TIMEOUT,
+        sessions: Optional[SessionManager] = None,
+    ) -> None:
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.host_limits = dict(host_limits or {})
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fetch")
+        self._sessions = sessions or get_session_manager()
+        # Semaphores belong to the loop they were first awaited on, so keep one set per loop.
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._semaphore_lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        return self._sessions.session
+
+    def _semaphore(self, host: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._semaphore_lock:
+            per_loop = self._semaphores.setdefault(loop, {})
+            semaphore = per_loop.get(host)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self.host_limits.get(host, self.per_host_limit))
+                per_loop[host] = semaphore
+            return semaphore
+
+    async def call(
+        self,
+        host: str,
+        fn: Callable[..., T],
+        *args,
+        timeout: Optional[float] = None,
+    ) -> T:
+        """Run ``fn(*args)`` on the worker pool under ``host``'s concurrency limit."""
+
+        loop = asyncio.get_running_loop()
+        async with self._semaphore(host):
+            return await asyncio.wait_for(
+                loop.run_in_executor(self._executor, partial(fn, *args)),
+                timeout if timeout is not None else self.timeout,
+            )
+
+    def close(self) -> None:
+        """Stop the worker threads; pooled connections belong to the session manager."""
+
+        self._executor.shutdown(wait=False)
+
+
+_engine_lock = threading.Lock()
+_engine: Optional[FetchEngine] = None
+
+
+def get_engine() -> FetchEngine:
+    """Return the process-wide fetch engine, creating it on first use."""
+
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = FetchEngine()
+            atexit.register(_engine.close)
+        return _engine
+
+
+def run_sync(awaitable: Awaitable[T]) -> T:
+    """Run ``awaitable`` to completion from synchronous code."""
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(awaitable)  # type: ignore[arg-type]
+    if asyncio.iscoroutine(awaitable):
+        awaitable.close()
+    raise RuntimeError("run_sync() cannot be used inside a running event loop; await the async API instead")
@@ -1,14 +1,30 @@
 from __future__ import annotations
 
+import asyncio
+import atexit
+import codecs
 import logging
+import multiprocessing
+import os
 import re
+import threading
+import time
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
-from datetime import date, datetime
+from datetime import date
+from html.parser import HTMLParser
 from typing import Dict, Iterable, List, Optional, Tuple
 
 import requests
 from bs4 import BeautifulSoup
 
+from .cache import get_persistent_cache
+from .fetch_engine import FetchEngine, get_engine, run_sync
+from .metrics import metrics
+from .urls import host_of
+
 logger = logging.getLogger(__name__)
 
 _HEADERS = {
@@ -17,20 +33,38 @@ _HEADERS = {
     "Accept-Language": "en-US,en;q=0.9",
 }
 
-_DATE_PATTERNS = [
-    # January 25, 2025 / Jan. 25, 2025
-    re.compile(
-        r"\b("
-        r"January|February|March|April|May|June|July|August|September|October|November|December|"
-        r"Jan\.?|Feb\.?|Mar\.?|Apr\.?|Jun\.?|Jul\.?|Aug\.?|Sept\.?|Sep\.?|Oct\.?|Nov\.?|Dec\.?"
-        r")\s+\d{1,2}(?:st|nd|rd|th)?(?:,)?\s+\d{4}\b",
-        re.IGNORECASE,
-    ),
-    # 01/25/2025
-    re.compile(r"\b\d{1,2}/\d{1,2}/\d{4}\b"),
-    # 2025-01-25
-    re.compile(r"\b\d{4}-\d{2}-\d{2}\b"),
-]
+# January|...|Jan.?|... factored by prefix so the engine does not retry each spelling.
+_MONTH_NAMES = (
+    r"Jan(?:uary|\.)?|Feb(?:ruary|\.)?|Mar(?:ch|\.)?|Apr(?:il|\.)?|May|June?|Jun\.|July?|Jul\.|"
+    r"Aug(?:ust|\.)?|Sep(?:t(?:ember|\.)?|\.)?|Oct(?:ober|\.)?|Nov(?:ember|\.)?|Dec(?:ember|\.)?"
+)
+
+# One pass over the text finds all three date layouts:
+#   January 25, 2025 / Jan. 25, 2025 | 01/25/2025 | 2025-01-25
+# The leading character class lets the engine skip positions that cannot start
+# a date. The alternation sits inside a lookahead so a date of one layout never
+# hides an overlapping date of another, as separate per-layout scans would not.
+_DATE_SCANNER = re.compile(
+    r"(?=[JFMASOND\d])"
+    r"(?=(?P<month>\b(?P<month_name>" + _MONTH_NAMES + r")\s+(?P<month_day>\d{1,2})"
+    r"(?P<month_suffix>st|nd|rd|th)?(?:,)?\s+(?P<month_year>\d{4})\b)"
+    r"|(?P<slash>\b(?P<slash_month>\d{1,2})/(?P<slash_day>\d{1,2})/(?P<slash_year>\d{4})\b)"
+    r"|(?P<dash>\b(?P<dash_year>\d{4})-(?P<dash_month>\d{2})-(?P<dash_day>\d{2})\b))",
+    re.IGNORECASE,
+)
+
+_MAX_CONCURRENT_FETCHES = 20
+
+# "stream" strips markup incrementally while downloading; "soup" builds a full BeautifulSoup tree;
+# "process" downloads on the fetch threads and extracts in a process pool to use every core.
+_EXTRACTION_MODE = os.environ.get("EARNINGS_IR_EXTRACTION", "stream").strip().lower()
+_MAX_PAGE_BYTES = 2 * 1024 * 1024
+_STREAM_CHUNK_SIZE = 64 * 1024
+# Enough trailing text to keep the keyword/time context of a date split across chunks.
+_STREAM_OVERLAP = 400
+# Bumped when stored candidate lists stop matching what a fresh parse would find,
+# so pages persisted by an older release are parsed again instead of revalidated.
+_PAGE_PAYLOAD_VERSION = 2
 
 _TIME_PATTERN = re.compile(
     r"\b\d{1,2}:\d{2}\s*(?:a\.?m\.?|p\.?m\.?|am|pm)\s*(?:[A-Z]{2,3})?\b", re.IGNORECASE
@@ -83,61 +117,133 @@ class InvestorRelationsEvent:
     source_url: str
 
 
-def _parse_date_token(token: str) -> Optional[date]:
-    token = token.strip()
+_DATE_LAYOUTS = ("month", "slash", "dash")
 
-    dash_match = re.fullmatch(r"(\d{4})-(\d{2})-(\d{2})", token)
-    if dash_match:
-        year, month, day = map(int, dash_match.groups())
-        return date(year, month, day)
 
-    slash_match = re.fullmatch(r"(\d{1,2})/(\d{1,2})/(\d{4})", token)
-    if slash_match:
-        month, day, year = map(int, slash_match.groups())
-        try:
-            return date(year, month, day)
-        except ValueError:
-            return None
+def _parse_date_match(match: re.Match) -> Tuple[str, Optional[date]]:
+    """Return the layout name and parsed date for a ``_DATE_SCANNER`` match."""
 
-    month_match = re.fullmatch(
-        r"([A-Za-z\.]+)\s+(\d{1,2})(?:st|nd|rd|th)?(?:,)?\s+(\d{4})", token
-    )
-    if month_match:
-        month_token, day_token, year_token = month_match.groups()
-        month_key = month_token.replace(".", "").upper()
-        month = _MONTH_LOOKUP.get(month_key)
+    if match.group("month") is not None:
+        suffix = match.group("month_suffix")
+        # Ordinal suffixes are only accepted in lower case ("3rd", not "3RD").
+        if suffix and not suffix.islower():
+            return "month", None
+        month = _MONTH_LOOKUP.get(match.group("month_name").replace(".", "").upper())
         if not month:
-            return None
-        try:
-            return date(int(year_token), month, int(day_token))
-        except ValueError:
-            return None
+            return "month", None
+        year, month_value, day_value = int(match.group("month_year")), month, int(match.group("month_day"))
+        layout = "month"
+    elif match.group("slash") is not None:
+        year = int(match.group("slash_year"))
+        month_value = int(match.group("slash_month"))
+        day_value = int(match.group("slash_day"))
+        layout = "slash"
+    else:
+        year = int(match.group("dash_year"))
+        month_value = int(match.group("dash_month"))
+        day_value = int(match.group("dash_day"))
+        layout = "dash"
+    try:
+        return layout, date(year, month_value, day_value)
+    except ValueError:
+        return layout, None
+
 
-    return None
+class _KeywordIndex:
+    """Sorted positions of every keyword occurrence, for constant-time-ish window checks."""
 
+    def __init__(self, text: str) -> None:
+        lowered = text.lower()
+        # Lower-casing can change the length of some non-ASCII text; positions would drift.
+        self._fallback = lowered if len(lowered) != len(text) else None
+        spans: List[Tuple[int, int]] = []
+        if self._fallback is None:
+            for keyword in _KEYWORDS:
+                start = lowered.find(keyword)
+                while start != -1:
+                    spans.append((start, start + len(keyword)))
+                    start = lowered.find(keyword, start + 1)
+            spans.sort()
+        self._starts = [span[0] for span in spans]
+        self._ends = [span[1] for span in spans]
+        self._text = text
 
-def _context_has_keyword(context: str) -> bool:
-    lowered = context.lower()
-    return any(keyword in lowered for keyword in _KEYWORDS)
+    def has_keyword(self, start: int, end: int) -> bool:
+        """Return whether a keyword lies entirely within ``text[start:end]``."""
+
+        if self._fallback is not None:
+            context = self._text[start:end].lower()
+            return any(keyword in context for keyword in _KEYWORDS)
+        index = bisect_left(self._starts, start)
+        while index < len(self._starts) and self._starts[index] < end:
+            if self._ends[index] <= end:
+                return True
+            index += 1
+        return False
+
+
+def _scan_candidates(text: str, start: int = 0, stop: Optional[int] = None) -> List[Tuple[str, Tuple[date, str, str]]]:
+    """Return ``(layout, candidate)`` for every date in ``text`` starting in ``[start, stop)``."""
+
+    stop = len(text) if stop is None else stop
+    keywords = _KeywordIndex(text)
+    found: List[Tuple[str, Tuple[date, str, str]]] = []
+    for match in _DATE_SCANNER.finditer(text):
+        if not start <= match.start() < stop:
+            continue
+        layout, parsed = _parse_date_match(match)
+        if not parsed:
+            continue
+        ctx_start = max(0, match.start() - 120)
+        ctx_end = min(len(text), match.end(layout) + 120)
+        if not keywords.has_keyword(ctx_start, ctx_end):
+            continue
+        context = text[ctx_start:ctx_end]
+        time_match = _TIME_PATTERN.search(context)
+        time_label = time_match.group(0) if time_match else ""
+        found.append((layout, (parsed, time_label, context.strip())))
+    return found
 
 
 def _extract_candidates(text: str) -> List[Tuple[date, str, str]]:
-    candidates: List[Tuple[date, str, str]] = []
-    for pattern in _DATE_PATTERNS:
-        for match in pattern.finditer(text):
-            token = match.group(0)
-            parsed = _parse_date_token(token)
-            if not parsed:
-                continue
-            start = max(0, match.start() - 120)
-            end = min(len(text), match.end() + 120)
-            context = text[start:end]
-            if not _context_has_keyword(context):
-                continue
-            time_match = _TIME_PATTERN.search(context)
-            time_label = time_match.group(0) if time_match else ""
-            candidates.append((parsed, time_label, context.strip()))
-    return candidates
+    scanner = _CandidateScanner()
+    scanner.feed([text], final=True)
+    return scanner.candidates
+
+
+class _CandidateScanner:
+    """Extract candidates from text that arrives in pieces, scanning each piece once.
+
+    A date is only reported once ``_STREAM_OVERLAP`` characters follow it (or
+    the text has ended), and that much text is kept ahead of the next
+    unreported position, so every date sees the same keyword and time context
+    a scan of the whole text would give it and is reported exactly once.
+    """
+
+    def __init__(self) -> None:
+        # Keep the historical ordering: all month-name dates, then slash dates, then ISO dates.
+        self._by_layout: Dict[str, List[Tuple[date, str, str]]] = {layout: [] for layout in _DATE_LAYOUTS}
+        self._text = ""
+        self._reported = 0
+
+    def feed(self, parts: List[str], *, final: bool = False) -> List[Tuple[date, str, str]]:
+        """Append ``parts`` (joined by spaces) and return the candidates that became reportable."""
+
+        if parts:
+            self._text = " ".join([self._text, *parts] if self._text else parts)
+        stop = len(self._text) if final else max(self._reported, len(self._text) - _STREAM_OVERLAP)
+        found = []
+        for layout, candidate in _scan_candidates(self._text, self._reported, stop):
+            self._by_layout[layout].append(candidate)
+            found.append(candidate)
+        keep = max(0, stop - _STREAM_OVERLAP)
+        self._text = self._text[keep:]
+        self._reported = stop - keep
+        return found
+
+    @property
+    def candidates(self) -> List[Tuple[date, str, str]]:
+        return [candidate for layout in _DATE_LAYOUTS for candidate in self._by_layout[layout]]
 
 
 def _pick_event(candidates: Iterable[Tuple[date, str, str]], today: date) -> Optional[Tuple[date, str]]:
@@ -149,74 +255,313 @@ def _pick_event(candidates: Iterable[Tuple[date, str, str]], today: date) -> Opt
     return best_date, time_label
 
 
-def fetch_investor_relations_events(
+class _TextExtractor(HTMLParser):
+    """Collect visible text from HTML fed in chunks, skipping script and style bodies.
+
+    ``HTMLParser`` hands over text as far as each chunk goes, so a text run is
+    buffered until the next tag or comment; ``parts`` then match a parse of the
+    whole page no matter where the chunks were cut.
+    """
+
+    _SKIPPED_TAGS = {"script", "style", "noscript", "template", "svg"}
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self._pending: List[str] = []
+        self._skip_depth = 0
+
+    def _flush(self) -> None:
+        data = "".join(self._pending).strip()
+        self._pending.clear()
+        if data:
+            self.parts.append(data)
+
+    def handle_starttag(self, tag, attrs):
+        self._flush()
+        if tag in self._SKIPPED_TAGS:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag):
+        self._flush()
+        if tag in self._SKIPPED_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_comment(self, data):
+        self._flush()
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self._pending.append(data)
+
+    def close(self) -> None:
+        super().close()
+        self._flush()
+
+
+def _stream_page_candidates(response: requests.Response) -> List[Tuple[date, str, str]]:
+    """Extract candidates from a streamed response body, reading at most ``_MAX_PAGE_BYTES``.
+
+    Markup is stripped and new text scanned chunk by chunk, so no text is
+    scanned twice beyond the overlap :class:`_CandidateScanner` keeps. The
+    whole page is read: a nearer event may be listed below a later one.
+    """
+
+    try:
+        decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    parser = _TextExtractor()
+    scanner = _CandidateScanner()
+    bytes_read = 0
+
+    for chunk in response.iter_content(chunk_size=_STREAM_CHUNK_SIZE):
+        if not chunk:
+            continue
+        bytes_read += len(chunk)
+        parser.feed(decoder.decode(chunk))
+        if bytes_read >= _MAX_PAGE_BYTES:
+            break
+        scanner.feed(parser.parts)
+        parser.parts.clear()
+    else:
+        parser.feed(decoder.decode(b"", final=True))
+
+    parser.close()
+    scanner.feed(parser.parts, final=True)
+    metrics.inc("upstream_bytes_total", bytes_read, source="ir")
+    return scanner.candidates
+
+
+def _page_candidates(response: requests.Response) -> List[Tuple[date, str, str]]:
+    if _EXTRACTION_MODE == "soup":
+        metrics.inc("upstream_bytes_total", len(response.content), source="ir")
+        if not response.text:
+            return []
+        soup = BeautifulSoup(response.text, "lxml")
+        return _extract_candidates(soup.get_text(" ", strip=True))
+    return _stream_page_candidates(response)
+
+
+def _html_text(html: str) -> str:
+    """Return the visible text of ``html`` as the stream extractor sees it."""
+
+    parser = _TextExtractor()
+    parser.feed(html)
+    parser.close()
+    return " ".join(parser.parts)
+
+
+def _read_body(response: requests.Response) -> bytes:
+    chunks: List[bytes] = []
+    size = 0
+    for chunk in response.iter_content(chunk_size=_STREAM_CHUNK_SIZE):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= _MAX_PAGE_BYTES:
+            break
+    metrics.inc("upstream_bytes_total", size, source="ir")
+    return b"".join(chunks)
+
+
+def _candidates_from_html(body: bytes, encoding: str) -> List[Tuple[date, str, str]]:
+    """Strip markup from a whole page and extract its candidates (runs in a pool worker).
+
+    Context snippets are dropped to keep the result cheap to send back.
+    """
+
+    text = _html_text(body.decode(encoding, errors="replace"))
+    return [(day, time_label, "") for day, time_label, _ in _extract_candidates(text)]
+
+
+_pool_lock = threading.Lock()
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _parse_pool() -> ProcessPoolExecutor:
+    """Return the extraction process pool, sized by ``EARNINGS_IR_WORKERS`` (default: CPU count)."""
+
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            workers = os.cpu_count() or 1
+            raw_workers = os.environ.get("EARNINGS_IR_WORKERS", "").strip()
+            if raw_workers:
+                try:
+                    workers = max(1, int(raw_workers))
+                except ValueError:
+                    logger.warning("Ignoring invalid EARNINGS_IR_WORKERS=%r", raw_workers)
+            # Forking a process that runs fetch threads can copy held locks, so start clean workers.
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(method))
+            atexit.register(_pool.shutdown, wait=False, cancel_futures=True)
+        return _pool
+
+
+def _extract_in_pool(response: requests.Response) -> List[Tuple[date, str, str]]:
+    global _pool
+    body = _read_body(response)
+    if not body:
+        return []
+    encoding = response.encoding or "utf-8"
+    try:
+        codecs.lookup(encoding)
+    except LookupError:
+        encoding = "utf-8"
+    pool = _parse_pool()
+    try:
+        return pool.submit(_candidates_from_html, body, encoding).result()
+    except BrokenProcessPool:
+        # A worker died (e.g. killed for memory); start a fresh pool next time and parse this page here.
+        logger.warning("IR parse pool broke; rebuilding it")
+        with _pool_lock:
+            if _pool is pool:
+                _pool = None
+        return _candidates_from_html(body, encoding)
+
+
+def _encode_candidates(candidates: Iterable[Tuple[date, str, str]]) -> List[List[str]]:
+    # Context snippets are only useful while debugging, so persist just date and time.
+    unique = dict.fromkeys((item[0].isoformat(), item[1]) for item in candidates)
+    return [list(item) for item in unique]
+
+
+def _decode_candidates(payload: object) -> List[Tuple[date, str, str]]:
+    candidates: List[Tuple[date, str, str]] = []
+    for item in payload if isinstance(payload, list) else []:
+        try:
+            candidates.append((date.fromisoformat(item[0]), item[1] or "", ""))
+        except (IndexError, TypeError, ValueError):
+            continue
+    return candidates
+
+
+def _fetch_one(
     session: requests.Session,
-    *,
-    companies: List[Dict[str, str]],
-    today: Optional[date] = None,
-) -> Dict[str, InvestorRelationsEvent]:
-    today = today or date.today()
-    results: Dict[str, InvestorRelationsEvent] = {}
-    
-    # Use a separate session factory or just new sessions per thread to avoid race conditions 
-    # if the passed session isn't thread-safe (requests.Session is generally thread-safe but 
-    # relying on a single pool might be a bottleneck). 
-    # Actually, sharing one session is fine if pool size is large enough.
-    # However, let's use a thread pool to parallelize.
-    
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-    
-    def _fetch_one(entry: Dict[str, str]) -> Optional[InvestorRelationsEvent]:
-        symbol = entry.get("ticker")
-        company = entry.get("name")
-        url = entry.get("investorRelationsUrl")
-        if not symbol or not url:
+    entry: Dict[str, str],
+    today: date,
+) -> Optional[InvestorRelationsEvent]:
+    symbol = entry.get("ticker")
+    company = entry.get("name")
+    url = entry.get("investorRelationsUrl")
+    if not symbol or not url:
+        return None
+
+    # Revalidate against the last copy we parsed; an unchanged page costs a 304 and no parsing.
+    store = get_persistent_cache()
+    stored = store.get_page(url) if store is not None else None
+    if stored is not None and (
+        not isinstance(stored["payload"], dict) or stored["payload"].get("version") != _PAGE_PAYLOAD_VERSION
+    ):
+        stored = None
+    headers = dict(_HEADERS)
+    if stored is not None:
+        if stored["etag"]:
+            headers["If-None-Match"] = stored["etag"]
+        if stored["last_modified"]:
+            headers["If-Modified-Since"] = stored["last_modified"]
+
+    host = host_of(url)
+    started = time.perf_counter()
+    try:
+        response = session.get(url, headers=headers, timeout=10, stream=True) # Reduced timeout for speed
+    except requests.RequestException as exc:
+        metrics.inc("ir_fetches_total", host=host, outcome="error")
+        logger.debug("IR fetch failed for %s (%s): %s", company, symbol, exc)
+        return None
+    metrics.observe("upstream_request_seconds", time.perf_counter() - started, source="ir")
+    metrics.inc("upstream_requests_total", source="ir", outcome=response.status_code)
+    metrics.inc("ir_fetches_total", host=host, outcome=response.status_code)
+
+    if response.status_code == 304 and stored is not None:
+        response.close()
+        payload = stored["payload"]
+        candidates = _decode_candidates(payload.get("candidates"))
+        source_url = payload.get("source_url") or url
+    else:
+        if response.status_code != 200:
+            response.close()
             return None
 
         try:
-            # We use the shared session, but requests is thread-safe.
-            response = session.get(url, headers=_HEADERS, timeout=10) # Reduced timeout for speed
+            # In stream mode this also covers reading the body, which is interleaved with parsing.
+            with metrics.timer("parse_seconds", source="ir"):
+                if _EXTRACTION_MODE == "process":
+                    candidates = _extract_in_pool(response)
+                else:
+                    candidates = _page_candidates(response)
         except requests.RequestException as exc:
-            logger.debug("IR fetch failed for %s (%s): %s", company, symbol, exc)
+            logger.debug("IR body read failed for %s (%s): %s", company, symbol, exc)
             return None
+        finally:
+            response.close()
+        source_url = response.url or url
 
-        if response.status_code != 200 or not response.text:
-            return None
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if store is not None and (etag or last_modified):
+            store.set_page(
+                url,
+                etag=etag,
+                last_modified=last_modified,
+                payload={
+                    "version": _PAGE_PAYLOAD_VERSION,
+                    "source_url": source_url,
+                    "candidates": _encode_candidates(candidates),
+                },
+            )
 
-        soup = BeautifulSoup(response.text, "lxml")
-        text = soup.get_text(" ", strip=True)
-        if not text:
-            return None
+    selection = _pick_event(candidates, today)
+    metrics.inc("ir_events_total", host=host, found=selection is not None)
+    if not selection:
+        return None
 
-        candidates = _extract_candidates(text)
-        selection = _pick_event(candidates, today)
-        if not selection:
-            return None
+    event_date, time_label = selection
+    return InvestorRelationsEvent(
+        symbol=symbol,
+        company=company or symbol,
+        date=event_date,
+        time_label=time_label or None,
+        source_url=source_url,
+    )
 
-        event_date, time_label = selection
-        return InvestorRelationsEvent(
-            symbol=symbol,
-            company=company or symbol,
-            date=event_date,
-            time_label=time_label or None,
-            source_url=response.url or url,
-        )
-
-    # Limit max workers to avoid being flagged as a DoS or exhausting local resources
-    max_workers = min(len(companies), 20) or 1
-    
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_symbol = {
-            executor.submit(_fetch_one, entry): entry.get("ticker") 
-            for entry in companies
-        }
-        
-        for future in as_completed(future_to_symbol):
+
+async def fetch_investor_relations_events_async(
+    session: requests.Session,
+    *,
+    companies: List[Dict[str, str]],
+    today: Optional[date] = None,
+    engine: Optional[FetchEngine] = None,
+) -> Dict[str, InvestorRelationsEvent]:
+    today = today or date.today()
+    engine = engine or get_engine()
+    results: Dict[str, InvestorRelationsEvent] = {}
+
+    # Limit overall concurrency to avoid being flagged as a DoS or exhausting local resources;
+    # the engine additionally caps concurrent requests per IR host.
+    limit = asyncio.Semaphore(_MAX_CONCURRENT_FETCHES)
+
+    async def _run(entry: Dict[str, str]) -> Optional[InvestorRelationsEvent]:
+        url = entry.get("investorRelationsUrl") or ""
+        async with limit:
             try:
-                event = future.result()
-                if event:
-                    results[event.symbol] = event
+                return await engine.call(host_of(url), _fetch_one, session, entry, today)
             except Exception as exc:
-                logger.debug("Worker failed: %s", exc)
-                
+                logger.debug("Worker failed for %s: %s", entry.get("ticker"), exc)
+                return None
+
+    for event in await asyncio.gather(*(_run(entry) for entry in companies)):
+        if event:
+            results[event.symbol] = event
     return results
+
+
+def fetch_investor_relations_events(
+    session: requests.Session,
+    *,
+    companies: List[Dict[str, str]],
+    today: Optional[date] = None,
+) -> Dict[str, InvestorRelationsEvent]:
+    return run_sync(
+        fetch_investor_relations_events_async(session, companies=companies, today=today)
+    )
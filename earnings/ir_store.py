@@ -0,0 +1,228 @@
+"""Shared, TTL-bounded store of investor-relations events for the whole company universe."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .cache import PersistentCache, get_persistent_cache
+from .companies import get_registry
+from .fetch_engine import get_engine
+from .ir_scraper import InvestorRelationsEvent, fetch_investor_relations_events
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_TTL = timedelta(hours=6)
+_SNAPSHOT_NAME = "ir_events"
+
+EventMap = Dict[str, InvestorRelationsEvent]
+
+
+def _all_companies() -> List[Dict[str, str]]:
+    return list(get_registry().all_companies)
+
+
+def _companies_version() -> str:
+    """Identify the company data by content, so fresh checkouts of unchanged files still match."""
+
+    return get_registry().digest
+
+
+def _scrape(companies: List[Dict[str, str]]) -> EventMap:
+    return fetch_investor_relations_events(get_engine().session, companies=companies)
+
+
+def _encode(events: EventMap) -> Dict[str, dict]:
+    return {
+        symbol: {
+            "symbol": event.symbol,
+            "company": event.company,
+            "date": event.date.isoformat(),
+            "time_label": event.time_label,
+            "source_url": event.source_url,
+        }
+        for symbol, event in events.items()
+    }
+
+
+def _decode(payload: object) -> Optional[EventMap]:
+    if not isinstance(payload, dict):
+        return None
+    events: EventMap = {}
+    for symbol, item in payload.items():
+        try:
+            events[symbol] = InvestorRelationsEvent(
+                symbol=item["symbol"],
+                company=item["company"],
+                date=date.fromisoformat(item["date"]),
+                time_label=item.get("time_label"),
+                source_url=item["source_url"],
+            )
+        except (KeyError, TypeError, ValueError):
+            continue
+    return events
+
+
+class InvestorRelationsStore:
+    """Serve the last scraped IR events and refresh them in the background.
+
+    Readers never wait for a scrape once any snapshot exists: a stale snapshot
+    is returned as-is while a single background thread refreshes it. A
+    snapshot also goes stale as soon as the company data it was scraped for
+    changes. Snapshots are written to the persistent cache so the Flask workers
+    and the static build share one scrape between them.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: timedelta = _DEFAULT_TTL,
+        companies_loader: Callable[[], List[Dict[str, str]]] = _all_companies,
+        scraper: Callable[[List[Dict[str, str]]], EventMap] = _scrape,
+        version_loader: Callable[[], str] = _companies_version,
+        cache: Optional[PersistentCache] = None,
+    ) -> None:
+        self.ttl = ttl
+        self._companies_loader = companies_loader
+        self._scraper = scraper
+        self._version_loader = version_loader
+        self._cache = cache
+        self._lock = threading.Lock()
+        self._events: Optional[EventMap] = None
+        self._version: Optional[str] = None
+        self._loaded_at = 0.0
+        self._checked_cache = False
+        self._refresh_thread: Optional[threading.Thread] = None
+
+    def _is_fresh(self, version: str) -> bool:
+        return (
+            self._events is not None
+            and self._version == version
+            and time.time() - self._loaded_at < self.ttl.total_seconds()
+        )
+
+    def _load_persisted(self) -> None:
+        self._checked_cache = True
+        if self._cache is None:
+            return
+        stored = self._cache.get_snapshot(_SNAPSHOT_NAME)
+        if stored is None:
+            return
+        payload, fetched_at = stored
+        version = None
+        if isinstance(payload, dict) and "events" in payload:
+            version = payload.get("version")
+            payload = payload["events"]
+        # Snapshots written before versioning decode with no version and count as stale.
+        events = _decode(payload)
+        if events is not None:
+            self._events = events
+            self._version = version
+            self._loaded_at = fetched_at
+
+    def get_events(self, *, block: bool = False) -> EventMap:
+        """Return the current IR events keyed by ticker.
+
+        With ``block=True`` a stale snapshot is refreshed before returning,
+        which suits batch jobs; request handlers should use the default. The
+        very first call in a fresh deployment waits for the initial scrape
+        since there is nothing to serve yet.
+        """
+
+        events, thread = self._serve_or_refresh(block)
+        if events is not None:
+            return events
+        if thread is None:
+            return self.refresh()
+        thread.join()
+        with self._lock:
+            return self._events or {}
+
+    async def get_events_async(self, *, block: bool = False) -> EventMap:
+        """:meth:`get_events` for coroutines: any scrape is waited for off the event loop."""
+
+        events, thread = self._serve_or_refresh(block)
+        if events is not None:
+            return events
+        await asyncio.get_running_loop().run_in_executor(None, self.refresh if thread is None else thread.join)
+        with self._lock:
+            return self._events or {}
+
+    def _serve_or_refresh(self, block: bool) -> Tuple[Optional[EventMap], Optional[threading.Thread]]:
+        """Return the snapshot to serve now, else the background refresh to wait for.
+
+        ``(None, None)`` means the caller should refresh inline (``block=True``).
+        """
+
+        version = self._version_loader()
+        with self._lock:
+            if not self._checked_cache:
+                self._load_persisted()
+            if self._is_fresh(version):
+                return self._events, None
+            if block:
+                return None, None
+            return self._events, self._start_refresh_locked()
+
+    def refresh(self) -> EventMap:
+        """Scrape every configured IR page now and replace the snapshot."""
+
+        version = self._version_loader()
+        events = self._scraper(self._companies_loader())
+        fetched_at = time.time()
+        with self._lock:
+            self._events = events
+            self._version = version
+            self._loaded_at = fetched_at
+        if self._cache is not None:
+            self._cache.set_snapshot(
+                _SNAPSHOT_NAME, {"version": version, "events": _encode(events)}, fetched_at
+            )
+        logger.info("Refreshed investor relations events for %d companies", len(events))
+        return events
+
+    def _start_refresh_locked(self) -> threading.Thread:
+        if self._refresh_thread is None or not self._refresh_thread.is_alive():
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_in_background,
+                name="ir-refresh",
+                daemon=True,
+            )
+            self._refresh_thread.start()
+        return self._refresh_thread
+
+    def _refresh_in_background(self) -> None:
+        try:
+            self.refresh()
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning("Background investor relations refresh failed: %s", exc)
+
+
+_store_lock = threading.Lock()
+_store: Optional[InvestorRelationsStore] = None
+
+
+def get_ir_store() -> InvestorRelationsStore:
+    """Return the process-wide IR event store.
+
+    ``EARNINGS_IR_TTL_SECONDS`` controls how long a snapshot is served before
+    a background refresh is started.
+    """
+
+    global _store
+    with _store_lock:
+        if _store is None:
+            ttl = _DEFAULT_TTL
+            raw_ttl = os.environ.get("EARNINGS_IR_TTL_SECONDS", "").strip()
+            if raw_ttl:
+                try:
+                    ttl = timedelta(seconds=float(raw_ttl))
+                except ValueError:
+                    logger.warning("Ignoring invalid EARNINGS_IR_TTL_SECONDS=%r", raw_ttl)
+            _store = InvestorRelationsStore(ttl=ttl, cache=get_persistent_cache())
+        return _store
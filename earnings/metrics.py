@@ -0,0 +1,133 @@
+"""Process-wide counters and latency histograms for the scrapers and the build."""
+
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
+
+# Upper bounds in seconds; the implicit last bucket is +Inf.
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_Key = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def _key(name: str, labels: Dict[str, object]) -> _Key:
+    return name, tuple(sorted((label, str(value)) for label, value in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class _Histogram:
+    __slots__ = ("counts", "count", "total")
+
+    def __init__(self, size: int) -> None:
+        self.counts = [0] * size
+        self.count = 0
+        self.total = 0.0
+
+
+class Metrics:
+    """Thread-safe counters and fixed-bucket histograms keyed by name and labels.
+
+    Label values should come from small sets (sources, outcomes, hosts) since
+    every combination is kept for the life of the process.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._counters: Dict[_Key, float] = {}
+        self._histograms: Dict[_Key, _Histogram] = {}
+
+    def inc(self, name: str, value: float = 1, **labels: object) -> None:
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, seconds: float, **labels: object) -> None:
+        key = _key(name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram(len(self.buckets) + 1)
+            histogram.counts[bisect_left(self.buckets, seconds)] += 1
+            histogram.count += 1
+            histogram.total += seconds
+
+    @contextmanager
+    def timer(self, name: str, **labels: object) -> Iterator[None]:
+        """Observe the wall-clock duration of the ``with`` block, even if it raises."""
+
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def snapshot(self) -> Dict[str, List[dict]]:
+        """Return every metric as JSON-serialisable data."""
+
+        with self._lock:
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self._counters.items())
+            ]
+            histograms = []
+            for (name, labels), histogram in sorted(self._histograms.items()):
+                cumulative = 0
+                buckets = {}
+                for bound, count in zip([*map(str, self.buckets), "+Inf"], histogram.counts):
+                    cumulative += count
+                    buckets[bound] = cumulative
+                histograms.append(
+                    {
+                        "name": name,
+                        "labels": dict(labels),
+                        "count": histogram.count,
+                        "sum": round(histogram.total, 6),
+                        "buckets": buckets,
+                    }
+                )
+        return {"counters": counters, "histograms": histograms}
+
+    def render_prometheus(self, prefix: str = "earnings_") -> str:
+        """Return the metrics in the Prometheus text exposition format."""
+
+        def _labels(labels: Dict[str, str], extra: Dict[str, str] | None = None) -> str:
+            merged = {**labels, **(extra or {})}
+            if not merged:
+                return ""
+            return "{" + ",".join(f'{label}="{_escape(value)}"' for label, value in merged.items()) + "}"
+
+        snapshot = self.snapshot()
+        lines: List[str] = []
+        seen = set()
+        for counter in snapshot["counters"]:
+            name = prefix + counter["name"]
+            if name not in seen:
+                lines.append(f"# TYPE {name} counter")
+                seen.add(name)
+            lines.append(f"{name}{_labels(counter['labels'])} {counter['value']}")
+        for histogram in snapshot["histograms"]:
+            name = prefix + histogram["name"]
+            if name not in seen:
+                lines.append(f"# TYPE {name} histogram")
+                seen.add(name)
+            for bound, count in histogram["buckets"].items():
+                lines.append(f"{name}_bucket{_labels(histogram['labels'], {'le': bound})} {count}")
+            lines.append(f"{name}_sum{_labels(histogram['labels'])} {histogram['sum']}")
+            lines.append(f"{name}_count{_labels(histogram['labels'])} {histogram['count']}")
+        return "\n".join(lines) + "\n"
+
+
+metrics = Metrics()
@@ -0,0 +1,95 @@
+"""Compact JSON encoding and pre-compression for API payloads."""
+
+from __future__ import annotations
+
+import gzip
+import json
+from typing import Dict, Iterable, List, Optional
+
+try:  # brotli is optional; without it only gzip variants are produced.
+    import brotli  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+COLUMNAR_LAYOUT = "columnar"
+
+# Content-Encoding -> file suffix, in order of preference.
+ENCODINGS: Dict[str, str] = {"br": ".br", "gzip": ".gz"}
+
+
+def encode_json(payload: object, *, pretty: bool = False) -> bytes:
+    """Serialise ``payload`` minified (or indented when ``pretty``) as UTF-8."""
+
+    if pretty:
+        return json.dumps(payload, indent=2).encode("utf-8")
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def to_columnar(records: Iterable[dict]) -> Dict[str, list]:
+    """Return ``records`` as field names listed once plus one value array per record.
+
+    Fields are the union of every record's keys in first-seen order; a record
+    without a field gets ``null`` in that column.
+    """
+
+    records = list(records)
+    fields: Dict[str, None] = {}
+    for record in records:
+        for key in record:
+            fields.setdefault(key, None)
+    names = list(fields)
+    return {"fields": names, "rows": [[record.get(name) for name in names] for record in records]}
+
+
+def from_columnar(table: Dict[str, list]) -> List[dict]:
+    """Inverse of :func:`to_columnar`."""
+
+    names = table["fields"]
+    return [dict(zip(names, row)) for row in table["rows"]]
+
+
+def columnar_payload(payload: Dict[str, object]) -> Dict[str, object]:
+    """Return a copy of ``payload`` with its ``records`` list in the columnar layout."""
+
+    records = payload.get("records")
+    if not isinstance(records, list):
+        return payload
+    return {**payload, "layout": COLUMNAR_LAYOUT, "records": to_columnar(records)}
+
+
+def compress(data: bytes, encoding: str, *, fast: bool = False) -> Optional[bytes]:
+    """Compress ``data`` for a ``Content-Encoding``; ``None`` when the codec is unavailable.
+
+    Output is deterministic (gzip carries no timestamp) so rebuilding an
+    unchanged payload produces identical bytes. ``fast`` trades ratio for
+    speed when compressing per request.
+    """
+
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=6 if fast else 9, mtime=0)
+    if encoding == "br" and brotli is not None:
+        return brotli.compress(data, quality=5 if fast else 11)
+    return None
+
+
+def available_encodings() -> List[str]:
+    return [encoding for encoding in ENCODINGS if encoding != "br" or brotli is not None]
+
+
+def negotiate_encoding(accept_encoding: str, *, min_size: int = 0, size: int = 0) -> Optional[str]:
+    """Pick the preferred encoding the client accepts, or ``None`` for identity."""
+
+    if size < min_size:
+        return None
+    accepted = set()
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if params.replace(" ", "").lower() in {"q=0", "q=0.0", "q=0.00", "q=0.000"}:
+            continue
+        if token:
+            accepted.add(token)
+    for encoding in available_encodings():
+        if encoding in accepted or "*" in accepted:
+            return encoding
+    return None
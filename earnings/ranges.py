@@ -0,0 +1,54 @@
+"""Compose multi-week range results from independently fetched (and cached) weeks."""
+
+from __future__ import annotations
+
+import heapq
+from datetime import date, timedelta
+from typing import Dict, Iterable, List
+
+from .week_selector import build_week_option, get_week_start
+
+
+def split_into_weeks(start: date, end: date) -> List[dict]:
+    """Return the canonical week options covering ``start`` through ``end``."""
+
+    weeks: List[dict] = []
+    current = get_week_start(start)
+    while current <= end:
+        weeks.append(build_week_option(current))
+        current += timedelta(days=7)
+    return weeks
+
+
+def _record_key(record: dict):
+    return (record.get("date") or "", record.get("company") or "")
+
+
+def merge_week_payloads(payloads: Iterable[Dict[str, object]]) -> Dict[str, object]:
+    """Merge per-week payloads into one range payload.
+
+    Every week's records are already sorted by date and company, so a single
+    k-way merge yields the combined ordering without re-sorting.
+    """
+
+    payloads = list(payloads)
+    records = list(heapq.merge(*(payload["records"] for payload in payloads), key=_record_key))
+    missing_public: Dict[str, None] = {}
+    ir_companies: set = set()
+    fallback_companies: set = set()
+    generated = []
+    for payload in payloads:
+        missing_public.update(dict.fromkeys(payload.get("missing_public", [])))
+        ir_companies.update(payload.get("ir_companies", []))
+        fallback_companies.update(payload.get("fallback_companies", []))
+        if payload.get("generated_at"):
+            generated.append(payload["generated_at"])
+    return {
+        "records": records,
+        "missing_public": list(missing_public),
+        "ticker_count": max((payload.get("ticker_count", 0) for payload in payloads), default=0),
+        # The range is only as fresh as its oldest week.
+        "generated_at": min(generated) if generated else None,
+        "ir_companies": sorted(ir_companies),
+        "fallback_companies": sorted(fallback_companies),
+    }
@@ -0,0 +1,276 @@
+"""Per-host rate limiting and retry with backoff for upstream HTTP requests."""
+
+from __future__ import annotations
+
+import logging
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, FrozenSet, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+_THROTTLE_STATUSES = frozenset({429, 503})
+
+
+@dataclass(frozen=True)
+class HostPolicy:
+    """How fast one host may be called and which failures are worth retrying.
+
+    ``rate`` is the sustained requests per second and ``burst`` how many may
+    go out back to back. Backoff before retry ``n`` is drawn uniformly from
+    ``[0, min(max_backoff, base_backoff * 2**n)]`` (full jitter) but never
+    shorter than the server's ``Retry-After``; a ``Retry-After`` longer than
+    ``max_retry_after`` is not waited for and the response is returned as-is.
+
+    ``deadline`` bounds the whole exchange: no pacing wait or backoff is
+    started that would end more than ``deadline`` seconds after the first
+    attempt, so with the 20s request timeouts the scrapers use a call always
+    finishes inside :class:`~earnings.fetch_engine.FetchEngine`'s 60s timeout
+    and never keeps a worker busy after the engine has given up on it.
+    """
+
+    rate: float = 2.0
+    burst: int = 4
+    retries: int = 3
+    retry_statuses: FrozenSet[int] = frozenset({429, 502, 503, 504})
+    base_backoff: float = 0.5
+    max_backoff: float = 20.0
+    max_retry_after: float = 30.0
+    deadline: float = 35.0
+
+
+# The calendar aggregators answer bursts with 403/429 and recover quickly, so
+# they get retried harder than investor-relations sites, where a 403 is usually
+# a permanent block.
+_AGGREGATOR_POLICY = HostPolicy(
+    rate=5.0,
+    burst=5,
+    retries=4,
+    retry_statuses=frozenset({403, 429, 500, 502, 503, 504}),
+)
+_HOST_POLICIES: Dict[str, HostPolicy] = {
+    "api.nasdaq.com": _AGGREGATOR_POLICY,
+    "finance.yahoo.com": _AGGREGATOR_POLICY,
+}
+
+
+def parse_retry_after(value: Optional[str], *, now: Optional[datetime] = None) -> Optional[float]:
+    """Return the delay in seconds a ``Retry-After`` header asks for, or ``None``."""
+
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - (now or datetime.now(timezone.utc))).total_seconds())
+
+
+class RetryBudgetExceeded(requests.RequestException):
+    """The host is throttled for longer than the request's :attr:`HostPolicy.deadline`."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket whose rate halves on throttling and creeps back on success."""
+
+    def __init__(self, rate: float, burst: int, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take a token and return how long the caller must wait before using it.
+
+        Tokens may go negative, which queues callers fairly behind each other
+        instead of letting them race for the next refill.
+        """
+
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._blocked_until - now)
+
+    def cancel(self) -> None:
+        """Hand back a token taken by :meth:`reserve` that will not be used."""
+
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + 1)
+
+    def penalise(self, delay: float) -> None:
+        """Hold every caller for ``delay`` seconds and halve the sustained rate."""
+
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._blocked_until = max(self._blocked_until, now + delay)
+            self.rate = max(self.base_rate / 8, self.rate / 2)
+
+    def reward(self) -> None:
+        with self._lock:
+            if self.rate < self.base_rate:
+                self.rate = min(self.base_rate, self.rate + self.base_rate / 10)
+
+
+class HostRateLimiter:
+    """One :class:`TokenBucket` and :class:`HostPolicy` per host, shared by every session."""
+
+    def __init__(
+        self,
+        *,
+        default_policy: HostPolicy = HostPolicy(),
+        policies: Optional[Dict[str, HostPolicy]] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.default_policy = default_policy
+        self.policies = dict(_HOST_POLICIES if policies is None else policies)
+        self._sleep = sleep
+        self.clock = clock
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def policy(self, host: str) -> HostPolicy:
+        return self.policies.get(host, self.default_policy)
+
+    def bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                policy = self.policy(host)
+                bucket = self._buckets[host] = TokenBucket(policy.rate, policy.burst, clock=self.clock)
+            return bucket
+
+    def acquire(self, host: str, *, deadline: Optional[float] = None) -> bool:
+        """Wait for ``host``'s next slot; return ``False`` without waiting if it opens after ``deadline``."""
+
+        bucket = self.bucket(host)
+        wait = bucket.reserve()
+        if deadline is not None and self.clock() + wait > deadline:
+            bucket.cancel()
+            return False
+        if wait > 0:
+            metrics.observe("rate_limit_wait_seconds", wait)
+            self.sleep(wait)
+        return True
+
+    def sleep(self, seconds: float) -> None:
+        self._sleep(seconds)
+
+    def backoff(self, host: str, attempt: int, retry_after: Optional[float] = None) -> float:
+        policy = self.policy(host)
+        delay = random.uniform(0, min(policy.max_backoff, policy.base_backoff * 2**attempt))
+        return max(delay, retry_after or 0.0)
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """``HTTPAdapter`` that paces requests per host and retries throttled or failed ones.
+
+    A throttling response (429/503) pauses the whole host, not just the
+    request that got it, so concurrent workers stop hammering it together.
+    Once the policy's ``deadline`` would be overrun the last response (or
+    connection error) is returned as-is; a host paused beyond it raises
+    :class:`RetryBudgetExceeded` before anything is sent.
+    """
+
+    def __init__(self, limiter: Optional[HostRateLimiter] = None, **kwargs) -> None:
+        self.limiter = limiter or get_rate_limiter()
+        super().__init__(**kwargs)
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        host = (requests.utils.urlparse(request.url).hostname or "").lower()
+        policy = self.limiter.policy(host)
+        bucket = self.limiter.bucket(host)
+        deadline = self.limiter.clock() + policy.deadline
+        attempt = 0
+        while True:
+            if not self.limiter.acquire(host, deadline=deadline):
+                metrics.inc("upstream_retry_budget_exhausted_total", host=host)
+                raise RetryBudgetExceeded(f"{host} is paused beyond the {policy.deadline:g}s budget", request=request)
+            try:
+                response = super().send(request, **kwargs)
+            except requests.ConnectionError:
+                if attempt >= policy.retries:
+                    raise
+                delay = self.limiter.backoff(host, attempt)
+                if self.limiter.clock() + delay > deadline:
+                    metrics.inc("upstream_retry_budget_exhausted_total", host=host)
+                    raise
+                metrics.inc("upstream_retries_total", host=host, reason="connection")
+                logger.debug("Connection to %s failed; retrying in %.2fs", host, delay)
+            else:
+                if response.status_code not in policy.retry_statuses:
+                    bucket.reward()
+                    return response
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                if attempt >= policy.retries or (retry_after or 0) > policy.max_retry_after:
+                    return response
+                delay = self.limiter.backoff(host, attempt, retry_after)
+                if response.status_code in _THROTTLE_STATUSES or retry_after is not None:
+                    bucket.penalise(delay)
+                if self.limiter.clock() + delay > deadline:
+                    metrics.inc("upstream_retry_budget_exhausted_total", host=host)
+                    return response
+                metrics.inc("upstream_retries_total", host=host, reason=response.status_code)
+                logger.debug("%s returned %s; retrying in %.2fs", host, response.status_code, delay)
+                response.close()
+            self.limiter.sleep(delay)
+            attempt += 1
+
+
+_limiter_lock = threading.Lock()
+_limiter: Optional[HostRateLimiter] = None
+
+
+def get_rate_limiter() -> HostRateLimiter:
+    """Return the process-wide limiter, creating it on first use.
+
+    ``EARNINGS_HOST_RATE_PER_SECOND`` and ``EARNINGS_HTTP_RETRIES`` override
+    the rate and retry count for hosts without a dedicated policy.
+    """
+
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            default = HostPolicy()
+            raw_rate = os.environ.get("EARNINGS_HOST_RATE_PER_SECOND", "").strip()
+            if raw_rate:
+                try:
+                    default = replace(default, rate=float(raw_rate))
+                except ValueError:
+                    logger.warning("Ignoring invalid EARNINGS_HOST_RATE_PER_SECOND=%r", raw_rate)
+            raw_retries = os.environ.get("EARNINGS_HTTP_RETRIES", "").strip()
+            if raw_retries:
+                try:
+                    default = replace(default, retries=int(raw_retries))
+                except ValueError:
+                    logger.warning("Ignoring invalid EARNINGS_HTTP_RETRIES=%r", raw_retries)
+            _limiter = HostRateLimiter(default_policy=default)
+        return _limiter
@@ -0,0 +1,92 @@
+"""Compact in-memory representations of earnings listings."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, fields, replace
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Union
+
+IR_SOURCE = "investor_relations"
+AGGREGATOR_SOURCE = "aggregator"
+
+
+class NasdaqRow(NamedTuple):
+    """One row of the Nasdaq calendar; persisted as a JSON array."""
+
+    symbol: str
+    company: str
+    time: str
+    eps: Optional[str] = None
+    eps_forecast: Optional[str] = None
+    fiscal_quarter: Optional[str] = None
+
+    @classmethod
+    def from_json(cls, item: object) -> Optional["NasdaqRow"]:
+        """Rebuild a row persisted as an array (or as an object by older releases)."""
+
+        if isinstance(item, Mapping):
+            item = [item.get(name) for name in cls._fields]
+        if not isinstance(item, (list, tuple)) or len(item) != len(cls._fields) or not item[0]:
+            return None
+        return cls(*item)
+
+
+@dataclass(slots=True)
+class EarningsRecord:
+    """One company's earnings date as served by the API.
+
+    Records stay in this form through the scraper, the build aggregation and
+    the spreadsheet writers; :meth:`to_dict` produces the JSON object at the
+    API boundary. ``get`` and item access mirror the dict the record becomes,
+    so serialisers accept either.
+    """
+
+    company: str
+    symbol: str
+    date: str
+    bmo_amc: str
+    source: str
+    nasdaq_time_label: Optional[str] = None
+    yahoo_time_label: Optional[str] = None
+    ir_time_label: Optional[str] = None
+    ir_source_url: Optional[str] = None
+    sector: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Optional[str]]:
+        data: Dict[str, Optional[str]] = {
+            "company": self.company,
+            "symbol": self.symbol,
+            "date": self.date,
+            "bmo_amc": self.bmo_amc,
+            "nasdaq_time_label": self.nasdaq_time_label,
+            "yahoo_time_label": self.yahoo_time_label,
+        }
+        if self.source == IR_SOURCE:
+            data["ir_time_label"] = self.ir_time_label
+            data["ir_source_url"] = self.ir_source_url
+        data["source"] = self.source
+        if self.sector is not None:
+            data["sector"] = self.sector
+        return data
+
+    def with_sector(self, sector: str) -> "EarningsRecord":
+        return replace(self, sector=sector)
+
+    def get(self, key: str, default=None):
+        value = getattr(self, key, None) if key in _FIELD_NAMES else None
+        return default if value is None else value
+
+    def __getitem__(self, key: str):
+        if key not in _FIELD_NAMES:
+            raise KeyError(key)
+        return getattr(self, key)
+
+
+_FIELD_NAMES = frozenset(field.name for field in fields(EarningsRecord))
+
+RecordLike = Union[EarningsRecord, Mapping[str, Optional[str]]]
+
+
+def records_to_dicts(records: Iterable[RecordLike]) -> List[Mapping[str, Optional[str]]]:
+    """Return JSON-ready objects for ``records`` (dicts pass through unchanged)."""
+
+    return [record.to_dict() if isinstance(record, EarningsRecord) else record for record in records]
@@ -0,0 +1,95 @@
+"""In-process scheduler that recomputes cached responses before they expire."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from datetime import timedelta
+from typing import Callable, Generic, Hashable, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+
+
+class RefreshScheduler(Generic[K]):
+    """Periodically refresh a set of cache keys on a background thread.
+
+    Every ``interval`` the ``targets`` callable lists the keys worth keeping
+    warm and ``refresh`` recomputes them in one batch. Request handlers that
+    serve a stale value call :meth:`trigger` to have that key refreshed as soon
+    as possible; repeated triggers for a key already queued are coalesced.
+    Failures are logged and leave the previous values in place.
+    """
+
+    def __init__(
+        self,
+        *,
+        interval: timedelta,
+        targets: Callable[[], List[K]],
+        refresh: Callable[[List[K]], None],
+    ) -> None:
+        self.interval = interval
+        self._targets = targets
+        self._refresh = refresh
+        self._condition = threading.Condition()
+        self._pending: List[K] = []
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        with self._condition:
+            if self.running:
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="response-refresh", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def trigger(self, key: K) -> None:
+        """Ask for ``key`` to be refreshed ahead of the next scheduled pass."""
+
+        with self._condition:
+            if key not in self._pending:
+                self._pending.append(key)
+                self._condition.notify_all()
+
+    def run_once(self) -> None:
+        """Refresh every target now (used by the background loop and by tests)."""
+
+        self._run_batch(list(self._targets()))
+
+    def _run_batch(self, keys: List[K]) -> None:
+        if not keys:
+            return
+        try:
+            self._refresh(keys)
+        except Exception:
+            logger.exception("Background refresh of %d key(s) failed", len(keys))
+
+    def _run(self) -> None:
+        deadline = 0.0
+        while True:
+            with self._condition:
+                while not self._stopping and not self._pending and time.monotonic() < deadline:
+                    self._condition.wait(deadline - time.monotonic())
+                if self._stopping:
+                    return
+                pending, self._pending = self._pending, []
+            if pending:
+                self._run_batch(pending)
+                continue
+            self.run_once()
+            deadline = time.monotonic() + self.interval.total_seconds()
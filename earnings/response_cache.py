@@ -0,0 +1,116 @@
+"""Bounded, thread-safe LRU cache for computed API responses."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Dict, Hashable, Optional
+
+
+@dataclass
+class _Entry:
+    data: object
+    size: int
+    expires_at: Optional[float]
+
+
+def estimate_size(data: object) -> int:
+    """Approximate the memory held by a JSON-like payload by its serialised length."""
+
+    return len(json.dumps(data, default=str, separators=(",", ":")))
+
+
+class ResponseCache:
+    """LRU cache bounded by the estimated byte size of its entries.
+
+    Each entry carries its own TTL; ``ttl=None`` keeps it until it is evicted
+    to make room. Expired entries are misses for :meth:`get` but stay available
+    to :meth:`get_stale` until space is needed; they are the first to go then,
+    so they never pin memory.
+    """
+
+    def __init__(self, *, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.stale_hits = 0
+
+    def get(self, key: Hashable):
+        """Return the cached value for ``key`` or ``None`` when missing or expired."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.data
+
+    def get_stale(self, key: Hashable):
+        """Return the value for ``key`` even if it has expired, or ``None`` when absent."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            self.stale_hits += 1
+            return entry.data
+
+    def set(self, key: Hashable, data, *, ttl: Optional[timedelta]) -> None:
+        """Store ``data`` under ``key``; entries larger than the whole cache are skipped."""
+
+        size = estimate_size(data)
+        expires_at = None if ttl is None else time.monotonic() + ttl.total_seconds()
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if size > self.max_bytes:
+                return
+            self._make_room(size)
+            self._entries[key] = _Entry(data=data, size=size, expires_at=expires_at)
+            self._bytes += size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "maxBytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "staleHits": self.stale_hits,
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def _make_room(self, size: int) -> None:
+        if self._bytes + size <= self.max_bytes:
+            return
+        now = time.monotonic()
+        for key in [k for k, e in self._entries.items() if e.expires_at is not None and e.expires_at <= now]:
+            self._remove(key)
+        while self._entries and self._bytes + size > self.max_bytes:
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.evictions += 1
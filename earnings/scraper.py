@@ -2,20 +2,33 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import re
 import threading
+import time
 from datetime import date, datetime, timedelta
-from typing import Dict, Iterable, List, Optional, Set, Tuple
+from typing import Callable, Dict, Hashable, List, Optional, Set, Tuple, TypeVar
 
 import requests
 from bs4 import BeautifulSoup
 
-from .ir_scraper import InvestorRelationsEvent, fetch_investor_relations_events
+from .cache import get_persistent_cache
+from .fetch_engine import FetchEngine, get_engine, run_sync
+from .ir_scraper import InvestorRelationsEvent, fetch_investor_relations_events_async
+from .metrics import metrics
+from .records import AGGREGATOR_SOURCE, IR_SOURCE, EarningsRecord, NasdaqRow
+from .trading_calendar import group_by_week, trading_days
+from .urls import host_of
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 _NASDAQ_URL = "https://api.nasdaq.com/api/calendar/earnings"
 _YAHOO_URL = "https://finance.yahoo.com/calendar/earnings"
+_NASDAQ_HOST = host_of(_NASDAQ_URL)
+_YAHOO_HOST = host_of(_YAHOO_URL)
 
 _DEFAULT_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -24,8 +37,15 @@ _DEFAULT_HEADERS = {
 }
 
 _AGGREGATOR_CACHE_TTL = timedelta(minutes=30)
+_YAHOO_PAGE_SIZE = 100
+_YAHOO_MAX_PAGES = 25
+_YAHOO_DATE_PATTERN = re.compile(r"[A-Z][a-z]{2} \d{1,2}, \d{4}")
+# Cleared the first time Yahoo serves a range listing without per-row dates.
+_yahoo_range_supported = True
 _nasdaq_cache: Dict[date, Dict[str, object]] = {}
 _yahoo_cache: Dict[date, Dict[str, object]] = {}
+# Weeks whose range query failed, mapped to when it may be tried again; guarded by _yahoo_lock.
+_yahoo_failed_weeks: Dict[Tuple[date, ...], datetime] = {}
 _nasdaq_lock = threading.Lock()
 _yahoo_lock = threading.Lock()
 
@@ -34,11 +54,53 @@ class EarningsScrapeError(RuntimeError):
     """Raised when one of the source scrapers fails irrecoverably."""
 
 
-def _daterange(start: date, end: date) -> Iterable[date]:
-    current = start
-    while current <= end:
-        yield current
-        current += timedelta(days=1)
+class _InflightCall:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class _SingleFlight:
+    """Coalesce concurrent calls for the same key so only one of them does the work.
+
+    The first caller for a key runs ``fn``; callers arriving while it is in
+    flight block until it finishes and share its result (or its exception).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _InflightCall] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _InflightCall()
+                self._calls[key] = call
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[return-value]
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result
+
+
+_inflight = _SingleFlight()
 
 
 def _normalise_call_window(label: Optional[str]) -> str:
@@ -61,16 +123,26 @@ def _normalise_call_window(label: Optional[str]) -> str:
     return mapping.get(normalised, normalised)
 
 
-def _request_nasdaq_day(session: requests.Session, day: date) -> List[dict]:
+def _request_nasdaq_day(session: requests.Session, day: date) -> List[NasdaqRow]:
     date_str = day.isoformat()
+    started = time.perf_counter()
     try:
         response = session.get(_NASDAQ_URL, params={"date": date_str}, timeout=20)
     except requests.RequestException as exc:
+        metrics.inc("upstream_requests_total", source="nasdaq", outcome="error")
         raise EarningsScrapeError(f"Nasdaq request failed for {date_str}") from exc
+    metrics.observe("upstream_request_seconds", time.perf_counter() - started, source="nasdaq")
+    metrics.inc("upstream_requests_total", source="nasdaq", outcome=response.status_code)
+    metrics.inc("upstream_bytes_total", len(response.content), source="nasdaq")
 
     if response.status_code != 200:
         raise EarningsScrapeError(f"Nasdaq returned {response.status_code} for {date_str}")
 
+    with metrics.timer("parse_seconds", source="nasdaq"):
+        return _parse_nasdaq_payload(response, date_str)
+
+
+def _parse_nasdaq_payload(response: requests.Response, date_str: str) -> List[NasdaqRow]:
     try:
         payload = response.json()
     except ValueError as exc:
@@ -86,20 +158,20 @@ def _request_nasdaq_day(session: requests.Session, day: date) -> List[dict]:
         return []
 
     rows = data.get("rows") or []
-    parsed: List[dict] = []
+    parsed: List[NasdaqRow] = []
     for row in rows or []:
         symbol = (row.get("symbol") or "").strip().upper()
         if not symbol:
             continue
         parsed.append(
-            {
-                "symbol": symbol,
-                "company": (row.get("name") or "").strip(),
-                "time": (row.get("time") or "").strip(),
-                "eps": row.get("eps"),
-                "eps_forecast": row.get("epsForecast"),
-                "fiscal_quarter": row.get("fiscalQuarterEnding"),
-            }
+            NasdaqRow(
+                symbol=symbol,
+                company=(row.get("name") or "").strip(),
+                time=(row.get("time") or "").strip(),
+                eps=row.get("eps"),
+                eps_forecast=row.get("epsForecast"),
+                fiscal_quarter=row.get("fiscalQuarterEnding"),
+            )
         )
     return parsed
 
@@ -129,22 +201,77 @@ def _store_cache_entry(
         }
 
 
+def _get_yahoo(session: requests.Session, params: Dict[str, object], label: object) -> Optional[requests.Response]:
+    started = time.perf_counter()
+    try:
+        response = session.get(_YAHOO_URL, params=params, timeout=20)
+    except requests.RequestException as exc:
+        metrics.inc("upstream_requests_total", source="yahoo", outcome="error")
+        logger.warning("Yahoo request failed for %s: %s", label, exc)
+        return None
+    metrics.observe("upstream_request_seconds", time.perf_counter() - started, source="yahoo")
+    metrics.inc("upstream_requests_total", source="yahoo", outcome=response.status_code)
+    metrics.inc("upstream_bytes_total", len(response.content), source="yahoo")
+
+    if response.status_code != 200:
+        logger.warning("Yahoo returned status %s for %s", response.status_code, label)
+        return None
+    return response
+
+
 def _request_yahoo_day(
     session: requests.Session,
     day: date,
     tickers: Set[str],
 ) -> Dict[str, str]:
-    params = {"day": day.isoformat()}
-    try:
-        response = session.get(_YAHOO_URL, params=params, timeout=20)
-    except requests.RequestException as exc:
-        logger.warning("Yahoo request failed for %s: %s", day, exc)
+    response = _get_yahoo(session, {"day": day.isoformat()}, day)
+    if response is None:
         return {}
 
-    if response.status_code != 200:
-        logger.warning("Yahoo returned status %s for %s", response.status_code, day)
-        return {}
+    with metrics.timer("parse_seconds", source="yahoo"):
+        return _parse_yahoo_table(response, day, tickers)
+
+
+def _request_yahoo_range(session: requests.Session, days: List[date]) -> Optional[Dict[date, Dict[str, str]]]:
+    """Fetch Yahoo's listings for every day in ``days`` from one paginated range query.
+
+    Returns ``None`` when the range cannot be attributed to days (a failed
+    page, no table, or a layout without the earnings date column) so callers
+    fall back to one request per day.
+    """
+
+    global _yahoo_range_supported
+    label = f"{days[0]}..{days[-1]}"
+    lookups: Dict[date, Dict[str, str]] = {day: {} for day in days}
+    for page in range(_YAHOO_MAX_PAGES):
+        params = {
+            "from": days[0].isoformat(),
+            "to": days[-1].isoformat(),
+            "offset": page * _YAHOO_PAGE_SIZE,
+            "size": _YAHOO_PAGE_SIZE,
+        }
+        response = _get_yahoo(session, params, label)
+        if response is None:
+            return None
+        try:
+            with metrics.timer("parse_seconds", source="yahoo"):
+                rows = _parse_yahoo_range_table(response)
+        except _YahooLayoutError:
+            logger.info("Yahoo range listing has no earnings date column; fetching Yahoo day by day")
+            _yahoo_range_supported = False
+            return None
+        if rows is None:
+            return None
+        for day, symbol, call_time in rows:
+            if day in lookups:
+                lookups[day][symbol] = call_time
+        if len(rows) < _YAHOO_PAGE_SIZE:
+            return lookups
+    logger.warning("Yahoo range %s exceeded %d pages; fetching it day by day", label, _YAHOO_MAX_PAGES)
+    return None
+
 
+def _parse_yahoo_table(response: requests.Response, day: date, tickers: Set[str]) -> Dict[str, str]:
     soup = BeautifulSoup(response.text, "lxml")
     table = soup.find("table")
     if not table:
@@ -164,33 +291,194 @@ def _request_yahoo_day(
     return lookup
 
 
-def _fetch_nasdaq_day(session: requests.Session, day: date) -> List[dict]:
+class _YahooLayoutError(ValueError):
+    """The range listing does not say which day each row belongs to."""
+
+
+def _parse_yahoo_range_table(response: requests.Response) -> Optional[List[Tuple[date, str, str]]]:
+    """Return ``(day, symbol, call window)`` rows from a range listing, or ``None`` without a table."""
+
+    soup = BeautifulSoup(response.text, "lxml")
+    table = soup.find("table")
+    if not table:
+        return None
+    headers = [cell.get_text(" ", strip=True).lower() for cell in table.select("thead th")]
+    date_column = next((index for index, header in enumerate(headers) if "earnings date" in header), None)
+    if date_column is None:
+        raise _YahooLayoutError("no earnings date column")
+    time_column = next((index for index, header in enumerate(headers) if "call time" in header), 3)
+
+    rows: List[Tuple[date, str, str]] = []
+    for row in table.select("tbody tr"):
+        cells = row.find_all("td")
+        if len(cells) <= max(date_column, time_column):
+            continue
+        match = _YAHOO_DATE_PATTERN.search(cells[date_column].get_text(" ", strip=True))
+        if not match:
+            continue
+        try:
+            day = datetime.strptime(match.group(0), "%b %d, %Y").date()
+        except ValueError:
+            continue
+        symbol = cells[0].get_text(strip=True).upper()
+        rows.append((day, symbol, _normalise_call_window(cells[time_column].get_text(strip=True).upper())))
+    return rows
+
+
+def _load_persisted(source: str, day: date):
+    store = get_persistent_cache()
+    if store is None:
+        return None
+    return store.get_day(source, day)
+
+
+def _persist(source: str, day: date, data) -> None:
+    store = get_persistent_cache()
+    if store is not None:
+        store.set_day(source, day, data)
+
+
+def _load_nasdaq_day(session: requests.Session, day: date) -> List[NasdaqRow]:
+    # Re-check memory: a previous leader may have filled it while we queued.
     cached = _get_cached_entry(_nasdaq_cache, _nasdaq_lock, day)
     if cached is not None:
         return cached  # type: ignore[return-value]
+    persisted = _load_persisted("nasdaq", day)
+    if isinstance(persisted, list):
+        metrics.inc("cache_lookups_total", source="nasdaq", layer="persistent", result="hit")
+        rows = [row for row in map(NasdaqRow.from_json, persisted) if row is not None]
+        _store_cache_entry(_nasdaq_cache, _nasdaq_lock, day, rows)
+        return rows
+    metrics.inc("cache_lookups_total", source="nasdaq", layer="persistent", result="miss")
     data = _request_nasdaq_day(session, day)
     _store_cache_entry(_nasdaq_cache, _nasdaq_lock, day, data)
+    _persist("nasdaq", day, data)
     return data
 
 
+def _fetch_nasdaq_day(session: requests.Session, day: date) -> List[NasdaqRow]:
+    cached = _get_cached_entry(_nasdaq_cache, _nasdaq_lock, day)
+    if cached is not None:
+        metrics.inc("cache_lookups_total", source="nasdaq", layer="memory", result="hit")
+        return cached  # type: ignore[return-value]
+    metrics.inc("cache_lookups_total", source="nasdaq", layer="memory", result="miss")
+    return _inflight.do(("nasdaq", day), lambda: _load_nasdaq_day(session, day))
+
+
+def _load_yahoo_day(session: requests.Session, day: date) -> Dict[str, str]:
+    cached = _get_cached_entry(_yahoo_cache, _yahoo_lock, day)
+    if isinstance(cached, dict):
+        return cached
+    persisted = _load_persisted("yahoo", day)
+    if isinstance(persisted, dict):
+        metrics.inc("cache_lookups_total", source="yahoo", layer="persistent", result="hit")
+        _store_cache_entry(_yahoo_cache, _yahoo_lock, day, persisted)
+        return persisted
+    metrics.inc("cache_lookups_total", source="yahoo", layer="persistent", result="miss")
+    lookup_all = _request_yahoo_day(session, day, set())
+    _store_cache_entry(_yahoo_cache, _yahoo_lock, day, lookup_all)
+    _persist("yahoo", day, lookup_all)
+    return lookup_all
+
+
+def _yahoo_week_failed(week: Tuple[date, ...]) -> bool:
+    with _yahoo_lock:
+        retry_at = _yahoo_failed_weeks.get(week)
+        if retry_at is None:
+            return False
+        if retry_at > datetime.utcnow():
+            return True
+        del _yahoo_failed_weeks[week]
+        return False
+
+
+def _mark_yahoo_week_failed(week: Tuple[date, ...]) -> None:
+    with _yahoo_lock:
+        _yahoo_failed_weeks[week] = datetime.utcnow() + _AGGREGATOR_CACHE_TTL
+
+
+def _load_yahoo_week(session: requests.Session, days: Tuple[date, ...]) -> Dict[date, Dict[str, str]]:
+    """Return Yahoo lookups for ``days``, fetching every uncached one with a single range query.
+
+    Days the range query could not cover are left out; callers fetch those
+    individually. A failed range query is remembered for the week so its
+    remaining days go straight to the per-day path instead of repeating it.
+    """
+
+    found: Dict[date, Dict[str, str]] = {}
+    missing: List[date] = []
+    for day in days:
+        cached = _get_cached_entry(_yahoo_cache, _yahoo_lock, day)
+        if isinstance(cached, dict):
+            found[day] = cached
+            continue
+        persisted = _load_persisted("yahoo", day)
+        if isinstance(persisted, dict):
+            metrics.inc("cache_lookups_total", source="yahoo", layer="persistent", result="hit")
+            _store_cache_entry(_yahoo_cache, _yahoo_lock, day, persisted)
+            found[day] = persisted
+            continue
+        metrics.inc("cache_lookups_total", source="yahoo", layer="persistent", result="miss")
+        missing.append(day)
+
+    if len(missing) > 1 and _yahoo_range_supported:
+        fetched = _request_yahoo_range(session, missing)
+        if fetched is None:
+            _mark_yahoo_week_failed(days)
+        for day, lookup in (fetched or {}).items():
+            _store_cache_entry(_yahoo_cache, _yahoo_lock, day, lookup)
+            _persist("yahoo", day, lookup)
+            found[day] = lookup
+    return found
+
+
 def _fetch_yahoo_day(
     session: requests.Session,
     day: date,
     tickers: Set[str],
+    week: Tuple[date, ...] = (),
 ) -> Dict[str, str]:
-    cached = _get_cached_entry(_yahoo_cache, _yahoo_lock, day)
-    if isinstance(cached, dict):
-        if not tickers:
-            return dict(cached)
-        return {symbol: cached[symbol] for symbol in tickers if symbol in cached}
-    lookup_all = _request_yahoo_day(session, day, set())
-    _store_cache_entry(_yahoo_cache, _yahoo_lock, day, lookup_all)
+    lookup_all = _get_cached_entry(_yahoo_cache, _yahoo_lock, day)
+    hit = isinstance(lookup_all, dict)
+    metrics.inc("cache_lookups_total", source="yahoo", layer="memory", result="hit" if hit else "miss")
+    if not hit:
+        lookup_all = None
+        if len(week) > 1 and _yahoo_range_supported and not _yahoo_week_failed(week):
+            # Every day of the week waits on one leader that fetches the whole week.
+            lookup_all = _inflight.do(("yahoo-week", week), lambda: _load_yahoo_week(session, week)).get(day)
+        if lookup_all is None:
+            lookup_all = _inflight.do(("yahoo", day), lambda: _load_yahoo_day(session, day))
     if not tickers:
-        return lookup_all
-    return {symbol: value for symbol, value in lookup_all.items() if symbol in tickers}
+        return dict(lookup_all)
+    return {symbol: lookup_all[symbol] for symbol in tickers if symbol in lookup_all}
 
 
-def fetch_weekly_earnings(
+async def _fetch_day(
+    engine: FetchEngine,
+    session: requests.Session,
+    day: date,
+    tickers: Set[str],
+    week: Tuple[date, ...] = (),
+) -> Tuple[Dict[str, str], Optional[List[NasdaqRow]]]:
+    yahoo_result, nasdaq_result = await asyncio.gather(
+        engine.call(_YAHOO_HOST, _fetch_yahoo_day, session, day, tickers, week),
+        engine.call(_NASDAQ_HOST, _fetch_nasdaq_day, session, day),
+        return_exceptions=True,
+    )
+    if isinstance(yahoo_result, asyncio.TimeoutError):
+        logger.warning("Yahoo request timed out for %s", day)
+        yahoo_result = {}
+    elif isinstance(yahoo_result, BaseException):
+        raise yahoo_result
+    if isinstance(nasdaq_result, (EarningsScrapeError, asyncio.TimeoutError)):
+        logger.warning("Skipping Nasdaq data for %s: %s", day, nasdaq_result or "timed out")
+        nasdaq_result = None
+    elif isinstance(nasdaq_result, BaseException):
+        raise nasdaq_result
+    return yahoo_result, nasdaq_result
+
+
+async def fetch_weekly_earnings_async(
     *,
     start: date,
     end: date,
@@ -198,110 +486,199 @@ def fetch_weekly_earnings(
     companies: Optional[List[Dict[str, str]]] = None,
     ir_events: Optional[Dict[str, InvestorRelationsEvent]] = None,
     session: Optional[requests.Session] = None,
-) -> List[dict]:
-    """Fetch earnings for the provided tickers between ``start`` and ``end`` inclusive."""
+    engine: Optional[FetchEngine] = None,
+) -> List[EarningsRecord]:
+    """Fetch earnings for the provided tickers between ``start`` and ``end`` inclusive.
+
+    Only NYSE trading days are requested, concurrently through the fetch
+    engine; Yahoo listings are fetched a week at a time where possible.
+    """
 
     if start > end:
         raise ValueError("start date must be before end date")
 
-    owns_session = False
+    engine = engine or get_engine()
     if session is None:
-        session = requests.Session()
-        owns_session = True
+        session = engine.session
 
     session.headers.update(_DEFAULT_HEADERS)
 
     tickers = set(ticker_to_name.keys())
-    results: List[dict] = []
+    results: List[EarningsRecord] = []
     seen: Set[Tuple[str, date]] = set()
-    lookup: Dict[Tuple[str, date], dict] = {}
+    lookup: Dict[Tuple[str, date], EarningsRecord] = {}
     today = date.today()
 
-    try:
-        ir_lookup: Dict[str, InvestorRelationsEvent] = {}
-        if ir_events is not None:
-            ir_lookup = dict(ir_events)
-        elif companies:
-            try:
-                ir_lookup = fetch_investor_relations_events(
-                    session,
-                    companies=companies,
-                    today=today,
-                )
-            except Exception as exc:  # pragma: no cover - defensive
-                logger.warning("Investor relations fetch failed: %s", exc)
-                ir_lookup = {}
-
-        for symbol, event in (ir_lookup or {}).items():
-            if event.date < today:
-                continue
+    ir_lookup: Dict[str, InvestorRelationsEvent] = {}
+    if ir_events is not None:
+        ir_lookup = dict(ir_events)
+    elif companies:
+        try:
+            ir_lookup = await fetch_investor_relations_events_async(
+                session,
+                companies=companies,
+                today=today,
+                engine=engine,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning("Investor relations fetch failed: %s", exc)
+            ir_lookup = {}
+
+    for symbol, event in (ir_lookup or {}).items():
+        if event.date < today:
+            continue
+        if symbol not in tickers:
+            continue
+        if not (start <= event.date <= end):
+            continue
+        key = (symbol, event.date)
+        seen.add(key)
+        normalised_time = _normalise_call_window(event.time_label)
+        entry = EarningsRecord(
+            company=event.company,
+            symbol=symbol,
+            date=event.date.isoformat(),
+            bmo_amc=normalised_time,
+            source=IR_SOURCE,
+            ir_time_label=event.time_label,
+            ir_source_url=event.source_url,
+        )
+        results.append(entry)
+        lookup[key] = entry
+
+    weeks = [tuple(week) for week in group_by_week(trading_days(start, end))]
+    days = [day for week in weeks for day in week]
+    day_payloads = await asyncio.gather(
+        *(_fetch_day(engine, session, day, tickers, week) for week in weeks for day in week)
+    )
+
+    for day, (yahoo_lookup, nasdaq_rows) in zip(days, day_payloads):
+        if nasdaq_rows is None:
+            continue
+
+        for row in nasdaq_rows:
+            symbol = row.symbol
             if symbol not in tickers:
                 continue
-            if not (start <= event.date <= end):
+            key = (symbol, day)
+            source_call = yahoo_lookup.get(symbol)
+            fallback_call = _normalise_call_window(row.time)
+
+            existing = lookup.get(key)
+            if existing:
+                if source_call:
+                    existing.yahoo_time_label = source_call
+                    if existing.bmo_amc in (None, "", "TBD"):
+                        existing.bmo_amc = source_call
+                if row.time:
+                    existing.nasdaq_time_label = row.time
+                    if existing.bmo_amc in (None, "", "TBD"):
+                        existing.bmo_amc = fallback_call
+                continue
+
+            if key in seen:
                 continue
-            key = (symbol, event.date)
+
             seen.add(key)
-            normalised_time = _normalise_call_window(event.time_label)
-            entry = {
-                "company": event.company,
-                "symbol": symbol,
-                "date": event.date.isoformat(),
-                "bmo_amc": normalised_time,
-                "nasdaq_time_label": None,
-                "yahoo_time_label": None,
-                "ir_time_label": event.time_label,
-                "ir_source_url": event.source_url,
-                "source": "investor_relations",
-            }
+            entry = EarningsRecord(
+                company=ticker_to_name.get(symbol, row.company or symbol),
+                symbol=symbol,
+                date=day.isoformat(),
+                bmo_amc=source_call or fallback_call,
+                source=AGGREGATOR_SOURCE,
+                nasdaq_time_label=row.time,
+                yahoo_time_label=source_call,
+            )
             results.append(entry)
             lookup[key] = entry
 
-        for day in _daterange(start, end):
-            yahoo_lookup = _fetch_yahoo_day(session, day, tickers)
-            try:
-                nasdaq_rows = _fetch_nasdaq_day(session, day)
-            except EarningsScrapeError as exc:
-                logger.warning("Skipping Nasdaq data for %s: %s", day, exc)
-                continue
+    results.sort(key=lambda item: (item.date, item.company))
+    return results
+
+
+def fetch_weekly_earnings(
+    *,
+    start: date,
+    end: date,
+    ticker_to_name: Dict[str, str],
+    companies: Optional[List[Dict[str, str]]] = None,
+    ir_events: Optional[Dict[str, InvestorRelationsEvent]] = None,
+    session: Optional[requests.Session] = None,
+) -> List[EarningsRecord]:
+    """Fetch earnings for the provided tickers between ``start`` and ``end`` inclusive."""
+
+    return run_sync(
+        fetch_weekly_earnings_async(
+            start=start,
+            end=end,
+            ticker_to_name=ticker_to_name,
+            companies=companies,
+            ir_events=ir_events,
+            session=session,
+        )
+    )
 
-            for row in nasdaq_rows:
-                symbol = row["symbol"]
-                if symbol not in tickers:
-                    continue
-                key = (symbol, day)
-                source_call = yahoo_lookup.get(symbol)
-                fallback_call = _normalise_call_window(row.get("time"))
-
-                existing = lookup.get(key)
-                if existing:
-                    if source_call:
-                        existing["yahoo_time_label"] = source_call
-                        if existing.get("bmo_amc") in (None, "", "TBD"):
-                            existing["bmo_amc"] = source_call
-                    if row.get("time"):
-                        existing["nasdaq_time_label"] = row.get("time")
-                        if existing.get("bmo_amc") in (None, "", "TBD"):
-                            existing["bmo_amc"] = fallback_call
-                    continue
-
-                if key in seen:
-                    continue
-
-                seen.add(key)
-                entry = {
-                    "company": ticker_to_name.get(symbol, row.get("company") or symbol),
-                    "symbol": symbol,
-                    "date": day.isoformat(),
-                    "bmo_amc": source_call or fallback_call,
-                    "nasdaq_time_label": row.get("time"),
-                    "yahoo_time_label": source_call,
-                    "source": "aggregator",
-                }
-                results.append(entry)
-                lookup[key] = entry
-
-        results.sort(key=lambda item: (item["date"], item["company"]))
-        return results
-    finally:
-        if owns_session:
-            session.close()
+
+async def fetch_sector_earnings_async(
+    *,
+    start: date,
+    end: date,
+    sector_companies: Dict[str, List[Dict[str, str]]],
+    ir_events: Optional[Dict[str, InvestorRelationsEvent]] = None,
+    session: Optional[requests.Session] = None,
+    engine: Optional[FetchEngine] = None,
+) -> Dict[str, List[EarningsRecord]]:
+    """Fetch earnings for every sector in one pass and partition the records by sector.
+
+    Each day's Nasdaq and Yahoo payloads are fetched and matched once against a
+    ticker table covering the whole universe, instead of once per sector.
+    """
+
+    ticker_to_name: Dict[str, str] = {}
+    ticker_to_sector: Dict[str, str] = {}
+    companies: List[Dict[str, str]] = []
+    for sector, entries in sector_companies.items():
+        companies.extend(entries)
+        for entry in entries:
+            ticker = entry.get("ticker")
+            if ticker:
+                ticker_to_name[ticker] = entry["name"]
+                ticker_to_sector.setdefault(ticker, sector)
+
+    records = await fetch_weekly_earnings_async(
+        start=start,
+        end=end,
+        ticker_to_name=ticker_to_name,
+        companies=companies,
+        ir_events=ir_events,
+        session=session,
+        engine=engine,
+    )
+
+    partitions: Dict[str, List[EarningsRecord]] = {sector: [] for sector in sector_companies}
+    for record in records:
+        sector = ticker_to_sector.get(record.symbol)
+        if sector is not None:
+            partitions[sector].append(record)
+    return partitions
+
+
+def fetch_sector_earnings(
+    *,
+    start: date,
+    end: date,
+    sector_companies: Dict[str, List[Dict[str, str]]],
+    ir_events: Optional[Dict[str, InvestorRelationsEvent]] = None,
+    session: Optional[requests.Session] = None,
+) -> Dict[str, List[EarningsRecord]]:
+    """Synchronous wrapper around :func:`fetch_sector_earnings_async`."""
+
+    return run_sync(
+        fetch_sector_earnings_async(
+            start=start,
+            end=end,
+            sector_companies=sector_companies,
+            ir_events=ir_events,
+            session=session,
+        )
+    )
@@ -0,0 +1,114 @@
+"""Process-wide HTTP session with connection pools sized for the scrapers."""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import threading
+from typing import Optional, Sequence
+
+import requests
+
+from .rate_limit import HostRateLimiter, RateLimitedAdapter, get_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_POOL_SIZE = 32
+# Idle per-host pools kept around; the IR crawl alone touches ~500 hosts.
+_DEFAULT_POOL_HOSTS = 64
+# Hosts hit on every request path get their own adapter so pools for them are
+# never evicted by the long tail of investor-relations sites.
+_PINNED_PREFIXES = ("https://api.nasdaq.com/", "https://finance.yahoo.com/")
+
+
+class SessionManager:
+    """Own the shared ``requests.Session`` and its adapters.
+
+    The session is created on first use and reused by every scraper, so
+    keep-alive connections (and their TLS sessions) survive across requests,
+    weeks and Flask requests. ``pool_size`` bounds the connections kept per
+    host and should be at least the number of concurrent workers, otherwise
+    surplus connections are opened and discarded on every burst. A forked
+    child gets a fresh session instead of sharing its parent's sockets.
+    """
+
+    def __init__(
+        self,
+        *,
+        pool_size: int = _DEFAULT_POOL_SIZE,
+        pool_hosts: int = _DEFAULT_POOL_HOSTS,
+        pinned_prefixes: Sequence[str] = _PINNED_PREFIXES,
+        limiter: Optional[HostRateLimiter] = None,
+    ) -> None:
+        self.pool_size = pool_size
+        self.pool_hosts = pool_hosts
+        self.pinned_prefixes = tuple(pinned_prefixes)
+        self._limiter = limiter
+        self._session: Optional[requests.Session] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _adapter(self, pool_hosts: int) -> RateLimitedAdapter:
+        return RateLimitedAdapter(
+            self._limiter or get_rate_limiter(),
+            pool_connections=pool_hosts,
+            pool_maxsize=self.pool_size,
+        )
+
+    def _create(self) -> requests.Session:
+        session = requests.Session()
+        shared = self._adapter(self.pool_hosts)
+        session.mount("https://", shared)
+        session.mount("http://", shared)
+        for prefix in self.pinned_prefixes:
+            session.mount(prefix, self._adapter(1))
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        with self._lock:
+            if self._session is None or self._pid != os.getpid():
+                self._session = self._create()
+                self._pid = os.getpid()
+            return self._session
+
+    def close(self) -> None:
+        """Close every pooled connection; the next access opens a new session."""
+
+        with self._lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+
+_manager_lock = threading.Lock()
+_manager: Optional[SessionManager] = None
+
+
+def get_session_manager() -> SessionManager:
+    """Return the process-wide session manager, creating it on first use.
+
+    ``EARNINGS_HTTP_POOL_SIZE`` overrides the connections kept per host. The
+    pools are closed when the interpreter exits.
+    """
+
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            pool_size = _DEFAULT_POOL_SIZE
+            raw_size = os.environ.get("EARNINGS_HTTP_POOL_SIZE", "").strip()
+            if raw_size:
+                try:
+                    pool_size = max(1, int(raw_size))
+                except ValueError:
+                    logger.warning("Ignoring invalid EARNINGS_HTTP_POOL_SIZE=%r", raw_size)
+            _manager = SessionManager(pool_size=pool_size)
+            atexit.register(_manager.close)
+        return _manager
+
+
+def get_session() -> requests.Session:
+    """Return the shared session (see :class:`SessionManager`)."""
+
+    return get_session_manager().session
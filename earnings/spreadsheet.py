@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import csv
+import zipfile
 from datetime import datetime
-from io import BytesIO, StringIO
-from typing import Iterable, Mapping
+from io import BytesIO
+from typing import IO, Iterable, Iterator, List, Optional, Union
+from xml.etree import ElementTree
+
+from .records import RecordLike
 
 
 def _format_date_label(date_str: str) -> str:
@@ -43,7 +47,7 @@ def _date_sort_key(value: str | None) -> tuple[int, str]:
         return (1, str(value))
 
 
-def _sort_records(records: Iterable[Mapping[str, str]]) -> list[Mapping[str, str]]:
+def _sort_records(records: Iterable[RecordLike]) -> list[RecordLike]:
     items = list(records)
     return sorted(
         items,
@@ -54,44 +58,156 @@ def _sort_records(records: Iterable[Mapping[str, str]]) -> list[Mapping[str, str
     )
 
 _OUTPUT_FIELDS = ["Company", "BMO/AMC", "Time", "Coverage", "Reporter"]
+_CHUNK_SIZE = 64 * 1024
+_XLSX_COLUMN_WIDTHS = [42, 10, 12, 18, 18]
+
 
+def iter_csv_rows(records: Iterable[RecordLike]) -> Iterator[dict]:
+    """Yield the output rows for ``records``, with a heading row before each day."""
 
-def build_csv_rows(records: Iterable[Mapping[str, str]]) -> list[dict]:
-    rows = []
     previous_date = None
     for record in _sort_records(records):
         current_date = record.get("date")
         if current_date and current_date != previous_date:
             # Insert a grouping row before the companies for the day.
-            rows.append(
-                {
-                    "Company": _format_date_label(current_date),
-                    "BMO/AMC": "",
-                    "Time": "",
-                    "Coverage": "",
-                    "Reporter": "",
-                }
-            )
-            previous_date = current_date
-        rows.append(
-            {
-                "Company": record.get("company", ""),
-                "BMO/AMC": _normalize_session_label(record.get("bmo_amc")),
-                "Time": record.get("time", ""),
-                "Coverage": record.get("coverage", ""),
-                "Reporter": record.get("reporter", ""),
+            yield {
+                "Company": _format_date_label(current_date),
+                "BMO/AMC": "",
+                "Time": "",
+                "Coverage": "",
+                "Reporter": "",
             }
-        )
-    return rows
+            previous_date = current_date
+        yield {
+            "Company": record.get("company", ""),
+            "BMO/AMC": _normalize_session_label(record.get("bmo_amc")),
+            "Time": record.get("time", ""),
+            "Coverage": record.get("coverage", ""),
+            "Reporter": record.get("reporter", ""),
+        }
+
+
+def build_csv_rows(records: Iterable[RecordLike]) -> list[dict]:
+    return list(iter_csv_rows(records))
+
+
+class _ChunkBuffer:
+    """File-like sink for ``csv.writer`` that hands out what was written in batches."""
 
+    def __init__(self) -> None:
+        self.parts: List[str] = []
+        self.size = 0
 
-def generate_csv_bytes(records: Iterable[Mapping[str, str]]) -> BytesIO:
-    buffer = StringIO()
+    def write(self, text: str) -> int:
+        self.parts.append(text)
+        self.size += len(text)
+        return len(text)
+
+    def take(self) -> str:
+        text = "".join(self.parts)
+        self.parts.clear()
+        self.size = 0
+        return text
+
+
+def iter_csv_chunks(records: Iterable[RecordLike], *, chunk_size: int = _CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield the CSV export for ``records`` as UTF-8 chunks, the first starting with a BOM.
+
+    Only the (already loaded) records are sorted; rows are formatted and
+    encoded one chunk at a time, so the complete file is never held in memory.
+    """
+
+    buffer = _ChunkBuffer()
     writer = csv.DictWriter(buffer, fieldnames=_OUTPUT_FIELDS, extrasaction="ignore")
     writer.writeheader()
-    for row in build_csv_rows(records):
+    prefix = "\ufeff"
+    for row in iter_csv_rows(records):
         writer.writerow(row)
-    binary = BytesIO()
-    binary.write(buffer.getvalue().encode("utf-8-sig"))
-    binary.seek(0)
-    return binary
+        if buffer.size >= chunk_size:
+            yield (prefix + buffer.take()).encode("utf-8")
+            prefix = ""
+    yield (prefix + buffer.take()).encode("utf-8")
+
+
+def generate_csv_bytes(records: Iterable[RecordLike]) -> BytesIO:
+    return BytesIO(b"".join(iter_csv_chunks(records)))
+
+
+def write_xlsx(
+    records: Iterable[RecordLike],
+    target: Union[str, IO[bytes]],
+    *,
+    title: str = "Earnings",
+    identifier: Optional[str] = None,
+) -> None:
+    """Write ``records`` as an XLSX workbook to ``target`` (a path or binary file).
+
+    The workbook is built in openpyxl's write-only mode, so rows are streamed
+    to disk as they are added. Each day gets a merged, bold heading row across
+    all columns and the column header row stays frozen while scrolling.
+    ``identifier`` is stored in the document properties (see
+    :func:`read_xlsx_identifier`).
+    """
+
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Font, PatternFill
+    from openpyxl.utils import get_column_letter
+
+    workbook = Workbook(write_only=True)
+    if identifier is not None:
+        workbook.properties.identifier = identifier
+    sheet = workbook.create_sheet(title=title)
+    for index, width in enumerate(_XLSX_COLUMN_WIDTHS, start=1):
+        sheet.column_dimensions[get_column_letter(index)].width = width
+    sheet.freeze_panes = "A2"
+
+    bold = Font(bold=True)
+    day_fill = PatternFill(fill_type="solid", start_color="FFDDEBF7", end_color="FFDDEBF7")
+    last_column = get_column_letter(len(_OUTPUT_FIELDS))
+
+    def _styled(value: str, *, fill: PatternFill | None = None) -> WriteOnlyCell:
+        cell = WriteOnlyCell(sheet, value=value)
+        cell.font = bold
+        if fill is not None:
+            cell.fill = fill
+            cell.alignment = Alignment(horizontal="left")
+        return cell
+
+    sheet.append([_styled(field) for field in _OUTPUT_FIELDS])
+    row_number = 1
+    previous_date = None
+    for record in _sort_records(records):
+        current_date = record.get("date")
+        if current_date and current_date != previous_date:
+            row_number += 1
+            sheet.append([_styled(_format_date_label(current_date), fill=day_fill)])
+            sheet.merged_cells.add(f"A{row_number}:{last_column}{row_number}")
+            previous_date = current_date
+        row_number += 1
+        sheet.append(
+            [
+                record.get("company", ""),
+                _normalize_session_label(record.get("bmo_amc")),
+                record.get("time", ""),
+                record.get("coverage", ""),
+                record.get("reporter", ""),
+            ]
+        )
+    workbook.save(target)
+
+
+def read_xlsx_identifier(path: str) -> Optional[str]:
+    """Return the identifier :func:`write_xlsx` stored in a workbook, or ``None``.
+
+    Only the document properties part is read, so this is cheap even for large
+    workbooks.
+    """
+
+    try:
+        with zipfile.ZipFile(path) as archive:
+            core = ElementTree.fromstring(archive.read("docProps/core.xml"))
+    except (OSError, KeyError, zipfile.BadZipFile, ElementTree.ParseError):
+        return None
+    node = core.find("{http://purl.org/dc/elements/1.1/}identifier")
+    return node.text if node is not None else None
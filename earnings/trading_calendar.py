@@ -0,0 +1,98 @@
+"""NYSE trading days, with the exchange's full-day holidays computed locally."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import FrozenSet, Iterable, List
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    first = date(year, month, 1)
+    return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+
+
+def _last_weekday(year: int, month: int, weekday: int) -> date:
+    following = date(year + month // 12, month % 12 + 1, 1)
+    last = following - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter(year: int) -> date:
+    # Anonymous Gregorian algorithm (Meeus/Jones/Butcher).
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7  # noqa: E741
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _observed(day: date) -> date:
+    """Saturday holidays are observed on Friday, Sunday holidays on Monday."""
+
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+@lru_cache(maxsize=None)
+def nyse_holidays(year: int) -> FrozenSet[date]:
+    """Return the dates in ``year`` the NYSE is closed for a full-day holiday.
+
+    One-off closures (national days of mourning, weather) are not predictable
+    and are not included; early closes are trading days.
+    """
+
+    holidays = {
+        _nth_weekday(year, 1, 0, 3),  # Martin Luther King Jr. Day
+        _nth_weekday(year, 2, 0, 3),  # Washington's Birthday
+        _easter(year) - timedelta(days=2),  # Good Friday
+        _last_weekday(year, 5, 0),  # Memorial Day
+        _observed(date(year, 7, 4)),
+        _nth_weekday(year, 9, 0, 1),  # Labor Day
+        _nth_weekday(year, 11, 3, 4),  # Thanksgiving
+        _observed(date(year, 12, 25)),
+    }
+    # NYSE does not move New Year's Day back into the previous year.
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        holidays.add(_observed(new_year))
+    if year >= 2022:
+        holidays.add(_observed(date(year, 6, 19)))  # Juneteenth
+    return frozenset(holidays)
+
+
+def is_trading_day(day: date) -> bool:
+    return day.weekday() < 5 and day not in nyse_holidays(day.year)
+
+
+def trading_days(start: date, end: date) -> List[date]:
+    """Return the NYSE trading days between ``start`` and ``end`` inclusive."""
+
+    days: List[date] = []
+    current = start
+    while current <= end:
+        if is_trading_day(current):
+            days.append(current)
+        current += timedelta(days=1)
+    return days
+
+
+def group_by_week(days: Iterable[date]) -> List[List[date]]:
+    """Split sorted ``days`` into runs that share a Monday-to-Sunday week."""
+
+    weeks: List[List[date]] = []
+    for day in days:
+        if weeks and weeks[-1][0].isocalendar()[:2] == day.isocalendar()[:2]:
+            weeks[-1].append(day)
+        else:
+            weeks.append([day])
+    return weeks
@@ -0,0 +1,11 @@
+"""URL helpers shared by the data modules and the fetchers, free of HTTP dependencies."""
+
+from __future__ import annotations
+
+from urllib.parse import urlsplit
+
+
+def host_of(url: str) -> str:
+    """Return the lower-cased host name for ``url`` (empty when it has none)."""
+
+    return (urlsplit(url).hostname or "").lower()
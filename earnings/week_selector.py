@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import threading
 from datetime import date, datetime, timedelta
-from typing import Iterable, List
+from typing import Dict, Iterable, List, Optional, Tuple
 
 try:
     from zoneinfo import ZoneInfo  # Python 3.9+
@@ -66,6 +67,18 @@ def iter_weeks(
         current_week += timedelta(days=7)
 
 
+def build_week_option(start: date) -> dict:
+    """Return the option dictionary for the Monday-to-Friday week starting ``start``."""
+
+    end = start + timedelta(days=4)
+    return {
+        "id": start.isoformat(),
+        "start_date": start.isoformat(),
+        "end_date": end.isoformat(),
+        "label": f"Week of {_format_label(start)} to {_format_label(end)}",
+    }
+
+
 def get_week_options(
     *,
     weeks_ahead: int = 12,
@@ -76,14 +89,42 @@ def get_week_options(
     options: List[dict] = []
     # No longer using fixed weeks_back, deriving from 2026-01-01
     for start in iter_weeks(weeks_ahead=weeks_ahead, reference=reference):
-        end = start + timedelta(days=4)
-        options.append(
-            {
-                "id": start.isoformat(),
-                "start_date": start.isoformat(),
-                "end_date": end.isoformat(),
-                "label": f"Week of {_format_label(start)} to {_format_label(end)}",
-            }
-        )
+        options.append(build_week_option(start))
     options.sort(key=lambda opt: opt["start_date"])
     return options
+
+
+class WeekCalendar:
+    """The week options for one calendar day, indexed by week id.
+
+    Options and the dictionaries inside them are shared between callers and
+    must not be modified.
+    """
+
+    def __init__(self, *, weeks_ahead: int, reference: date) -> None:
+        self.weeks_ahead = weeks_ahead
+        self.reference = reference
+        self.options: List[dict] = get_week_options(weeks_ahead=weeks_ahead, reference=reference)
+        self._by_id: Dict[str, dict] = {option["id"]: option for option in self.options}
+
+    def get(self, week_id: str) -> Optional[dict]:
+        return self._by_id.get(week_id)
+
+
+_calendar_lock = threading.Lock()
+_calendars: Dict[int, Tuple[date, WeekCalendar]] = {}
+
+
+def get_week_calendar(*, weeks_ahead: int = 12) -> WeekCalendar:
+    """Return the week calendar for today (US/Eastern), rebuilt when the date rolls over."""
+
+    today = datetime.now(tz=_EASTERN).date()
+    cached = _calendars.get(weeks_ahead)
+    if cached is not None and cached[0] == today:
+        return cached[1]
+    with _calendar_lock:
+        cached = _calendars.get(weeks_ahead)
+        if cached is None or cached[0] != today:
+            cached = (today, WeekCalendar(weeks_ahead=weeks_ahead, reference=today))
+            _calendars[weeks_ahead] = cached
+        return cached[1]
@@ -4,6 +4,7 @@
   const sectorSelect = document.getElementById('sector-select');
   const previewBtn = document.getElementById('preview-btn');
   const downloadBtn = document.getElementById('download-btn');
+  const downloadXlsxBtn = document.getElementById('download-xlsx-btn');
   const statusEl = document.getElementById('status');
   const previewSection = document.getElementById('preview');
   const missingSection = document.getElementById('missing');
@@ -33,6 +34,7 @@
   let lastPreview = null;
   let searchIndexPromise = null;
   let searchIndex = null;
+  const bundleCache = new Map();
   let suggestionItems = [];
   let activeSuggestionIndex = -1;
 
@@ -520,7 +522,24 @@
     if (!response.ok) {
       throw new Error(`Request failed (${response.status})`);
     }
-    return response.json();
+    return expandColumnar(await response.json());
+  }
+
+  // Payloads built with --columnar list field names once and one value array per record.
+  function expandColumnar(data) {
+    if (!data || data.layout !== 'columnar' || !data.records || !Array.isArray(data.records.fields)) {
+      return data;
+    }
+    const { fields, rows } = data.records;
+    const records = rows.map((row) => {
+      const record = {};
+      fields.forEach((field, index) => {
+        record[field] = row[index];
+      });
+      return record;
+    });
+    const { layout, ...rest } = data;
+    return { ...rest, records };
   }
 
   function normaliseSearchValue(value) {
@@ -549,6 +568,14 @@
     }
     const weeks = Array.isArray(window.APP_PRELOADED_WEEKS) ? window.APP_PRELOADED_WEEKS : [];
     searchIndexPromise = (async () => {
+      try {
+        const prebuilt = await fetchJSON('api/search-index.json');
+        if (prebuilt && Array.isArray(prebuilt.records)) {
+          return prebuilt.records;
+        }
+      } catch (error) {
+        // Not a static build (or an older one); fall back to the weekly files.
+      }
       const entries = [];
       await Promise.all(
         weeks.map(async (week) => {
@@ -649,7 +676,7 @@
         const desiredSector = entry.sector && entry.sector !== "All sectors" ? entry.sector : "All";
         const availableValues = Array.from(sectorSelect.options).map((opt) => opt.value);
         sectorSelect.value = availableValues.includes(desiredSector) ? desiredSector : "All";
-        downloadBtn.disabled = true;
+        setDownloadsDisabled(true);
         setStatus(`Loading ${entry.company} in the weekly preview...`, "loading");
         handlePreview();
         if (previewSection) {
@@ -971,6 +998,102 @@
     return dateObj.toLocaleDateString('en-US', { month: 'short', day: 'numeric' });
   }
 
+  async function mergeWeeklyFiles(weekRange, slug) {
+    const requests = weekRange.map(week => `api/preview/${week.id}/${slug}.json`);
+    // Fetch all, ignoring 404s/errors gracefully
+    const responses = await Promise.all(requests.map(url => fetchJSON(url).catch(e => null)));
+
+    const successful = responses.filter(r => r);
+    if (successful.length === 0) {
+      throw new Error("No data found for selected range.");
+    }
+
+    // Aggregate
+    let allRecords = [];
+    let missingPublic = new Set();
+    let irCompanies = new Set();
+    let fallbackCompanies = new Set();
+    let totalCount = 0;
+
+    successful.forEach(d => {
+      if (d.records) {
+        // Ensure sector name is available on the record for badge display
+        if (d.sector && d.sector !== 'All') {
+          d.records.forEach(r => {
+            if (!r.sector) r.sector = d.sector;
+          });
+        }
+        allRecords.push(...d.records);
+      }
+      if (d.missingPublic) d.missingPublic.forEach(m => missingPublic.add(m));
+      if (d.irCompanies) d.irCompanies.forEach(c => irCompanies.add(c));
+      if (d.fallbackCompanies) d.fallbackCompanies.forEach(c => fallbackCompanies.add(c));
+      totalCount += (d.count || 0);
+    });
+
+    // Sort records by date then ticker
+    allRecords.sort((a, b) => {
+      const dateA = a.date || '';
+      const dateB = b.date || '';
+      if (dateA !== dateB) return dateA.localeCompare(dateB);
+
+      const symA = a.symbol || '';
+      const symB = b.symbol || '';
+      return symA.localeCompare(symB);
+    });
+
+    return {
+      records: allRecords,
+      count: allRecords.length,
+      missingPublic: Array.from(missingPublic).sort(),
+      tickerCount: successful[0].tickerCount || 0, // Approx
+      generatedAt: successful[0].generatedAt,
+      irCompanies: Array.from(irCompanies).sort(),
+      fallbackCompanies: Array.from(fallbackCompanies).sort(),
+    };
+  }
+
+  function loadBundle(slug) {
+    if (!bundleCache.has(slug)) {
+      const promise = fetchJSON(`api/bundles/${slug}.json`).catch((error) => {
+        bundleCache.delete(slug);
+        throw error;
+      });
+      bundleCache.set(slug, promise);
+    }
+    return bundleCache.get(slug);
+  }
+
+  function sliceBundle(bundle, weekRange) {
+    const bundleWeeks = new Set(Array.isArray(bundle.weeks) ? bundle.weeks : []);
+    if (!weekRange.some((week) => bundleWeeks.has(week.id))) {
+      return null;
+    }
+    const startDate = weekRange[0].start_date;
+    const endDate = weekRange[weekRange.length - 1].end_date;
+    const records = (bundle.records || []).filter((r) => r.date >= startDate && r.date <= endDate);
+    const irCompanies = new Set();
+    const fallbackCompanies = new Set();
+    records.forEach((r) => {
+      // Ensure sector name is available on the record for badge display
+      if (!r.sector && bundle.sector) r.sector = bundle.sector;
+      if (r.source === 'investor_relations') {
+        irCompanies.add(r.company);
+      } else {
+        fallbackCompanies.add(r.company);
+      }
+    });
+    return {
+      records,
+      count: records.length,
+      missingPublic: bundle.missingPublic || [],
+      tickerCount: bundle.tickerCount || 0,
+      generatedAt: bundle.generatedAt,
+      irCompanies: Array.from(irCompanies).sort(),
+      fallbackCompanies: Array.from(fallbackCompanies).sort(),
+    };
+  }
+
   async function handlePreview() {
     const startWeek = startWeekSelect.value;
     const endWeek = endWeekSelect.value;
@@ -1003,7 +1126,7 @@
     const slug = toSectorSlug(payload.sector);
 
     setStatus('Fetching earnings...', 'loading');
-    downloadBtn.disabled = true;
+    setDownloadsDisabled(true);
 
     try {
       let data;
@@ -1013,64 +1136,29 @@
         data = await fetchJSON(url);
         // Ensure sectorSlug is set for badges
         data.sectorSlug = slug;
+      } else if (!window.STATIC_MODE) {
+        // The Flask app composes ranges server-side from its cached weeks.
+        data = await fetchJSON(`api/preview/${payload.startWeekId}...${payload.endWeekId}/${slug}.json`);
+        data.sectorSlug = slug;
       } else {
-        // Client-side aggregation
+        // Static site: slice the range bundle, or merge the weekly files client-side.
         const weekRange = getWeekRange(payload.startWeekId, payload.endWeekId);
         if (!weekRange.length) {
           throw new Error('Invalid week selection.');
         }
 
-        const requests = weekRange.map(week => `api/preview/${week.id}/${slug}.json`);
-        // Fetch all, ignoring 404s/errors gracefully
-        const responses = await Promise.all(requests.map(url => fetchJSON(url).catch(e => null)));
-
-        const successful = responses.filter(r => r);
-        if (successful.length === 0) {
-          throw new Error("No data found for selected range.");
+        let merged = null;
+        try {
+          merged = sliceBundle(await loadBundle(slug), weekRange);
+        } catch (error) {
+          console.warn('Range bundle unavailable, merging weekly files instead:', error);
+        }
+        if (!merged) {
+          merged = await mergeWeeklyFiles(weekRange, slug);
         }
-
-        // Aggregate
-        let allRecords = [];
-        let missingPublic = new Set();
-        let irCompanies = new Set();
-        let fallbackCompanies = new Set();
-        let totalCount = 0;
-
-        successful.forEach(d => {
-          if (d.records) {
-            // Ensure sector name is available on the record for badge display
-            if (d.sector && d.sector !== 'All') {
-              d.records.forEach(r => {
-                if (!r.sector) r.sector = d.sector;
-              });
-            }
-            allRecords.push(...d.records);
-          }
-          if (d.missingPublic) d.missingPublic.forEach(m => missingPublic.add(m));
-          if (d.irCompanies) d.irCompanies.forEach(c => irCompanies.add(c));
-          if (d.fallbackCompanies) d.fallbackCompanies.forEach(c => fallbackCompanies.add(c));
-          totalCount += (d.count || 0);
-        });
-
-        // Sort records by date then ticker
-        allRecords.sort((a, b) => {
-          const dateA = a.date || '';
-          const dateB = b.date || '';
-          if (dateA !== dateB) return dateA.localeCompare(dateB);
-
-          const symA = a.symbol || '';
-          const symB = b.symbol || '';
-          return symA.localeCompare(symB);
-        });
 
         data = {
-          records: allRecords,
-          count: allRecords.length,
-          missingPublic: Array.from(missingPublic).sort(),
-          tickerCount: successful[0].tickerCount || 0, // Approx
-          generatedAt: successful[0].generatedAt,
-          irCompanies: Array.from(irCompanies).sort(),
-          fallbackCompanies: Array.from(fallbackCompanies).sort(),
+          ...merged,
           week: {
             label: `Weeks of ${_formatLabel(weekRange[0].start_date)} to ${_formatLabel(weekRange[weekRange.length - 1].end_date)}`,
             id: `${payload.startWeekId}...${payload.endWeekId}`
@@ -1089,7 +1177,7 @@
       if (data.count > 0) {
         const weekLabel = data.week ? data.week.label : 'selected weeks';
         setStatus(`Found ${data.count} companies for ${weekLabel}.`, 'success');
-        downloadBtn.disabled = false;
+        setDownloadsDisabled(false);
       } else {
         const weekLabel = data.week ? data.week.label : 'selected weeks';
         setStatus(`No scheduled earnings for ${weekLabel}.`, 'info');
@@ -1107,27 +1195,45 @@
     }
   }
 
-  async function handleDownload() {
+  function setDownloadsDisabled(disabled) {
+    [downloadBtn, downloadXlsxBtn].forEach((button) => {
+      if (button) button.disabled = disabled;
+    });
+  }
+
+  async function handleDownload(format = 'csv') {
     if (!lastPayload || !lastPreview) {
       setStatus('Preview first.', 'error');
       return;
     }
 
-    downloadBtn.disabled = true;
+    setDownloadsDisabled(true);
     setStatus('Building spreadsheet...', 'loading');
 
     try {
       let url;
       let filename;
 
-      if (lastPreview.downloadPath) {
+      const staticPath = format === 'xlsx' ? lastPreview.xlsxDownloadPath : lastPreview.downloadPath;
+      if (staticPath) {
         // Single week static file
-        const downloadPath = lastPreview.downloadPath;
+        const downloadPath = staticPath;
         filename = downloadPath.split('/').pop();
         const response = await fetch(downloadPath, { cache: 'no-store' });
         if (!response.ok) throw new Error("Download failed");
         const blob = await response.blob();
         url = URL.createObjectURL(blob);
+      } else if (format === 'xlsx') {
+        // Workbooks are built by the Flask app; the static site only has per-week files.
+        const response = await fetch('download', {
+          method: 'POST',
+          headers: { 'Content-Type': 'application/json' },
+          body: JSON.stringify({ ...lastPayload, format: 'xlsx' }),
+        });
+        if (!response.ok) throw new Error('XLSX export is not available for this selection.');
+        const blob = await response.blob();
+        url = URL.createObjectURL(blob);
+        filename = `earnings_${toSectorSlug(lastPayload.sector)}_range.xlsx`;
       } else {
         // Generated client-side
         const csvContent = jsonToCSV(lastPreview.records);
@@ -1148,7 +1254,7 @@
     } catch (error) {
       setStatus(error.message, 'error');
     } finally {
-      downloadBtn.disabled = false;
+      setDownloadsDisabled(false);
     }
   }
 
@@ -1184,7 +1290,10 @@
   }
 
   previewBtn.addEventListener('click', handlePreview);
-  downloadBtn.addEventListener('click', handleDownload);
+  downloadBtn.addEventListener('click', () => handleDownload('csv'));
+  if (downloadXlsxBtn) {
+    downloadXlsxBtn.addEventListener('click', () => handleDownload('xlsx'));
+  }
 
   function syncWeekSelectors() {
     if (startWeekSelect.value > endWeekSelect.value) {
@@ -1194,13 +1303,13 @@
 
   startWeekSelect.addEventListener('change', () => {
     syncWeekSelectors();
-    downloadBtn.disabled = true;
+    setDownloadsDisabled(true);
     setStatus('Adjust selections and preview to refresh.', 'info');
   });
 
   [endWeekSelect, sectorSelect].forEach((select) =>
     select.addEventListener('change', () => {
-      downloadBtn.disabled = true;
+      setDownloadsDisabled(true);
       setStatus('Adjust selections and preview to refresh.', 'info');
     }),
   );
@@ -0,0 +1,81 @@
+import json
+
+import app
+from earnings import companies
+
+
+def test_company_data_edit_refreshes_cached_past_weeks(monkeypatch, tmp_path):
+    monkeypatch.setattr(companies, "_DATA_DIR", tmp_path)
+    monkeypatch.setattr(companies, "_DATA_PATH", tmp_path / "companies.json")
+    monkeypatch.setattr(companies, "_RELOAD_CHECK_INTERVAL", 0.0)
+    monkeypatch.setattr(companies, "_registry", None)
+    monkeypatch.setattr(app, "_cache_companies_digest", None)
+    monkeypatch.setattr(app, "get_persistent_cache", lambda: None)
+    app._cache.clear()
+    computed = []
+
+    async def fake_compute(sector, week):
+        tickers = sorted(companies.get_registry().ticker_to_name(sector))
+        computed.append(tickers)
+        return {"records": [{"symbol": ticker} for ticker in tickers], "missing_public": []}
+
+    monkeypatch.setattr(app, "_compute_week", fake_compute)
+    data_file = tmp_path / "companies_tmt.json"
+    data_file.write_text(json.dumps({"TMT": [{"name": "Apple", "ticker": "AAPL"}]}), encoding="utf-8")
+    past_week = {"id": "2026-01-05", "start_date": "2026-01-05", "end_date": "2026-01-09", "label": "Jan 5"}
+
+    try:
+        app._fetch_data("TMT", past_week)
+        app._fetch_data("TMT", past_week)
+        assert computed == [["AAPL"]]
+
+        data_file.write_text(
+            json.dumps({"TMT": [{"name": "Apple", "ticker": "AAPL"}, {"name": "Nvidia", "ticker": "NVDA"}]}),
+            encoding="utf-8",
+        )
+        payload = app._fetch_data("TMT", past_week)
+    finally:
+        app._cache.clear()
+
+    assert [record["symbol"] for record in payload["records"]] == ["AAPL", "NVDA"]
+    assert computed == [["AAPL"], ["AAPL", "NVDA"]]
+
+
+def test_past_weeks_are_cached_indefinitely_only_once_settled(monkeypatch):
+    unsettled = set()
+
+    class _Store:
+        def is_settled(self, source, day):
+            return day.isoformat() not in unsettled
+
+    monkeypatch.setattr(app, "get_persistent_cache", lambda: _Store())
+    thanksgiving_week = {"start_date": "2025-11-24", "end_date": "2025-11-28"}
+    assert app._cache_ttl(thanksgiving_week) is None
+
+    # The Nasdaq fetch for the Wednesday failed, so that day was skipped.
+    unsettled.add("2025-11-26")
+    assert app._cache_ttl(thanksgiving_week) == app._CACHE_TTL
+
+    monkeypatch.setattr(app, "get_persistent_cache", lambda: None)
+    assert app._cache_ttl({"start_date": "2025-11-24", "end_date": "2025-11-28"}) == app._CACHE_TTL
+
+
+def test_invalid_numeric_settings_fall_back_to_defaults(monkeypatch, caplog):
+    monkeypatch.setenv("EARNINGS_RESPONSE_CACHE_BYTES", "64MB")
+    assert app._env_number("EARNINGS_RESPONSE_CACHE_BYTES", 123) == 123
+    assert "Ignoring invalid EARNINGS_RESPONSE_CACHE_BYTES" in caplog.text
+
+    monkeypatch.setenv("EARNINGS_RESPONSE_CACHE_BYTES", " 2048 ")
+    assert app._env_number("EARNINGS_RESPONSE_CACHE_BYTES", 123) == 2048
+
+
+def test_refresh_interval_is_parsed_leniently_and_capped_at_the_cache_ttl(monkeypatch, caplog):
+    monkeypatch.setenv("EARNINGS_REFRESH_INTERVAL_SECONDS", "every minute")
+    assert app._refresh_interval_seconds() == 0.0
+
+    monkeypatch.setenv("EARNINGS_REFRESH_INTERVAL_SECONDS", "3600")
+    assert app._refresh_interval_seconds() == app._CACHE_TTL.total_seconds()
+    assert "exceeds" in caplog.text
+
+    monkeypatch.setenv("EARNINGS_REFRESH_INTERVAL_SECONDS", "120")
+    assert app._refresh_interval_seconds() == 120.0
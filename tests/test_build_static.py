@@ -0,0 +1,125 @@
+import gzip
+import json
+
+import build_static
+from earnings.records import EarningsRecord
+
+
+class _SettledCache:
+    def is_settled(self, source, day):
+        return True
+
+
+def _configure(monkeypatch, tmp_path, fetch_calls):
+    weeks = [
+        {"id": "2026-01-05", "start_date": "2026-01-05", "end_date": "2026-01-09", "label": "Week of Jan 5 to Jan 9"},
+        {"id": "2026-01-12", "start_date": "2026-01-12", "end_date": "2026-01-16", "label": "Week of Jan 12 to Jan 16"},
+    ]
+    sectors = {"Pharma": [{"name": "Merck", "ticker": "MRK"}], "TMT": [{"name": "Apple", "ticker": "AAPL"}]}
+
+    async def fake_fetch(*, start, end, sector_companies, ir_events):
+        fetch_calls.append(start)
+        return {
+            "Pharma": [EarningsRecord(company="Merck", symbol="MRK", date=start.isoformat(), bmo_amc="BMO", source="aggregator")],
+            "TMT": [],
+        }
+
+    class _Store:
+        def get_events(self, block=False):
+            return {}
+
+    monkeypatch.setattr(build_static, "DOCS_DIR", tmp_path / "docs")
+    monkeypatch.setattr(build_static, "MANIFEST_PATH", tmp_path / "manifest.json")
+    monkeypatch.setattr(build_static, "REPORT_PATH", tmp_path / "report.json")
+    monkeypatch.setattr(build_static, "get_week_options", lambda: weeks)
+    monkeypatch.setattr(build_static, "get_sectors", lambda: list(sectors))
+    monkeypatch.setattr(build_static, "get_sector_companies", lambda sector: sectors[sector])
+    monkeypatch.setattr(build_static, "get_ir_store", lambda: _Store())
+    monkeypatch.setattr(build_static, "get_persistent_cache", lambda: _SettledCache())
+    monkeypatch.setattr(build_static, "fetch_sector_earnings_async", fake_fetch)
+
+
+def test_incremental_build_skips_settled_weeks_and_keeps_files(monkeypatch, tmp_path):
+    fetch_calls = []
+    _configure(monkeypatch, tmp_path, fetch_calls)
+
+    build_static.build_static_site(incremental=True)
+    preview = tmp_path / "docs" / "api" / "preview" / "2026-01-05" / "pharma.json"
+    workbook = tmp_path / "docs" / "downloads" / "2026-01-05" / "earnings_pharma_2026-01-05.xlsx"
+    first_bytes = preview.read_bytes()
+    first_workbook = workbook.read_bytes()
+    assert len(fetch_calls) == 2
+
+    build_static.build_static_site(incremental=True)
+    assert len(fetch_calls) == 2
+    assert preview.read_bytes() == first_bytes
+    assert workbook.read_bytes() == first_workbook
+
+    # A tampered output forces that week to be rebuilt.
+    preview.write_text("{}", encoding="utf-8")
+    build_static.build_static_site(incremental=True)
+    assert len(fetch_calls) == 3
+    assert b'"MRK"' in preview.read_bytes()
+
+
+def test_build_writes_range_bundles_and_search_index(monkeypatch, tmp_path):
+    _configure(monkeypatch, tmp_path, [])
+
+    build_static.build_static_site()
+    api = tmp_path / "docs" / "api"
+    bundle = json.loads((api / "bundles" / "pharma.json").read_text(encoding="utf-8"))
+    assert bundle["weeks"] == ["2026-01-05", "2026-01-12"]
+    assert [record["date"] for record in bundle["records"]] == ["2026-01-05", "2026-01-12"]
+    assert bundle["count"] == 2
+
+    index = json.loads((api / "search-index.json").read_text(encoding="utf-8"))["records"]
+    assert {(entry["symbol"], entry["weekId"]) for entry in index} == {("MRK", "2026-01-05"), ("MRK", "2026-01-12")}
+    # Only the static site merges ranges client-side; the Flask app serves them.
+    assert "window.STATIC_MODE = true;" in (tmp_path / "docs" / "index.html").read_text(encoding="utf-8")
+
+
+def test_columnar_build_writes_compressed_siblings(monkeypatch, tmp_path):
+    _configure(monkeypatch, tmp_path, [])
+    monkeypatch.setattr(build_static, "OUTPUT", build_static.OutputOptions(columnar=True))
+
+    build_static.build_static_site()
+    preview = tmp_path / "docs" / "api" / "preview" / "2026-01-05" / "pharma.json"
+    payload = json.loads(preview.read_bytes())
+    assert payload["layout"] == "columnar"
+    assert build_static.read_json_payload(preview)["records"][0]["symbol"] == "MRK"
+    assert gzip.decompress((preview.parent / "pharma.json.gz").read_bytes()) == preview.read_bytes()
+
+
+def test_build_writes_timing_report(monkeypatch, tmp_path):
+    _configure(monkeypatch, tmp_path, [])
+    build_static.metrics.reset()
+
+    build_static.build_static_site()
+    report = json.loads((tmp_path / "report.json").read_text(encoding="utf-8"))
+    assert {"assets", "metadata", "investor_relations", "weeks", "bundles"} <= set(report["phases"])
+    counters = {(item["name"], item["labels"].get("result")): item["value"] for item in report["metrics"]["counters"]}
+    assert counters[("build_weeks_total", "built")] == 2
+
+
+def test_holiday_week_settles_once_its_trading_days_have(monkeypatch):
+    class _TradingDaysSettled:
+        def is_settled(self, source, day):
+            return day.isoformat() != "2025-11-27"
+
+    monkeypatch.setattr(build_static, "get_persistent_cache", lambda: _TradingDaysSettled())
+    thanksgiving_week = {"start_date": "2025-11-24", "end_date": "2025-11-28"}
+
+    assert build_static.week_is_settled(thanksgiving_week)
+
+
+def test_full_rebuild_leaves_unchanged_workbooks_alone(monkeypatch, tmp_path):
+    _configure(monkeypatch, tmp_path, [])
+
+    build_static.build_static_site()
+    workbook = tmp_path / "docs" / "downloads" / "2026-01-05" / "earnings_pharma_2026-01-05.xlsx"
+    first_bytes = workbook.read_bytes()
+    first_mtime = workbook.stat().st_mtime_ns
+
+    build_static.build_static_site()
+    assert workbook.read_bytes() == first_bytes
+    assert workbook.stat().st_mtime_ns == first_mtime
@@ -0,0 +1,26 @@
+import time
+from datetime import date, timedelta
+
+from earnings.cache import PersistentCache
+
+
+def test_past_day_payload_is_kept_permanently(tmp_path):
+    store = PersistentCache(tmp_path / "cache.sqlite3", future_ttl=timedelta(0))
+    past_day = date.today() - timedelta(days=3)
+    store.set_day("nasdaq", past_day, [{"symbol": "MRK"}])
+
+    assert store.get_day("nasdaq", past_day) == [{"symbol": "MRK"}]
+    assert store.get_day("yahoo", past_day) is None
+
+
+def test_upcoming_and_empty_days_expire(tmp_path):
+    store = PersistentCache(tmp_path / "cache.sqlite3", future_ttl=timedelta(seconds=0.05))
+    upcoming = date.today() + timedelta(days=2)
+    past_day = date.today() - timedelta(days=3)
+    store.set_day("nasdaq", upcoming, [{"symbol": "MRK"}])
+    store.set_day("yahoo", past_day, {})
+
+    assert store.get_day("nasdaq", upcoming) == [{"symbol": "MRK"}]
+    time.sleep(0.1)
+    assert store.get_day("nasdaq", upcoming) is None
+    assert store.get_day("yahoo", past_day) is None
@@ -0,0 +1,72 @@
+import json
+import os
+
+import pytest
+
+from earnings import companies
+
+
+@pytest.fixture
+def data_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(companies, "_DATA_DIR", tmp_path)
+    monkeypatch.setattr(companies, "_DATA_PATH", tmp_path / "companies.json")
+    monkeypatch.setattr(companies, "_RELOAD_CHECK_INTERVAL", 0.0)
+    monkeypatch.setattr(companies, "_registry", None)
+    return tmp_path
+
+
+def _write(path, payload, mtime):
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    os.utime(path, (mtime, mtime))
+
+
+def test_registry_indexes_companies(data_dir):
+    _write(
+        data_dir / "companies_pharma.json",
+        {
+            "Pharma": [
+                {"name": "Merck & Co.", "ticker": "mrk", "investorRelationsUrl": "https://IR.Merck.com/events"},
+                {"name": "Boehringer Ingelheim"},
+            ]
+        },
+        1_000,
+    )
+    _write(data_dir / "companies_tmt.json", {"TMT": [{"name": "Apple", "ticker": "AAPL"}]}, 1_000)
+
+    registry = companies.get_registry()
+    assert registry.sector_names == ["Pharma", "TMT"]
+    assert registry.all_ticker_to_name == {"MRK": "Merck & Co.", "AAPL": "Apple"}
+    assert registry.all_companies_without_ticker == ["Boehringer Ingelheim"]
+    assert registry.sector_for(ticker="aapl") == "TMT"
+    assert registry.sector_for(ticker="ZZZ", company="merck & co") == "Pharma"
+    assert [entry["name"] for entry in registry.companies_for_host("ir.merck.com")] == ["Merck & Co."]
+    assert companies.get_ticker_to_name("Pharma") == {"MRK": "Merck & Co."}
+
+
+def test_registry_reloads_on_change_and_keeps_last_good_data(data_dir):
+    path = data_dir / "companies_tmt.json"
+    _write(path, {"TMT": [{"name": "Apple", "ticker": "AAPL"}]}, 1_000)
+    first = companies.get_registry()
+    assert companies.get_registry() is first
+
+    _write(path, {"TMT": [{"name": "Apple", "ticker": "AAPL"}, {"name": "Nvidia", "ticker": "NVDA"}]}, 2_000)
+    assert companies.get_sector_tickers("TMT") == ["AAPL", "NVDA"]
+
+    path.write_text("{not json", encoding="utf-8")
+    os.utime(path, (3_000, 3_000))
+    assert companies.get_sector_tickers("TMT") == ["AAPL", "NVDA"]
+
+
+def test_registry_digest_follows_content_not_mtime(data_dir):
+    path = data_dir / "companies_tmt.json"
+    _write(path, {"TMT": [{"name": "Apple", "ticker": "AAPL"}]}, 1_000)
+    first = companies.get_registry()
+
+    # A fresh checkout touches every file without changing it.
+    _write(path, {"TMT": [{"name": "Apple", "ticker": "AAPL"}]}, 2_000)
+    touched = companies.get_registry()
+    assert touched is not first
+    assert touched.digest == first.digest
+
+    _write(path, {"TMT": [{"name": "Apple", "ticker": "AAPL"}, {"name": "Nvidia", "ticker": "NVDA"}]}, 3_000)
+    assert companies.get_registry().digest != first.digest
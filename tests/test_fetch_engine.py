@@ -0,0 +1,45 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from earnings.fetch_engine import FetchEngine, run_sync
+from earnings.urls import host_of
+
+
+def test_engine_enforces_per_host_limit():
+    engine = FetchEngine(max_workers=8, per_host_limit=2)
+    lock = threading.Lock()
+    active = {"now": 0, "peak": 0}
+
+    def work(value):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.02)
+        with lock:
+            active["now"] -= 1
+        return value * 2
+
+    async def main():
+        return await asyncio.gather(*(engine.call("api.nasdaq.com", work, i) for i in range(6)))
+
+    try:
+        assert run_sync(main()) == [0, 2, 4, 6, 8, 10]
+    finally:
+        engine.close()
+    assert active["peak"] == 2
+
+
+def test_engine_times_out_slow_calls():
+    engine = FetchEngine(max_workers=2, timeout=0.01)
+    try:
+        with pytest.raises(asyncio.TimeoutError):
+            run_sync(engine.call("example.com", time.sleep, 0.2))
+    finally:
+        engine.close()
+
+
+def test_host_of_normalises_case():
+    assert host_of("https://Finance.Yahoo.com/calendar/earnings?day=1") == "finance.yahoo.com"
@@ -35,3 +35,168 @@ def test_pick_event_selects_correct_earnings():
     assert len(candidates) == 1
     assert candidates[0][0] == date(2026, 2, 3)
 
+
+class _FakeIRResponse:
+    encoding = "utf-8"
+
+    def __init__(self, status_code, text="", headers=None, url="", chunk_size=64):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+        self.url = url
+        self.chunks_read = 0
+        self._chunk_size = chunk_size
+
+    def iter_content(self, chunk_size=1):
+        body = self.text.encode("utf-8")
+        for offset in range(0, len(body), self._chunk_size):
+            self.chunks_read += 1
+            yield body[offset:offset + self._chunk_size]
+
+    def close(self):
+        pass
+
+
+def test_fetch_one_reuses_stored_candidates_on_not_modified(tmp_path, monkeypatch):
+    from earnings import ir_scraper
+    from earnings.cache import PersistentCache
+
+    store = PersistentCache(tmp_path / "cache.sqlite3")
+    monkeypatch.setattr(ir_scraper, "get_persistent_cache", lambda: store)
+    entry = {"ticker": "MRK", "name": "Merck", "investorRelationsUrl": "https://ir.example.com/"}
+    sent_headers = []
+
+    class Session:
+        def __init__(self, response):
+            self.response = response
+
+        def get(self, url, headers=None, timeout=None, stream=False):
+            sent_headers.append(headers)
+            return self.response
+
+    page = "<html><body><p>February 03, 2026 Q4 2025 Earnings Call 8:00 am ET</p></body></html>"
+    first = ir_scraper._fetch_one(
+        Session(_FakeIRResponse(200, page, {"ETag": '"v1"'}, "https://ir.example.com/")),
+        entry,
+        date(2026, 1, 15),
+    )
+    assert first.date == date(2026, 2, 3)
+
+    def fail_parse(*args, **kwargs):
+        raise AssertionError("304 responses must not be parsed")
+
+    monkeypatch.setattr(ir_scraper, "_page_candidates", fail_parse)
+    second = ir_scraper._fetch_one(Session(_FakeIRResponse(304)), entry, date(2026, 1, 15))
+
+    assert sent_headers[1]["If-None-Match"] == '"v1"'
+    assert second.date == date(2026, 2, 3)
+    assert second.time_label == first.time_label
+
+
+def test_stream_page_candidates_skip_scripts():
+    from earnings.ir_scraper import _stream_page_candidates
+
+    filler = "<p>" + "news " * 400 + "</p>"
+    page = (
+        "<html><head><style>p { color: red; }</style>"
+        "<script>var launch = 'March 3, 2026 earnings';</script></head><body>"
+        "<p>Q1 2026 Earnings Call &amp; Webcast</p><p>April 28, 2026 8:30 am ET</p>"
+        + filler * 20
+        + "</body></html>"
+    )
+    response = _FakeIRResponse(200, page, chunk_size=256)
+
+    candidates = _stream_page_candidates(response)
+
+    assert [(day, time_label) for day, time_label, _ in candidates] == [(date(2026, 4, 28), "8:30 am ET")]
+    assert "Earnings Call & Webcast April 28, 2026 8:30 am ET" in candidates[0][2]
+
+
+def test_nearer_event_listed_after_the_first_chunk_is_picked():
+    from earnings import ir_scraper
+
+    filler = "<p>" + "news " * 400 + "</p>"
+    page = (
+        "<html><body><p>Q2 2027 earnings call July 28, 2027</p>"
+        + filler * 100
+        + "<p>Q4 2026 earnings call February 3, 2027 8:00 am ET</p></body></html>"
+    )
+    assert len(page) > 2 * ir_scraper._STREAM_CHUNK_SIZE
+    response = _FakeIRResponse(200, page, chunk_size=ir_scraper._STREAM_CHUNK_SIZE)
+
+    candidates = ir_scraper._stream_page_candidates(response)
+
+    assert _pick_event(candidates, date(2026, 10, 1)) == (date(2027, 2, 3), "8:00 am ET")
+
+
+def test_stream_page_candidates_match_a_whole_page_scan_across_chunk_boundaries():
+    from earnings.ir_scraper import _html_text, _stream_page_candidates
+
+    filler = "<p>" + "news " * 60 + "</p>"
+    page = "<html><body>" + "".join(
+        f"{filler}<p>Q{quarter} earnings call</p><p>{quarter}/2{quarter}/2025 at 8:30 am ET</p>"
+        for quarter in range(1, 5)
+    ) + "</body></html>"
+    expected = _extract_candidates(_html_text(page))
+
+    for chunk_size in (7, 64, 333):
+        response = _FakeIRResponse(200, page, chunk_size=chunk_size)
+        assert _stream_page_candidates(response) == expected
+    assert len(expected) == 4
+
+
+def test_extract_candidates_single_pass_keeps_layout_order_and_overlaps():
+    text = "Q1 earnings call 2026-04-28 or 04/27/2026 or April 29, 2026 1/2/2026-01-05 APRIL 30TH, 2026"
+    found = [candidate[0] for candidate in _extract_candidates(text)]
+
+    # Month names first, then slash dates, then ISO dates; overlapping layouts both count.
+    assert found == [
+        date(2026, 4, 29),
+        date(2026, 4, 27),
+        date(2026, 1, 2),
+        date(2026, 4, 28),
+        date(2026, 1, 5),
+    ]
+
+
+def test_process_extraction_matches_in_thread_extraction(monkeypatch):
+    from earnings import ir_scraper
+
+    monkeypatch.setattr(ir_scraper, "get_persistent_cache", lambda: None)
+    monkeypatch.setenv("EARNINGS_IR_WORKERS", "2")
+    monkeypatch.setattr(ir_scraper, "_pool", None)
+    entry = {"ticker": "MRK", "name": "Merck", "investorRelationsUrl": "https://ir.example.com/"}
+    small_page = (
+        "<html><head><script>var x = 'March 3, 2026 earnings';</script></head><body>"
+        "<p>Q4 2025 Earnings Call</p><p>February 03, 2026 8:00 am ET</p>"
+        "<p>Q1 2026 earnings webcast 2026-04-28</p></body></html>"
+    )
+    # The later event comes first and the nearer one only several chunks in.
+    large_page = (
+        "<html><body><p>Q2 2026 earnings call July 28, 2026</p>"
+        + ("<p>" + "news " * 400 + "</p>") * 100
+        + "<p>Q4 2025 earnings call 2/3/2026 8:00 am ET</p></body></html>"
+    )
+    assert len(large_page) > 2 * ir_scraper._STREAM_CHUNK_SIZE
+
+    class Session:
+        def __init__(self, page):
+            self.page = page
+
+        def get(self, url, headers=None, timeout=None, stream=False):
+            return _FakeIRResponse(200, self.page, url=url, chunk_size=ir_scraper._STREAM_CHUNK_SIZE)
+
+    events = {}
+    try:
+        for page in (small_page, large_page):
+            for mode in ("stream", "process"):
+                monkeypatch.setattr(ir_scraper, "_EXTRACTION_MODE", mode)
+                events[page, mode] = ir_scraper._fetch_one(Session(page), entry, date(2026, 1, 15))
+    finally:
+        if ir_scraper._pool is not None:
+            ir_scraper._pool.shutdown()
+
+    for page in (small_page, large_page):
+        assert events[page, "process"] == events[page, "stream"]
+        assert events[page, "process"].date == date(2026, 2, 3)
+        assert events[page, "process"].time_label == "8:00 am ET"
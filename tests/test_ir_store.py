@@ -0,0 +1,101 @@
+import asyncio
+import threading
+from datetime import date, timedelta
+
+from earnings.cache import PersistentCache
+from earnings.ir_scraper import InvestorRelationsEvent
+from earnings.ir_store import InvestorRelationsStore
+
+
+def _event(symbol, day):
+    return InvestorRelationsEvent(
+        symbol=symbol,
+        company=symbol.title(),
+        date=day,
+        time_label="8:00 am ET",
+        source_url=f"https://ir.example.com/{symbol.lower()}",
+    )
+
+
+def test_snapshot_is_shared_through_the_persistent_cache(tmp_path):
+    cache = PersistentCache(tmp_path / "cache.sqlite3")
+    calls = []
+
+    def scrape(companies):
+        calls.append(companies)
+        return {"MRK": _event("MRK", date(2026, 2, 3))}
+
+    first = InvestorRelationsStore(companies_loader=lambda: [], scraper=scrape, cache=cache)
+    assert first.get_events()["MRK"].date == date(2026, 2, 3)
+
+    second = InvestorRelationsStore(companies_loader=lambda: [], scraper=scrape, cache=cache)
+    assert second.get_events()["MRK"].time_label == "8:00 am ET"
+    assert len(calls) == 1
+
+
+def test_stale_snapshot_is_served_while_refreshing():
+    release = threading.Event()
+    responses = iter([
+        {"MRK": _event("MRK", date(2026, 2, 3))},
+        {"MRK": _event("MRK", date(2026, 5, 1))},
+    ])
+
+    def scrape(companies):
+        result = next(responses)
+        if result["MRK"].date.month == 5:
+            release.wait(1)
+        return result
+
+    store = InvestorRelationsStore(ttl=timedelta(0), companies_loader=lambda: [], scraper=scrape)
+    assert store.get_events()["MRK"].date == date(2026, 2, 3)
+
+    # Expired: the old snapshot comes back immediately while the refresh is blocked.
+    assert store.get_events()["MRK"].date == date(2026, 2, 3)
+    release.set()
+    store._refresh_thread.join()
+    assert store._events["MRK"].date == date(2026, 5, 1)
+
+
+def test_company_data_reload_invalidates_the_snapshot(tmp_path):
+    cache = PersistentCache(tmp_path / "cache.sqlite3")
+    version = ["v1"]
+    calls = []
+
+    def scrape(companies):
+        calls.append(version[0])
+        return {"MRK": _event("MRK", date(2026, 2, 3))}
+
+    def make_store():
+        return InvestorRelationsStore(
+            companies_loader=lambda: [], scraper=scrape, version_loader=lambda: version[0], cache=cache
+        )
+
+    store = make_store()
+    store.get_events(block=True)
+    store.get_events(block=True)
+    assert calls == ["v1"]
+
+    version[0] = "v2"
+    store.get_events(block=True)
+    assert calls == ["v1", "v2"]
+    # Other processes see that the persisted snapshot matches the reloaded data.
+    make_store().get_events(block=True)
+    assert calls == ["v1", "v2"]
+
+
+def test_async_first_load_waits_off_the_event_loop():
+    release = threading.Event()
+
+    def scrape(companies):
+        assert release.wait(1), "the event loop was blocked while the scrape ran"
+        return {"MRK": _event("MRK", date(2026, 2, 3))}
+
+    store = InvestorRelationsStore(companies_loader=lambda: [], scraper=scrape, version_loader=lambda: "v1")
+
+    async def main():
+        pending = asyncio.ensure_future(store.get_events_async())
+        await asyncio.sleep(0.01)
+        release.set()
+        return await pending
+
+    assert asyncio.run(main())["MRK"].date == date(2026, 2, 3)
@@ -0,0 +1,21 @@
+from earnings.metrics import Metrics
+
+
+def test_counters_and_histograms_render_as_json_and_prometheus():
+    metrics = Metrics(buckets=(0.1, 1.0))
+    metrics.inc("upstream_requests_total", source="nasdaq", outcome=200)
+    metrics.inc("upstream_requests_total", source="nasdaq", outcome=200)
+    metrics.observe("upstream_request_seconds", 0.05, source="nasdaq")
+    metrics.observe("upstream_request_seconds", 2.0, source="nasdaq")
+
+    snapshot = metrics.snapshot()
+    assert snapshot["counters"] == [
+        {"name": "upstream_requests_total", "labels": {"outcome": "200", "source": "nasdaq"}, "value": 2}
+    ]
+    histogram = snapshot["histograms"][0]
+    assert histogram["count"] == 2
+    assert histogram["buckets"] == {"0.1": 1, "1.0": 1, "+Inf": 2}
+
+    text = metrics.render_prometheus()
+    assert 'earnings_upstream_requests_total{outcome="200",source="nasdaq"} 2' in text
+    assert 'earnings_upstream_request_seconds_bucket{source="nasdaq",le="+Inf"} 2' in text
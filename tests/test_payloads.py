@@ -0,0 +1,36 @@
+import gzip
+
+from earnings.payloads import (
+    columnar_payload,
+    compress,
+    encode_json,
+    from_columnar,
+    negotiate_encoding,
+    to_columnar,
+)
+
+
+def test_columnar_round_trip_lists_each_field_once():
+    records = [
+        {"company": "Merck", "symbol": "MRK", "bmo_amc": "BMO"},
+        {"company": "Apple", "symbol": "AAPL", "bmo_amc": None},
+    ]
+    table = to_columnar(records)
+    assert table["fields"] == ["company", "symbol", "bmo_amc"]
+    assert table["rows"] == [["Merck", "MRK", "BMO"], ["Apple", "AAPL", None]]
+    assert from_columnar(table) == records
+
+    payload = columnar_payload({"records": records, "count": 2})
+    assert payload["layout"] == "columnar"
+    assert payload["count"] == 2
+
+
+def test_compression_is_deterministic_and_negotiated():
+    body = encode_json({"records": [{"symbol": "MRK"}] * 200})
+    assert b" " not in body
+    assert compress(body, "gzip") == compress(body, "gzip")
+    assert gzip.decompress(compress(body, "gzip")) == body
+
+    assert negotiate_encoding("gzip, deflate", size=len(body)) == "gzip"
+    assert negotiate_encoding("gzip;q=0, identity", size=len(body)) is None
+    assert negotiate_encoding("gzip", min_size=len(body) + 1, size=len(body)) is None
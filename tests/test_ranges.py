@@ -0,0 +1,39 @@
+from datetime import date
+
+from earnings.ranges import merge_week_payloads, split_into_weeks
+
+
+def test_split_into_weeks_returns_canonical_weeks():
+    weeks = split_into_weeks(date(2026, 1, 7), date(2026, 1, 23))
+
+    assert [week["id"] for week in weeks] == ["2026-01-05", "2026-01-12", "2026-01-19"]
+    assert weeks[-1]["end_date"] == "2026-01-23"
+
+
+def test_merge_week_payloads_orders_records_and_unions_metadata():
+    first = {
+        "records": [
+            {"date": "2026-01-05", "company": "Apple"},
+            {"date": "2026-01-06", "company": "Merck"},
+        ],
+        "missing_public": ["Private Co"],
+        "ticker_count": 2,
+        "generated_at": "2026-01-20T10:00:00Z",
+        "ir_companies": ["Merck"],
+        "fallback_companies": ["Apple"],
+    }
+    second = {
+        "records": [{"date": "2026-01-12", "company": "Abbott"}],
+        "missing_public": ["Private Co"],
+        "ticker_count": 2,
+        "generated_at": "2026-01-19T09:00:00Z",
+        "ir_companies": [],
+        "fallback_companies": ["Abbott"],
+    }
+
+    merged = merge_week_payloads([second, first])
+
+    assert [record["company"] for record in merged["records"]] == ["Apple", "Merck", "Abbott"]
+    assert merged["missing_public"] == ["Private Co"]
+    assert merged["fallback_companies"] == ["Abbott", "Apple"]
+    assert merged["generated_at"] == "2026-01-19T09:00:00Z"
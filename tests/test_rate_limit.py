@@ -0,0 +1,142 @@
+import io
+from datetime import datetime, timezone
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from earnings.rate_limit import (
+    HostPolicy,
+    HostRateLimiter,
+    RateLimitedAdapter,
+    RetryBudgetExceeded,
+    TokenBucket,
+    parse_retry_after,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _response(status, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    response.raw = io.BytesIO(b"")
+    return response
+
+
+def test_token_bucket_queues_callers_beyond_the_burst():
+    clock = _Clock()
+    bucket = TokenBucket(rate=2.0, burst=2, clock=clock)
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+    clock.now += 2.0
+    assert bucket.reserve() == 0.0
+
+
+def test_penalise_blocks_the_host_and_halves_the_rate():
+    clock = _Clock()
+    bucket = TokenBucket(rate=4.0, burst=4, clock=clock)
+    bucket.penalise(3.0)
+    assert bucket.rate == 2.0
+    assert bucket.reserve() == 3.0
+    bucket.reward()
+    assert bucket.rate == 2.4
+
+
+def test_parse_retry_after_accepts_seconds_and_http_dates():
+    now = datetime(2026, 1, 5, 12, 0, tzinfo=timezone.utc)
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after("Mon, 05 Jan 2026 12:00:30 GMT", now=now) == 30.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_adapter_retries_throttled_responses_honouring_retry_after(monkeypatch):
+    replies = [_response(429, {"Retry-After": "2"}), _response(503), _response(200)]
+    sent = []
+
+    def fake_send(self, request, **kwargs):
+        sent.append(request.url)
+        return replies.pop(0)
+
+    monkeypatch.setattr(HTTPAdapter, "send", fake_send)
+    sleeps = []
+    limiter = HostRateLimiter(
+        default_policy=HostPolicy(rate=1000.0, burst=10, base_backoff=0.01),
+        policies={},
+        sleep=sleeps.append,
+    )
+    session = requests.Session()
+    session.mount("https://", RateLimitedAdapter(limiter))
+
+    response = session.get("https://api.nasdaq.com/api/calendar/earnings")
+
+    assert response.status_code == 200
+    assert len(sent) == 3
+    assert sleeps[0] >= 2.0
+    assert limiter.bucket("api.nasdaq.com").rate < 1000.0
+
+
+def test_adapter_gives_up_after_the_retry_budget(monkeypatch):
+    monkeypatch.setattr(HTTPAdapter, "send", lambda self, request, **kwargs: _response(403))
+    limiter = HostRateLimiter(
+        default_policy=HostPolicy(retries=2, retry_statuses=frozenset({403}), base_backoff=0.0),
+        policies={},
+        sleep=lambda seconds: None,
+    )
+    session = requests.Session()
+    session.mount("https://", RateLimitedAdapter(limiter))
+
+    assert session.get("https://finance.yahoo.com/calendar/earnings").status_code == 403
+
+
+def test_adapter_returns_the_response_when_retry_after_outlasts_the_deadline(monkeypatch):
+    clock = _Clock()
+    replies = [_response(503), _response(429, {"Retry-After": "20"})]
+
+    def fake_send(self, request, **kwargs):
+        clock.now += 5.0
+        return replies.pop(0)
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock.now += seconds
+
+    monkeypatch.setattr(HTTPAdapter, "send", fake_send)
+    sleeps = []
+    limiter = HostRateLimiter(
+        default_policy=HostPolicy(rate=1000.0, burst=10, base_backoff=1.0, max_backoff=1.0, deadline=25.0),
+        policies={},
+        sleep=fake_sleep,
+        clock=clock,
+    )
+    session = requests.Session()
+    session.mount("https://", RateLimitedAdapter(limiter))
+
+    response = session.get("https://api.nasdaq.com/api/calendar/earnings")
+
+    # 5s + backoff + 5s leaves under 15s of the budget, so the 20s Retry-After is not waited for.
+    assert response.status_code == 429
+    assert not replies
+    assert len(sleeps) == 1 and sleeps[0] <= 1.0
+    assert clock.now - 100.0 <= 25.0
+
+
+def test_adapter_refuses_to_wait_for_a_host_paused_beyond_the_deadline(monkeypatch):
+    sent = []
+    monkeypatch.setattr(HTTPAdapter, "send", lambda self, request, **kwargs: sent.append(request) or _response(200))
+    clock = _Clock()
+    limiter = HostRateLimiter(default_policy=HostPolicy(deadline=10.0), policies={}, sleep=lambda s: None, clock=clock)
+    limiter.bucket("ir.example.com").penalise(30.0)
+    session = requests.Session()
+    session.mount("https://", RateLimitedAdapter(limiter))
+
+    with pytest.raises(RetryBudgetExceeded):
+        session.get("https://ir.example.com/events")
+    assert not sent
@@ -0,0 +1,39 @@
+from earnings.records import EarningsRecord, NasdaqRow, records_to_dicts
+
+
+def test_to_dict_matches_the_published_record_shapes():
+    aggregator = EarningsRecord(
+        company="Merck", symbol="MRK", date="2026-02-03", bmo_amc="BMO", source="aggregator",
+        nasdaq_time_label="time-pre-market",
+    )
+    ir_event = EarningsRecord(
+        company="Apple", symbol="AAPL", date="2026-02-04", bmo_amc="AMC", source="investor_relations",
+        ir_time_label="4:30 pm ET", ir_source_url="https://investor.apple.com/",
+    )
+
+    assert list(aggregator.to_dict()) == [
+        "company", "symbol", "date", "bmo_amc", "nasdaq_time_label", "yahoo_time_label", "source",
+    ]
+    assert list(ir_event.to_dict()) == [
+        "company", "symbol", "date", "bmo_amc", "nasdaq_time_label", "yahoo_time_label",
+        "ir_time_label", "ir_source_url", "source",
+    ]
+    assert aggregator.with_sector("Pharma").to_dict()["sector"] == "Pharma"
+    assert aggregator.sector is None
+
+
+def test_records_read_like_their_dicts():
+    record = EarningsRecord(company="Merck", symbol="MRK", date="2026-02-03", bmo_amc="BMO", source="aggregator")
+
+    assert record["symbol"] == "MRK"
+    assert record.get("sector", "n/a") == "n/a"
+    assert record.get("coverage", "") == ""
+    assert records_to_dicts([record, {"symbol": "X"}]) == [record.to_dict(), {"symbol": "X"}]
+
+
+def test_nasdaq_rows_round_trip_through_json_arrays_and_legacy_objects():
+    row = NasdaqRow(symbol="MRK", company="Merck", time="time-pre-market", eps_forecast="$1.10")
+
+    assert NasdaqRow.from_json(list(row)) == row
+    assert NasdaqRow.from_json({"symbol": "MRK", "company": "Merck", "time": "time-pre-market", "eps_forecast": "$1.10"}) == row
+    assert NasdaqRow.from_json({"company": "No symbol"}) is None
@@ -0,0 +1,56 @@
+import logging
+import threading
+from datetime import timedelta
+
+from earnings.refresh_scheduler import RefreshScheduler
+
+
+def test_scheduler_refreshes_targets_and_triggered_keys():
+    batches = []
+    scheduled = threading.Event()
+    triggered = threading.Event()
+
+    def refresh(keys):
+        batches.append(list(keys))
+        (triggered if "stale" in keys else scheduled).set()
+
+    scheduler = RefreshScheduler(interval=timedelta(hours=1), targets=lambda: ["a", "b"], refresh=refresh)
+    scheduler.start()
+    try:
+        scheduler.trigger("stale")
+        assert triggered.wait(2)
+        assert scheduled.wait(2)
+    finally:
+        scheduler.stop(timeout=2)
+
+    assert ["a", "b"] in batches
+    assert ["stale"] in batches
+    assert not scheduler.running
+
+
+def test_failed_refresh_is_contained(caplog):
+    calls = []
+    triggered = threading.Event()
+
+    def refresh(keys):
+        calls.append(list(keys))
+        if len(calls) == 1:
+            raise RuntimeError("upstream down")
+        if "b" in keys:
+            triggered.set()
+
+    scheduler = RefreshScheduler(interval=timedelta(hours=1), targets=lambda: ["a"], refresh=refresh)
+    with caplog.at_level(logging.ERROR, logger="earnings.refresh_scheduler"):
+        assert scheduler.run_once() is None
+    assert "Background refresh of 1 key(s) failed" in caplog.text
+    assert "upstream down" in caplog.text
+
+    # The failure does not stop later refreshes, scheduled or triggered.
+    scheduler.run_once()
+    assert calls == [["a"], ["a"]]
+    scheduler.start()
+    try:
+        scheduler.trigger("b")
+        assert triggered.wait(2)
+    finally:
+        scheduler.stop(timeout=2)
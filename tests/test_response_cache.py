@@ -0,0 +1,39 @@
+import time
+from datetime import timedelta
+
+from earnings.response_cache import ResponseCache, estimate_size
+
+
+def test_evicts_least_recently_used_entries_by_size():
+    payload = {"records": ["x" * 100]}
+    cache = ResponseCache(max_bytes=estimate_size(payload) * 2)
+    cache.set("a", payload, ttl=None)
+    cache.set("b", payload, ttl=None)
+    assert cache.get("a") == payload  # "b" is now least recently used
+
+    cache.set("c", payload, ttl=None)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == payload
+    assert cache.get("c") == payload
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["bytes"] <= stats["maxBytes"]
+    assert (stats["hits"], stats["misses"]) == (3, 1)
+
+
+def test_entries_expire_after_their_ttl():
+    cache = ResponseCache(max_bytes=10_000)
+    cache.set("current", {"records": []}, ttl=timedelta(seconds=0.05))
+    cache.set("past", {"records": []}, ttl=None)
+
+    time.sleep(0.1)
+
+    assert cache.get("current") is None
+    assert cache.get("past") == {"records": []}
+    # Expired entries remain as stale fallbacks until space is needed.
+    assert cache.get_stale("current") == {"records": []}
+    cache.max_bytes = estimate_size({"records": []}) * 2
+    cache.set("next", {"records": []}, ttl=None)
+    assert cache.get_stale("current") is None
+    assert cache.stats()["evictions"] == 0
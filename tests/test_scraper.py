@@ -0,0 +1,193 @@
+import json
+import threading
+import time
+from datetime import date
+
+import pytest
+
+from earnings import scraper
+from earnings.records import EarningsRecord
+
+
+class _FakeResponse:
+    status_code = 200
+
+    def __init__(self, payload):
+        self._payload = payload
+        self.content = json.dumps(payload).encode("utf-8")
+
+    def json(self):
+        return self._payload
+
+
+class _SlowNasdaqSession:
+    def __init__(self):
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def get(self, url, params=None, timeout=None, **kwargs):
+        with self._lock:
+            self.calls += 1
+        time.sleep(0.05)
+        return _FakeResponse({"data": {"rows": [{"symbol": "mrk", "name": "Merck", "time": "time-pre-market"}]}})
+
+
+@pytest.fixture(autouse=True)
+def _isolated_caches(monkeypatch):
+    monkeypatch.setattr(scraper, "get_persistent_cache", lambda: None)
+    monkeypatch.setattr(scraper, "_yahoo_range_supported", True)
+    scraper._nasdaq_cache.clear()
+    scraper._yahoo_cache.clear()
+    scraper._yahoo_failed_weeks.clear()
+    yield
+    scraper._nasdaq_cache.clear()
+    scraper._yahoo_cache.clear()
+    scraper._yahoo_failed_weeks.clear()
+
+
+def test_concurrent_nasdaq_misses_share_one_request():
+    session = _SlowNasdaqSession()
+    day = date(2026, 2, 3)
+    results = []
+
+    def worker():
+        results.append(scraper._fetch_nasdaq_day(session, day))
+
+    threads = [threading.Thread(target=worker) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert session.calls == 1
+    assert len(results) == 6
+    assert all(rows[0].symbol == "MRK" for rows in results)
+
+
+def test_single_flight_propagates_errors_to_waiters():
+    flight = scraper._SingleFlight()
+    started = threading.Event()
+    errors = []
+
+    def failing():
+        started.set()
+        time.sleep(0.05)
+        raise scraper.EarningsScrapeError("boom")
+
+    def follower():
+        started.wait()
+        try:
+            flight.do("key", lambda: "unused")
+        except scraper.EarningsScrapeError as exc:
+            errors.append(exc)
+
+    thread = threading.Thread(target=follower)
+    thread.start()
+    with pytest.raises(scraper.EarningsScrapeError):
+        flight.do("key", failing)
+    thread.join()
+
+    assert len(errors) == 1
+
+
+def test_fetch_sector_earnings_fetches_once_and_partitions(monkeypatch):
+    calls = []
+
+    async def fake_fetch(**kwargs):
+        calls.append(kwargs)
+        return [
+            EarningsRecord(company="Merck", symbol="MRK", date="2026-02-03", bmo_amc="BMO", source="aggregator"),
+            EarningsRecord(company="Apple", symbol="AAPL", date="2026-02-04", bmo_amc="AMC", source="aggregator"),
+        ]
+
+    monkeypatch.setattr(scraper, "fetch_weekly_earnings_async", fake_fetch)
+    partitions = scraper.fetch_sector_earnings(
+        start=date(2026, 2, 2),
+        end=date(2026, 2, 6),
+        sector_companies={
+            "Pharma": [{"name": "Merck", "ticker": "MRK"}, {"name": "Private Co", "ticker": None}],
+            "TMT": [{"name": "Apple", "ticker": "AAPL"}],
+        },
+        ir_events={},
+    )
+
+    assert len(calls) == 1
+    assert calls[0]["ticker_to_name"] == {"MRK": "Merck", "AAPL": "Apple"}
+    assert [record.symbol for record in partitions["Pharma"]] == ["MRK"]
+    assert [record.symbol for record in partitions["TMT"]] == ["AAPL"]
+
+
+_YAHOO_RANGE_PAGE = """<table><thead><tr><th>Symbol</th><th>Company</th><th>Event Name</th>
+<th>Earnings Date</th><th>Earnings Call Time</th></tr></thead><tbody>{rows}</tbody></table>"""
+
+
+class _CalendarSession:
+    """Nasdaq returns one listing per day; Yahoo only answers range queries."""
+
+    def __init__(self):
+        self.headers = {}
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def get(self, url, params=None, timeout=None, **kwargs):
+        with self._lock:
+            self.requests.append((url, dict(params or {})))
+        if "nasdaq" in url:
+            return _FakeResponse({"data": {"rows": [{"symbol": "MRK", "name": "Merck", "time": "time-not-supplied"}]}})
+        start, end = date.fromisoformat(params["from"]), date.fromisoformat(params["to"])
+        rows = "".join(
+            f"<tr><td>MRK</td><td>Merck</td><td>Q4</td><td>{day:%b} {day.day}, {day.year}</td><td>After Market Close</td></tr>"
+            for day in (date.fromordinal(ordinal) for ordinal in range(start.toordinal(), end.toordinal() + 1))
+        )
+        response = _FakeResponse({})
+        response.text = _YAHOO_RANGE_PAGE.format(rows=rows)
+        response.content = response.text.encode("utf-8")
+        return response
+
+
+def test_weekly_fetch_skips_holidays_and_fetches_yahoo_per_week():
+    session = _CalendarSession()
+    records = scraper.fetch_weekly_earnings(
+        start=date(2026, 11, 23),
+        end=date(2026, 11, 29),
+        ticker_to_name={"MRK": "Merck"},
+        ir_events={},
+        session=session,
+    )
+
+    nasdaq_days = sorted(params["date"] for url, params in session.requests if "nasdaq" in url)
+    yahoo_calls = [params for url, params in session.requests if "yahoo" in url]
+    assert nasdaq_days == ["2026-11-23", "2026-11-24", "2026-11-25", "2026-11-27"]
+    assert yahoo_calls == [{"from": "2026-11-23", "to": "2026-11-27", "offset": 0, "size": 100}]
+    assert [record.date for record in records] == nasdaq_days
+    assert all(record.bmo_amc == "AMC" for record in records)
+
+
+class _RangeDownSession:
+    """Yahoo range queries fail with a 503; single-day listings work."""
+
+    def __init__(self):
+        self.requests = []
+
+    def get(self, url, params=None, timeout=None, **kwargs):
+        self.requests.append(dict(params))
+        response = _FakeResponse({})
+        if "from" in params:
+            response.status_code = 503
+            return response
+        response.text = "<table><tbody><tr><td>MRK</td><td>Merck</td><td>Q4</td><td>Before Market Open</td></tr></tbody></table>"
+        response.content = response.text.encode("utf-8")
+        return response
+
+
+def test_failed_yahoo_range_is_not_retried_for_the_rest_of_the_week():
+    session = _RangeDownSession()
+    week = tuple(date(2026, 2, day) for day in range(2, 7))
+
+    lookups = [scraper._fetch_yahoo_day(session, day, {"MRK"}, week) for day in week]
+
+    assert [params for params in session.requests if "from" in params] == [
+        {"from": "2026-02-02", "to": "2026-02-06", "offset": 0, "size": 100}
+    ]
+    assert [params["day"] for params in session.requests if "day" in params] == [day.isoformat() for day in week]
+    assert lookups == [{"MRK": "BMO"}] * len(week)
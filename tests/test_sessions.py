@@ -0,0 +1,36 @@
+from earnings.fetch_engine import FetchEngine
+from earnings.rate_limit import RateLimitedAdapter
+from earnings.sessions import SessionManager
+
+
+def test_session_is_shared_until_closed():
+    manager = SessionManager(pool_size=8)
+    first = manager.session
+    assert manager.session is first
+    manager.close()
+    assert manager.session is not first
+
+
+def test_aggregator_hosts_get_dedicated_pools():
+    manager = SessionManager(pool_size=8, pool_hosts=16)
+    session = manager.session
+
+    nasdaq = session.get_adapter("https://api.nasdaq.com/api/calendar/earnings")
+    ir_site = session.get_adapter("https://investors.example.com/events")
+
+    assert isinstance(nasdaq, RateLimitedAdapter)
+    assert nasdaq is not ir_site
+    assert ir_site is session.get_adapter("https://ir.other.example/")
+    assert ir_site._pool_maxsize == 8
+    assert ir_site._pool_connections == 16
+
+
+def test_engines_share_the_managed_session():
+    manager = SessionManager()
+    engines = [FetchEngine(max_workers=2, sessions=manager) for _ in range(2)]
+    try:
+        assert engines[0].session is engines[1].session is manager.session
+    finally:
+        for engine in engines:
+            engine.close()
+        manager.close()
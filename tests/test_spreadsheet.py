@@ -0,0 +1,45 @@
+from earnings.spreadsheet import generate_csv_bytes, iter_csv_chunks
+
+
+def _records(count):
+    return [
+        {"date": f"2026-01-0{5 + index % 5}", "company": f"Company {index}", "bmo_amc": "time-pre-market"}
+        for index in range(count)
+    ]
+
+
+def test_streamed_chunks_match_the_buffered_export():
+    records = _records(2000)
+    chunks = list(iter_csv_chunks(records, chunk_size=4096))
+
+    assert len(chunks) > 1
+    assert chunks[0].startswith(b"\xef\xbb\xbfCompany,BMO/AMC,Time,Coverage,Reporter\r\n")
+    assert not any(chunk.startswith(b"\xef\xbb\xbf") for chunk in chunks[1:])
+    assert b"".join(chunks) == generate_csv_bytes(records).getvalue()
+
+
+def test_rows_are_grouped_under_day_headings():
+    text = b"".join(iter_csv_chunks(_records(2))).decode("utf-8-sig").splitlines()
+    assert text[1:] == [
+        '"Monday, January 5, 2026",,,,',
+        "Company 0,BMO,,,",
+        '"Tuesday, January 6, 2026",,,,',
+        "Company 1,BMO,,,",
+    ]
+
+
+def test_xlsx_export_merges_day_headings_and_freezes_header(tmp_path):
+    from openpyxl import load_workbook
+
+    from earnings.spreadsheet import write_xlsx
+
+    path = tmp_path / "export.xlsx"
+    write_xlsx(_records(3), str(path))
+    sheet = load_workbook(path).active
+
+    assert sheet.freeze_panes == "A2"
+    assert [cell.value for cell in sheet[1]] == ["Company", "BMO/AMC", "Time", "Coverage", "Reporter"]
+    assert {str(cell_range) for cell_range in sheet.merged_cells.ranges} == {"A2:E2", "A4:E4", "A6:E6"}
+    assert sheet["A2"].value == "Monday, January 5, 2026"
+    assert sheet["A3"].value == "Company 0"
+    assert sheet["B3"].value == "BMO"
@@ -0,0 +1,31 @@
+from datetime import date
+
+from earnings.trading_calendar import group_by_week, is_trading_day, nyse_holidays, trading_days
+
+
+def test_nyse_holidays_2026():
+    assert sorted(nyse_holidays(2026)) == [
+        date(2026, 1, 1),
+        date(2026, 1, 19),
+        date(2026, 2, 16),
+        date(2026, 4, 3),
+        date(2026, 5, 25),
+        date(2026, 6, 19),
+        date(2026, 7, 3),
+        date(2026, 9, 7),
+        date(2026, 11, 26),
+        date(2026, 12, 25),
+    ]
+
+
+def test_saturday_new_year_is_not_observed_in_the_previous_year():
+    assert date(2021, 12, 31) not in nyse_holidays(2021)
+    assert is_trading_day(date(2021, 12, 31))
+    assert date(2021, 6, 18) not in nyse_holidays(2021)
+
+
+def test_trading_days_skip_weekends_and_holidays():
+    days = trading_days(date(2026, 11, 23), date(2026, 12, 6))
+    assert date(2026, 11, 26) not in days
+    assert len(days) == 9
+    assert [len(week) for week in group_by_week(days)] == [4, 5]
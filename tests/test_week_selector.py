@@ -0,0 +1,28 @@
+from datetime import date
+
+from earnings import week_selector
+from earnings.companies import CompanyRegistry, sector_slug
+
+
+def test_week_calendar_indexes_options_by_id():
+    calendar = week_selector.WeekCalendar(weeks_ahead=2, reference=date(2026, 3, 4))
+    assert calendar.options[0]["id"] == "2025-12-29"
+    assert calendar.options[-1]["id"] == "2026-03-16"
+    assert calendar.get("2026-03-02")["label"] == "Week of Mar 2 to Mar 6"
+    assert calendar.get("2026-03-03") is None
+
+
+def test_week_calendar_is_rebuilt_when_the_date_rolls_over(monkeypatch):
+    stale = week_selector.WeekCalendar(weeks_ahead=1, reference=date(2026, 1, 5))
+    monkeypatch.setattr(week_selector, "_calendars", {1: (date(2026, 1, 5), stale)})
+
+    current = week_selector.get_week_calendar(weeks_ahead=1)
+    assert current is not stale
+    assert week_selector.get_week_calendar(weeks_ahead=1) is current
+
+
+def test_registry_resolves_sector_slugs():
+    registry = CompanyRegistry({"Consumer Goods": [], "TMT": []})
+    assert sector_slug("Consumer Goods") == "consumer-goods"
+    assert registry.sector_for_slug("consumer-goods") == "Consumer Goods"
+    assert registry.sector_for_slug("unknown") is None